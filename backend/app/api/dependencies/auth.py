@@ -1,20 +1,25 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.api.dependencies.repositories import get_repositories
 from app.core.security import decode_token
+from app.core.token_store import is_session_revoked
 from app.models.user import User
+from app.repositories.base import Repositories
 
 security = HTTPBearer()
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    repositories: Repositories = Depends(get_repositories)
 ) -> User:
     """
     Dependency to get current authenticated user.
 
     Args:
         credentials: JWT token from Authorization header
+        repositories: Where the user is loaded from
 
     Returns:
         User: Current authenticated user
@@ -39,6 +44,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Logged-out sessions; a Bloom filter answers for almost every token
+    sid = payload.get("sid")
+    if sid and await is_session_revoked(sid):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     user_id: str = payload.get("sub")
     if user_id is None:
         raise HTTPException(
@@ -47,7 +61,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await User.get(user_id)
+    user = await repositories.users.get(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,3 +98,19 @@ async def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+
+async def access_token_subject(token: str) -> Optional[str]:
+    """
+    User id of a valid, unrevoked access token, without loading the user.
+
+    For checks that run before (or instead of) the route's authentication;
+    None means the regular dependencies will reject the request.
+    """
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "access":
+        return None
+    sid = payload.get("sid")
+    if sid and await is_session_revoked(sid):
+        return None
+    return payload.get("sub")
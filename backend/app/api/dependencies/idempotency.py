@@ -0,0 +1,164 @@
+"""
+Idempotency-Key support for create and move routes.
+
+A client that retries a request with the same `Idempotency-Key` header gets
+the original response back instead of a second card, list or board:
+
+    idempotency:<user id>:<route>:<key> -> {"fingerprint": ...}                 while running
+                                           {"fingerprint": ..., "status": ...,
+                                            "content_type": ..., "body": ...}   once it succeeded
+
+The dependency claims the key before the route runs; IdempotencyMiddleware
+stores the response once it is sent, or releases the claim when the request
+failed so it can be retried. Only the token is checked before a replay, so
+a retried request costs one Redis round trip and no MongoDB query.
+"""
+import hashlib
+import json
+import logging
+from typing import Tuple
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import RedisError
+from app.api.dependencies.auth import access_token_subject, security
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.utils.media_types import JSON_TYPE, is_msgpack, msgpack_to_json
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY = "idempotency:{}:{}:{}"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Scope entry through which the dependency hands its claim to the middleware
+SCOPE_KEY = "idempotency"
+
+# KEYS[1] = idempotency key; ARGV = claim, claim TTL in seconds
+# Returns the stored entry, or nothing when the key was free and is now claimed
+CLAIM_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if stored then
+    return stored
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', tonumber(ARGV[2]))
+return false
+"""
+
+claim_key = redis_client.register_script(CLAIM_SCRIPT)
+
+
+class IdempotentReplay(Exception):
+    """Raised to answer a retried request with its stored response."""
+
+    def __init__(self, entry: dict):
+        self.entry = entry
+
+
+async def idempotent_replay_handler(request: Request, exc: IdempotentReplay) -> Response:
+    entry = exc.entry
+    return Response(
+        content=entry["body"],
+        status_code=entry["status"],
+        media_type=entry["content_type"],
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+async def fingerprint(request: Request) -> str:
+    """Hash of what makes two requests "the same" request."""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+def idempotent(route: str):
+    """
+    Dependency making a route safe to retry with an `Idempotency-Key` header.
+
+    List it before the route's other dependencies so a replay skips them.
+    Requests without the header run as usual.
+
+    Args:
+        route: Name of the route; keys are scoped per user and route
+
+    Raises:
+        IdempotentReplay: The key already holds this request's response
+        HTTPException: 400 for a malformed key, 409 while the first request
+            with the key is still running, 422 when the key was used for a
+            different request
+    """
+
+    async def dependency(
+        request: Request,
+        credentials: HTTPAuthorizationCredentials = Depends(security)
+    ):
+        key = request.headers.get("idempotency-key")
+        if key is None or not settings.IDEMPOTENCY_ENABLED:
+            return
+        if not 0 < len(key) <= MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters"
+            )
+
+        user_id = await access_token_subject(credentials.credentials)
+        if user_id is None:
+            return  # Authentication rejects the request
+
+        redis_key = IDEMPOTENCY_KEY.format(user_id, route, key)
+        request_fingerprint = await fingerprint(request)
+        try:
+            stored = await claim_key(
+                keys=[redis_key],
+                args=[json.dumps({"fingerprint": request_fingerprint}), settings.IDEMPOTENCY_LOCK_SECONDS],
+            )
+        except RedisError as exc:
+            # Fail open: without Redis the request simply is not deduplicated
+            logger.warning("Idempotency store unavailable for %s: %s", route, exc)
+            return
+
+        if stored is None:
+            request.scope[SCOPE_KEY] = (redis_key, request_fingerprint)
+            return
+
+        entry = json.loads(stored)
+        if entry["fingerprint"] != request_fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request"
+            )
+        if "status" not in entry:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        raise IdempotentReplay(entry)
+
+    return dependency
+
+
+async def complete(claim: Tuple[str, str], status_code: int, content_type: str, body: bytes) -> None:
+    """Store a successful response under its key, or release a failed request's claim."""
+    redis_key, request_fingerprint = claim
+    try:
+        if 200 <= status_code < 300:
+            if is_msgpack(content_type):
+                # Stored as JSON so the replay suits clients of either type
+                body, content_type = msgpack_to_json(body), JSON_TYPE
+            entry = {
+                "fingerprint": request_fingerprint,
+                "status": status_code,
+                "content_type": content_type,
+                "body": body.decode(),
+            }
+            await redis_client.set(redis_key, json.dumps(entry), ex=settings.IDEMPOTENCY_TTL_SECONDS)
+        else:
+            await redis_client.delete(redis_key)
+    except RedisError as exc:
+        logger.warning("Idempotency store unavailable: %s", exc)
@@ -0,0 +1,182 @@
+import ipaddress
+import logging
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+from fastapi import Depends, HTTPException, Request, Response, status
+from redis.exceptions import RedisError
+from app.api.dependencies.auth import get_current_active_user
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Sliding-window log: one sorted-set member per accepted request, scored by
+# its timestamp in ms. Runs atomically inside Redis and uses the server
+# clock, so every API process sees the same window.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[3])
+    redis.call('PEXPIRE', key, window)
+    count = count + 1
+    allowed = 1
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local reset = window
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, count, reset}
+"""
+sliding_window = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: int
+
+    @property
+    def headers(self) -> dict:
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_seconds),
+        }
+
+
+@lru_cache(maxsize=None)
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    Parse a rate such as "10/minute".
+
+    Returns:
+        Tuple of (request limit, window length in seconds)
+    """
+    count, _, period = rate.partition("/")
+    try:
+        return int(count), WINDOW_SECONDS[period.strip().rstrip("s")]
+    except (ValueError, KeyError):
+        raise ValueError(f"Invalid rate limit {rate!r}, expected e.g. '10/minute'")
+
+
+@lru_cache(maxsize=None)
+def _proxy_networks(proxies: Tuple[str, ...]) -> Tuple[ipaddress._BaseNetwork, ...]:
+    return tuple(ipaddress.ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _proxy_networks(tuple(settings.TRUSTED_PROXIES)))
+
+
+def client_ip(request: Request) -> str:
+    """
+    Address of the client that sent a request.
+
+    Behind a trusted reverse proxy (TRUSTED_PROXIES) this is the last
+    X-Forwarded-For hop that is not itself a trusted proxy, so clients
+    cannot pick their own bucket by sending the header. Anything else is
+    keyed on the connection's peer address.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not is_trusted_proxy(peer):
+        return peer
+    forwarded = [
+        hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()
+    ]
+    for hop in reversed(forwarded):
+        if not is_trusted_proxy(hop):
+            return hop
+    return request.headers.get("x-real-ip") or peer
+
+
+async def hit(route: str, subject: str) -> RateLimitResult:
+    """Record one request of `subject` on `route` and check its limit."""
+    limit, window = parse_rate(settings.RATE_LIMITS[route])
+    allowed, count, reset_ms = await sliding_window(
+        keys=[f"ratelimit:{route}:{subject}"],
+        args=[window * 1000, limit, uuid.uuid4().hex],
+    )
+    return RateLimitResult(
+        allowed=bool(allowed),
+        limit=limit,
+        remaining=max(limit - int(count), 0),
+        reset_seconds=max(-(-int(reset_ms) // 1000), 1),
+    )
+
+
+async def enforce(route: str, subject: str, response: Response) -> None:
+    if not settings.RATE_LIMIT_ENABLED or route not in settings.RATE_LIMITS:
+        return
+
+    try:
+        result = await hit(route, subject)
+    except RedisError as exc:
+        # Fail open: losing the limiter must not take the API down with it.
+        logger.warning("Rate limiter unavailable for %s: %s", route, exc)
+        return
+
+    if not result.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={**result.headers, "Retry-After": str(result.reset_seconds)},
+        )
+    response.headers.update(result.headers)
+
+
+def rate_limit_by_user(route: str):
+    """
+    Dependency limiting authenticated requests per user.
+
+    Args:
+        route: Key into `settings.RATE_LIMITS`
+
+    Raises:
+        HTTPException: 429 when the user is over the route's limit
+    """
+
+    async def dependency(
+        response: Response,
+        current_user: User = Depends(get_current_active_user)
+    ):
+        await enforce(route, f"user:{current_user.id}", response)
+
+    return dependency
+
+
+def rate_limit_by_ip(route: str):
+    """
+    Dependency limiting anonymous requests per client IP.
+
+    Args:
+        route: Key into `settings.RATE_LIMITS`
+
+    Raises:
+        HTTPException: 429 when the client is over the route's limit
+    """
+
+    async def dependency(request: Request, response: Response):
+        await enforce(route, f"ip:{client_ip(request)}", response)
+
+    return dependency
@@ -0,0 +1,17 @@
+from app.repositories.base import Repositories
+from app.repositories.mongo import mongo_repositories
+
+repositories = mongo_repositories()
+
+
+async def get_repositories() -> Repositories:
+    """
+    Dependency giving routes the MongoDB repositories.
+
+    The in-memory ones are not a runtime option: counters, stats, the archive
+    and revision-checked updates still write to MongoDB directly, so an app
+    serving from memory would disagree with itself. Tests and benchmarks of
+    route logic swap them in with `app.dependency_overrides[get_repositories]`.
+    Async so FastAPI does not hand it to the thread pool.
+    """
+    return repositories
@@ -1,20 +1,53 @@
+import logging
+import uuid
+from typing import Tuple
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import RedisError
 from app.core.security import get_password_hash, verify_password, create_access_token, create_refresh_token, decode_token
+from app.core import token_store
 from app.models.user import User
+from app.repositories.base import Repositories
 from app.schemas.auth import UserRegister, UserLogin, TokenRefresh, TokenResponse, UserResponse, MessageResponse
-from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.auth import get_current_user, security
+from app.api.dependencies.repositories import get_repositories
+from app.api.dependencies.rate_limit import rate_limit_by_ip
+from app.utils.media_types import MessagePackRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+logger = logging.getLogger(__name__)
 
-@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister):
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=MessagePackRoute)
+
+def token_service_unavailable() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Token service unavailable, try again later")
+
+def issue_tokens(user_id: str, sid: str) -> Tuple[str, str, str]:
+    """Create an access/refresh pair for a session; returns (access, refresh, refresh jti)."""
+    refresh_jti = uuid.uuid4().hex
+    access_token = create_access_token(data={"sub": user_id, "sid": sid})
+    refresh_token = create_refresh_token(data={"sub": user_id, "sid": sid, "jti": refresh_jti})
+    return access_token, refresh_token, refresh_jti
+
+async def start_session(user_id: str) -> Tuple[str, str]:
+    """Start a new session; returns (access, refresh)."""
+    sid = uuid.uuid4().hex
+    access_token, refresh_token, refresh_jti = issue_tokens(user_id, sid)
+    try:
+        await token_store.start_session(sid, refresh_jti)
+    except RedisError as exc:
+        # Still let the user in; the refresh token just will not work
+        logger.warning("Could not store session %s: %s", sid, exc)
+    return access_token, refresh_token
+
+@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit_by_ip("register"))])
+async def register(user_data: UserRegister, repositories: Repositories = Depends(get_repositories)):
     # Check email exists
-    existing_user = await User.find_one(User.email == user_data.email)
+    existing_user = await repositories.users.get_by_email(user_data.email)
     if existing_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     
     # Check username exists
-    existing_username = await User.find_one(User.username == user_data.username)
+    existing_username = await repositories.users.get_by_username(user_data.username)
     if existing_username:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken")
     
@@ -25,11 +58,10 @@ async def register(user_data: UserRegister):
         hashed_password=get_password_hash(user_data.password),
         full_name=user_data.full_name
     )
-    await new_user.insert()
+    await repositories.users.insert(new_user)
     
     # Create tokens
-    access_token = create_access_token(data={"sub": str(new_user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(new_user.id)})
+    access_token, refresh_token = await start_session(str(new_user.id))
     
     user_response = UserResponse(
         id=str(new_user.id),
@@ -42,16 +74,15 @@ async def register(user_data: UserRegister):
     
     return TokenResponse(access_token=access_token, refresh_token=refresh_token, user=user_response)
 
-@router.post("/login", response_model=TokenResponse)
-async def login(credentials: UserLogin):
-    user = await User.find_one(User.email == credentials.email)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(rate_limit_by_ip("login"))])
+async def login(credentials: UserLogin, repositories: Repositories = Depends(get_repositories)):
+    user = await repositories.users.get_by_email(credentials.email)
     if not user or not verify_password(credentials.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token, refresh_token = await start_session(str(user.id))
     
     user_response = UserResponse(
         id=str(user.id),
@@ -64,19 +95,38 @@ async def login(credentials: UserLogin):
     
     return TokenResponse(access_token=access_token, refresh_token=refresh_token, user=user_response)
 
-@router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(token_data: TokenRefresh):
+@router.post("/refresh", response_model=TokenResponse, dependencies=[Depends(rate_limit_by_ip("refresh"))])
+async def refresh_token(token_data: TokenRefresh, repositories: Repositories = Depends(get_repositories)):
     payload = decode_token(token_data.refresh_token)
     if payload is None or payload.get("type") != "refresh":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
     
+    # Tokens issued before sessions existed cannot be rotated; log in again
+    sid, jti = payload.get("sid"), payload.get("jti")
+    if not sid or not jti:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    
     user_id = payload.get("sub")
-    user = await User.get(user_id)
+    user = await repositories.users.get(user_id)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    access_token = create_access_token(data={"sub": str(user.id)})
-    new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    # Each refresh token works once: swap it for the next one atomically
+    access_token, new_refresh_token, new_jti = issue_tokens(str(user.id), sid)
+    try:
+        outcome, issued = await token_store.rotate(sid, jti, new_jti, (access_token, new_refresh_token))
+        if outcome == token_store.RETRIED:
+            # Retried within the grace window: answer with the pair already issued
+            access_token, new_refresh_token = issued
+        elif outcome == token_store.REUSED:
+            # An already-used token came back: someone else has a copy
+            await token_store.revoke_session(sid)
+    except RedisError:
+        raise token_service_unavailable()
+    if outcome == token_store.REUSED:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reuse detected, session revoked")
+    if outcome not in (token_store.ROTATED, token_store.RETRIED):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
     
     user_response = UserResponse(
         id=str(user.id),
@@ -101,5 +151,15 @@ async def get_me(current_user: User = Depends(get_current_user)):
     )
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user)
+):
+    # End the session: its refresh token and access tokens stop working
+    sid = decode_token(credentials.credentials).get("sid")
+    if sid:
+        try:
+            await token_store.revoke_session(sid)
+        except RedisError:
+            raise token_service_unavailable()
     return MessageResponse(message="Successfully logged out")
@@ -1,19 +1,45 @@
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, status, Depends
+from bson import ObjectId
 from app.models.board import Board
 from app.models.user import User
-from app.schemas.board import BoardCreate, BoardUpdate, BoardResponse, BoardListResponse
+from app.schemas.activity import ActivityFeedResponse
+from app.schemas.board import (
+    BoardCreate, BoardUpdate, BoardDuplicate, BoardResponse, BoardListResponse,
+    BoardStatsResponse
+)
 from app.api.dependencies.auth import get_current_active_user
+from app.api.dependencies.idempotency import idempotent
+from app.api.dependencies.repositories import get_repositories
 from app.core.config import settings
-
-router = APIRouter(prefix="/boards", tags=["Boards"])
-
-
-@router.post("/", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
+from app.repositories.base import Repositories
+from app.services.activity import board_activity, delete_board_activity, record_activity
+from app.services.board_copy import duplicate_board
+from app.services.board_stats import delete_board_stats, get_board_stats
+from app.services.counters import count_board_cards, release_board_slot, reserve_board_slot
+from app.services.embedded_boards import delete_board_document
+from app.services.reminders import reminder_scheduler
+from app.services.write_behind import discard_board, settle_board
+from app.utils.dashboard_cache import dashboard_cache
+from app.utils.media_types import MessagePackRoute
+from app.utils.serializers import (
+    activity_to_response, board_stats_to_response, board_to_response
+)
+
+router = APIRouter(prefix="/boards", tags=["Boards"], route_class=MessagePackRoute)
+
+
+@router.post(
+    "/",
+    response_model=BoardResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(idempotent("create_board"))]
+)
 async def create_board(
     board_data: BoardCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Create a new board.
@@ -24,10 +50,8 @@ async def create_board(
 
     Maximum 7 boards per user.
     """
-    # Check board limit
-    user_boards_count = await Board.find(Board.owner_id == str(current_user.id)).count()
-
-    if user_boards_count >= settings.MAX_BOARDS_PER_USER:
+    # Check board limit and count the new board in one conditional update
+    if not await reserve_board_slot(str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Maximum {settings.MAX_BOARDS_PER_USER} boards per user"
@@ -41,42 +65,30 @@ async def create_board(
         owner_id=str(current_user.id)
     )
 
-    await new_board.insert()
+    try:
+        await repositories.boards.insert(new_board)
+    except Exception:
+        await release_board_slot(str(current_user.id))
+        raise
+    dashboard_cache.invalidate(str(current_user.id))
+    record_activity(str(new_board.id), str(current_user.id), "board.created", str(new_board.id))
 
-    return BoardResponse(
-        id=str(new_board.id),
-        title=new_board.title,
-        description=new_board.description,
-        background_color=new_board.background_color,
-        owner_id=new_board.owner_id,
-        created_at=new_board.created_at.isoformat(),
-        updated_at=new_board.updated_at.isoformat()
-    )
+    return board_to_response(new_board)
 
 
 @router.get("/", response_model=BoardListResponse)
 async def get_user_boards(
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Get all boards owned by current user.
 
     Returns list of boards with total count.
     """
-    boards = await Board.find(Board.owner_id == str(current_user.id)).to_list()
+    boards = await repositories.boards.for_owner(str(current_user.id))
 
-    board_responses = [
-        BoardResponse(
-            id=str(board.id),
-            title=board.title,
-            description=board.description,
-            background_color=board.background_color,
-            owner_id=board.owner_id,
-            created_at=board.created_at.isoformat(),
-            updated_at=board.updated_at.isoformat()
-        )
-        for board in boards
-    ]
+    board_responses = [board_to_response(board) for board in boards]
 
     return BoardListResponse(
         boards=board_responses,
@@ -87,14 +99,78 @@ async def get_user_boards(
 @router.get("/{board_id}", response_model=BoardResponse)
 async def get_board(
     board_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Get a single board by ID.
 
     User must be the owner of the board.
     """
-    board = await Board.get(board_id)
+    board = await repositories.boards.get(board_id)
+
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+
+    # Check ownership
+    if board.owner_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this board"
+        )
+
+    return board_to_response(board)
+
+
+@router.get("/{board_id}/stats", response_model=BoardStatsResponse)
+async def get_board_stats_route(
+    board_id: str,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Get card counts (per board and per list), overdue and due-today counts
+    and checklist completion of a board.
+
+    Read from a counters document kept up to date on every card change, so
+    the cost does not depend on the size of the board.
+    """
+    board = await repositories.boards.get(board_id)
+
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+
+    # Check ownership
+    if board.owner_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this board"
+        )
+
+    return board_stats_to_response(await get_board_stats(board_id))
+
+
+@router.get("/{board_id}/activity", response_model=ActivityFeedResponse)
+async def get_board_activity(
+    board_id: str,
+    before: Optional[str] = Query(None, description="Event ID from the previous page's `next_before`"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Get a board's activity log, newest first.
+
+    Pages are cut by event ID: pass the `next_before` of a page as `before`
+    to get the next one. `next_before` is null on the last page.
+    """
+    board = await repositories.boards.get(board_id)
 
     if not board:
         raise HTTPException(
@@ -109,30 +185,42 @@ async def get_board(
             detail="Not authorized to access this board"
         )
 
-    return BoardResponse(
-        id=str(board.id),
-        title=board.title,
-        description=board.description,
-        background_color=board.background_color,
-        owner_id=board.owner_id,
-        created_at=board.created_at.isoformat(),
-        updated_at=board.updated_at.isoformat()
+    if before is not None and not ObjectId.is_valid(before):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid before cursor"
+        )
+
+    events = await board_activity(board_id, before=before, limit=limit)
+    return ActivityFeedResponse(
+        events=[activity_to_response(event) for event in events],
+        next_before=str(events[-1]["_id"]) if len(events) == limit else None
     )
 
 
-@router.put("/{board_id}", response_model=BoardResponse)
-async def update_board(
+@router.post(
+    "/{board_id}/duplicate",
+    response_model=BoardResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def duplicate_board_route(
     board_id: str,
-    board_data: BoardUpdate,
-    current_user: User = Depends(get_current_active_user)
+    duplicate_data: BoardDuplicate,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
-    Update a board.
+    Copy a board with its lists and cards in one request.
 
-    User must be the owner of the board.
-    Only provided fields will be updated.
+    - **title**: Title of the copy (default: "Copy of <title>", or the
+      template's title when copying a template)
+    - **include_cards**: Copy cards too, not only lists (default: true)
+    - **as_template**: Save the copy as a template
+
+    Creating a board from a template is duplicating the template.
+    The copy counts towards the maximum of 7 boards per user.
     """
-    board = await Board.get(board_id)
+    board = await repositories.boards.get(board_id)
 
     if not board:
         raise HTTPException(
@@ -144,41 +232,110 @@ async def update_board(
     if board.owner_id != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this board"
+            detail="Not authorized to access this board"
         )
 
-    # Update fields
-    update_data = board_data.model_dump(exclude_unset=True)
+    if duplicate_data.include_cards:
+        # Copy cards where the board shows them
+        await settle_board(board_id)
+        if await count_board_cards(board_id) > settings.MAX_CARDS_PER_BOARD:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Maximum {settings.MAX_CARDS_PER_BOARD} cards per board"
+            )
+
+    if not await reserve_board_slot(str(current_user.id)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximum {settings.MAX_BOARDS_PER_USER} boards per user"
+        )
+
+    try:
+        new_board = await duplicate_board(
+            board,
+            owner_id=str(current_user.id),
+            title=duplicate_data.title,
+            include_cards=duplicate_data.include_cards,
+            as_template=duplicate_data.as_template
+        )
+    except Exception:
+        await release_board_slot(str(current_user.id))
+        raise
+    dashboard_cache.invalidate(str(current_user.id))
+    record_activity(
+        str(new_board.id), str(current_user.id), "board.duplicated", str(new_board.id),
+        source_board_id=board_id, include_cards=duplicate_data.include_cards
+    )
+    if duplicate_data.include_cards:
+        # Copied cards may be due soon
+        reminder_scheduler.reload()
 
-    for field, value in update_data.items():
-        setattr(board, field, value)
+    return board_to_response(new_board)
 
-    board.updated_at = datetime.utcnow()
 
-    await board.save()
+@router.put("/{board_id}", response_model=BoardResponse)
+async def update_board(
+    board_id: str,
+    board_data: BoardUpdate,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Update a board.
+
+    User must be the owner of the board.
+    Only provided fields are written, in a single conditional update.
+    Send the `revision` you last saw to get 409 instead of overwriting
+    someone else's edit.
+    """
+    update_data = board_data.model_dump(exclude_unset=True)
+    expected_revision = update_data.pop("revision", None)
 
-    return BoardResponse(
-        id=str(board.id),
-        title=board.title,
-        description=board.description,
-        background_color=board.background_color,
-        owner_id=board.owner_id,
-        created_at=board.created_at.isoformat(),
-        updated_at=board.updated_at.isoformat()
+    if not ObjectId.is_valid(board_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+    board = await repositories.boards.update(
+        board_id, str(current_user.id), {**update_data, "updated_at": datetime.utcnow()},
+        expected_revision
     )
 
+    if not board:
+        # Find out why the conditional update matched nothing
+        existing = await repositories.boards.get(board_id)
+        if not existing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found"
+            )
+        if existing.owner_id != str(current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to update this board"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Board was modified by someone else, reload and try again"
+        )
+    dashboard_cache.invalidate(str(current_user.id))
+    record_activity(board_id, str(current_user.id), "board.updated", board_id, fields=sorted(update_data))
+
+    return board_to_response(board)
+
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Delete a board.
 
     User must be the owner of the board.
     """
-    board = await Board.get(board_id)
+    board = await repositories.boards.get(board_id)
 
     if not board:
         raise HTTPException(
@@ -193,6 +350,12 @@ async def delete_board(
             detail="Not authorized to delete this board"
         )
 
-    await board.delete()
+    if await repositories.boards.delete(board):
+        await release_board_slot(board.owner_id)
+        await delete_board_stats(board_id)
+        await delete_board_document(board_id)
+        await delete_board_activity(board_id)
+        await discard_board(board_id)
+    dashboard_cache.invalidate(board.owner_id)
 
     return None
@@ -1,18 +1,44 @@
+import uuid
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status, Depends
-from app.models.card import Card
+from typing import List as ListType, Tuple
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from bson import ObjectId
+from app.models.archived_card import ArchivedCard
+from app.models.card import Card, ChecklistItem
 from app.models.list import List
-from app.models.board import Board
 from app.models.user import User
-from app.schemas.card import CardCreate, CardUpdate, CardReorder, CardMove, CardResponse
+from app.schemas.card import (
+    CardCreate, CardUpdate, CardReorder, CardMove, CardResponse, ArchivedCardResponse,
+    ChecklistItemSchema, ChecklistItemCreate, ChecklistItemUpdate, ChecklistReorder
+)
 from app.api.dependencies.auth import get_current_active_user
-
-router = APIRouter(prefix="/cards", tags=["Cards"])
-
-
-async def verify_list_ownership(list_id: str, user_id: str) -> List:
+from app.api.dependencies.idempotency import idempotent
+from app.api.dependencies.rate_limit import rate_limit_by_user
+from app.api.dependencies.repositories import get_repositories
+from app.core.config import settings
+from app.repositories.base import Orders, Repositories
+from app.services.activity import record_activity
+from app.services.archive import archive_cards, restore_card
+from app.services.board_stats import apply_stats_delta, card_delta
+from app.services.counters import release_card_slots, reserve_card_slots
+from app.services.embedded_boards import (
+    embed_card, move_embedded_card, remove_embedded_cards, reorder_embedded_cards,
+    replace_embedded_card, update_embedded_card
+)
+from app.services.reminders import reminder_scheduler
+from app.services.write_behind import (
+    pending_position, pending_positions, record_positions, settle_board, write_behind_enabled
+)
+from app.utils.board_versions import board_versions
+from app.utils.media_types import MessagePackRoute
+from app.utils.serializers import archived_card_to_response, card_to_response
+
+router = APIRouter(prefix="/cards", tags=["Cards"], route_class=MessagePackRoute)
+
+
+async def verify_list_ownership(list_id: str, user_id: str, repositories: Repositories) -> List:
     """Helper function to verify list ownership through board"""
-    lst = await List.get(list_id)
+    lst = await repositories.lists.get(list_id)
     if not lst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -20,7 +46,7 @@ async def verify_list_ownership(list_id: str, user_id: str) -> List:
         )
 
     # Verify board ownership
-    board = await Board.get(lst.board_id)
+    board = await repositories.boards.get(lst.board_id)
     if not board:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,11 +61,24 @@ async def verify_list_ownership(list_id: str, user_id: str) -> List:
     return lst
 
 
-@router.post("/{list_id}", response_model=CardResponse, status_code=status.HTTP_201_CREATED)
+def card_limit_reached() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Maximum {settings.MAX_CARDS_PER_BOARD} cards per board"
+    )
+
+
+@router.post(
+    "/{list_id}",
+    response_model=CardResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(idempotent("create_card")), Depends(rate_limit_by_user("create_card"))]
+)
 async def create_card(
     list_id: str,
     card_data: CardCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Create a new card in a list.
@@ -52,17 +91,20 @@ async def create_card(
     User must be the owner of the board containing this list.
     """
     # Verify list ownership
-    await verify_list_ownership(list_id, str(current_user.id))
+    lst = await verify_list_ownership(list_id, str(current_user.id), repositories)
+    await settle_board(lst.board_id)
 
     # Determine order
     if card_data.order is None:
         # Auto-increment: get max order + 1
-        existing_cards = await Card.find(Card.list_id == list_id).to_list()
-        max_order = max([c.order for c in existing_cards], default=-1)
-        order = max_order + 1
+        order = await repositories.cards.max_order(list_id) + 1
     else:
         order = card_data.order
 
+    # Check the board's card limit and count the new card in one update
+    if not await reserve_card_slots(lst.board_id):
+        raise card_limit_reached()
+
     # Create card
     new_card = Card(
         title=card_data.title,
@@ -74,100 +116,144 @@ async def create_card(
         list_id=list_id
     )
 
-    await new_card.insert()
-
-    return CardResponse(
-        id=str(new_card.id),
-        title=new_card.title,
-        description=new_card.description,
-        labels=new_card.labels,
-        due_date=new_card.due_date.isoformat().replace('+00:00', 'Z') if new_card.due_date else None,
-        checklist=[item.dict() if hasattr(item, 'dict') else item for item in new_card.checklist],
-        order=new_card.order,
-        list_id=new_card.list_id,
-        created_at=new_card.created_at.isoformat(),
-        updated_at=new_card.updated_at.isoformat()
+    try:
+        await repositories.cards.insert(new_card)
+    except Exception:
+        await release_card_slots(lst.board_id)
+        raise
+    await apply_stats_delta(lst.board_id, card_delta(new_card))
+    await embed_card(lst.board_id, new_card)
+    board_versions.bump(lst.board_id)
+    if new_card.due_date is not None:
+        reminder_scheduler.card_changed(str(new_card.id))
+    record_activity(
+        lst.board_id, str(current_user.id), "card.created", str(new_card.id),
+        title=new_card.title, list_id=list_id
     )
 
+    return card_to_response(new_card)
+
+
+@router.get("/{card_id}", response_model=CardResponse)
+async def get_card(
+    card_id: str,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Get one card with its description and checklist.
+
+    Board views fetched with `view=summary` leave these out; this is where
+    the card dialog loads them. User must be the owner of the board.
+    """
+    card, _ = await verify_card_ownership(card_id, str(current_user.id), repositories)
+
+    return card_to_response(card)
+
 
 @router.put("/{card_id}", response_model=CardResponse)
 async def update_card(
     card_id: str,
     card_data: CardUpdate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Update a card.
 
     User must be the owner of the board containing this card.
+    Only provided fields are written, in a single conditional update.
+    Send the `revision` you last saw to get 409 instead of overwriting
+    someone else's edit.
     """
-    card = await Card.get(card_id)
+    update_data = card_data.model_dump(exclude_unset=True)
+    expected_revision = update_data.pop("revision", None)
 
-    if not card:
+    if not ObjectId.is_valid(card_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Card not found"
         )
+    existing, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+    if write_behind_enabled():
+        # Write the card's pending position first, so it cannot undo this update
+        await settle_board(lst.board_id)
+    changes = {**update_data, "updated_at": datetime.utcnow()}
+    if "checklist" in update_data:
+        checklist = update_data["checklist"] or []
+        changes["checklist_total"] = len(checklist)
+        changes["checklist_completed"] = sum(1 for item in checklist if item["completed"])
+    previous = await repositories.cards.update(card_id, [existing.list_id], changes, expected_revision)
+
+    if not previous:
+        # Deleted, moved or edited since ownership was checked
+        if not await repositories.cards.get(card_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Card not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Card was modified by someone else, reload and try again"
+        )
 
-    # Verify list ownership
-    await verify_list_ownership(card.list_id, str(current_user.id))
-
-    # Update fields
-    update_data = card_data.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        setattr(card, field, value)
-
-    card.updated_at = datetime.utcnow()
-
-    await card.save()
-
-    return CardResponse(
-        id=str(card.id),
-        title=card.title,
-        description=card.description,
-        labels=card.labels,
-        due_date=card.due_date.isoformat().replace('+00:00', 'Z') if card.due_date else None,
-        checklist=[item.dict() if hasattr(item, 'dict') else item for item in card.checklist],
-        order=card.order,
-        list_id=card.list_id,
-        created_at=card.created_at.isoformat(),
-        updated_at=card.updated_at.isoformat()
+    # The card as written, without reading it back
+    card = Card.model_validate(
+        {**previous.model_dump(), **changes, "revision": previous.revision + 1}
+    )
+    await apply_stats_delta(lst.board_id, card_delta(previous, -1), card_delta(card))
+    await replace_embedded_card(lst.board_id, card)
+    board_versions.bump(lst.board_id)
+    if card.due_date != previous.due_date:
+        reminder_scheduler.card_changed(card_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "card.updated", card_id,
+        fields=sorted(update_data)
     )
 
+    return card_to_response(card)
+
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_card(
     card_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Delete a card.
 
     User must be the owner of the board containing this card.
     """
-    card = await Card.get(card_id)
-
-    if not card:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Card not found"
-        )
-
-    # Verify list ownership
-    await verify_list_ownership(card.list_id, str(current_user.id))
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+    await settle_board(lst.board_id)
 
     # Delete the card
-    await card.delete()
+    if await repositories.cards.delete(card):
+        await release_card_slots(lst.board_id)
+        await apply_stats_delta(lst.board_id, card_delta(card, -1))
+        await remove_embedded_cards(lst.board_id, [card.id])
+        if card.due_date is not None:
+            reminder_scheduler.card_changed(card_id)
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "card.deleted", card_id,
+        title=card.title, list_id=card.list_id
+    )
 
     return None
 
 
-@router.post("/{list_id}/reorder", response_model=dict)
+@router.post(
+    "/{list_id}/reorder",
+    response_model=dict,
+    dependencies=[Depends(rate_limit_by_user("reorder_cards"))]
+)
 async def reorder_cards(
     list_id: str,
     reorder_data: CardReorder,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Reorder cards within a list.
@@ -176,24 +262,53 @@ async def reorder_cards(
     User must be the owner of the board.
     """
     # Verify list ownership
-    await verify_list_ownership(list_id, str(current_user.id))
-
-    # Update each card's order
-    for card_id, new_order in reorder_data.card_orders.items():
-        card = await Card.get(card_id)
-        if card and card.list_id == list_id:
-            card.order = new_order
-            card.updated_at = datetime.utcnow()
-            await card.save()
+    lst = await verify_list_ownership(list_id, str(current_user.id), repositories)
+
+    # Cards of other lists are left alone
+    now = datetime.utcnow()
+    orders = [
+        (card_id, new_order)
+        for card_id, new_order in reorder_data.card_orders.items()
+        if ObjectId.is_valid(card_id)
+    ]
+    if orders and not await reorder_behind(lst, orders, repositories):
+        await repositories.cards.set_orders(list_id, orders, now)
+        await reorder_embedded_cards(lst.board_id, list_id, orders, now)
+    board_versions.bump(lst.board_id)
 
     return {"message": "Cards reordered successfully"}
 
 
-@router.post("/{card_id}/move", response_model=CardResponse)
+async def reorder_behind(lst: List, orders: Orders, repositories: Repositories) -> bool:
+    """
+    Hold a reorder in write-behind mode, if it is on and Redis is up.
+
+    Cards count as in the list where their pending position puts them, or
+    where they are stored when they have none.
+    """
+    if not write_behind_enabled():
+        return False
+    list_id = str(lst.id)
+    positions = await pending_positions(lst.board_id)
+    stored = {str(card["_id"]) for card in await repositories.cards.positions_for_list(list_id)}
+    held = {
+        card_id: (list_id, order)
+        for card_id, order in orders
+        if (positions[card_id][0] == list_id if card_id in positions else card_id in stored)
+    }
+    return not held or await record_positions(lst.board_id, held)
+
+
+@router.post(
+    "/{card_id}/move",
+    response_model=CardResponse,
+    dependencies=[Depends(idempotent("move_card")), Depends(rate_limit_by_user("move_card"))]
+)
 async def move_card(
     card_id: str,
     move_data: CardMove,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Move a card to another list.
@@ -203,34 +318,373 @@ async def move_card(
 
     User must be the owner of the board.
     """
-    card = await Card.get(card_id)
-
+    # Verify ownership of both source and target lists
+    card, source_list = await verify_card_ownership(card_id, str(current_user.id), repositories)
+    target_list = await verify_list_ownership(move_data.target_list_id, str(current_user.id), repositories)
+
+    # Moving to another board takes a slot there and frees one here
+    cross_board = source_list.board_id != target_list.board_id
+    if cross_board and not await reserve_card_slots(target_list.board_id):
+        raise card_limit_reached()
+
+    now = datetime.utcnow()
+    position = {card_id: (move_data.target_list_id, move_data.new_order)}
+    if not cross_board and write_behind_enabled() and await record_positions(source_list.board_id, position):
+        # Written with the board's next flush
+        card.list_id, card.order, card.updated_at = move_data.target_list_id, move_data.new_order, now
+    else:
+        try:
+            await settle_board(source_list.board_id)
+            removed = card_delta(card, -1)
+
+            # Move card; only the position fields are written
+            await repositories.cards.move(card, move_data.target_list_id, move_data.new_order, now)
+        except Exception:
+            if cross_board:
+                await release_card_slots(target_list.board_id)
+            raise
+        if cross_board:
+            await release_card_slots(source_list.board_id)
+            await apply_stats_delta(source_list.board_id, removed)
+            await apply_stats_delta(target_list.board_id, card_delta(card))
+        else:
+            await apply_stats_delta(source_list.board_id, removed, card_delta(card))
+        await move_embedded_card(source_list.board_id, target_list.board_id, card)
+    board_versions.bump(source_list.board_id)
+    board_versions.bump(target_list.board_id)
+    moved = {"from_list_id": str(source_list.id), "to_list_id": move_data.target_list_id}
+    record_activity(target_list.board_id, str(current_user.id), "card.moved", card_id, **moved)
+    if cross_board:
+        record_activity(source_list.board_id, str(current_user.id), "card.moved", card_id, **moved)
+
+    return card_to_response(card)
+
+
+async def verify_card_ownership(
+    card_id: str, user_id: str, repositories: Repositories
+) -> Tuple[Card, List]:
+    """Helper function to load a card and verify ownership of its list"""
+    card = await repositories.cards.get(card_id)
     if not card:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Card not found"
         )
+    lst = await verify_list_ownership(card.list_id, user_id, repositories)
 
-    # Verify ownership of both source and target lists
-    await verify_list_ownership(card.list_id, str(current_user.id))
-    await verify_list_ownership(move_data.target_list_id, str(current_user.id))
-
-    # Move card
-    card.list_id = move_data.target_list_id
-    card.order = move_data.new_order
-    card.updated_at = datetime.utcnow()
-
-    await card.save()
-
-    return CardResponse(
-        id=str(card.id),
-        title=card.title,
-        description=card.description,
-        labels=card.labels,
-        due_date=card.due_date.isoformat().replace('+00:00', 'Z') if card.due_date else None,
-        checklist=[item.dict() if hasattr(item, 'dict') else item for item in card.checklist],
-        order=card.order,
-        list_id=card.list_id,
-        created_at=card.created_at.isoformat(),
-        updated_at=card.updated_at.isoformat()
+    # A reorder or move not yet written still applies
+    position = await pending_position(lst.board_id, card_id)
+    if position:
+        card.list_id, card.order = position
+        if position[0] != str(lst.id):
+            lst = await repositories.lists.get(position[0]) or lst
+    return card, lst
+
+
+def checklist_item_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Checklist item not found"
+    )
+
+
+async def checklist_conflict(card_id: str, detail: str, repositories: Repositories) -> HTTPException:
+    """409 with `detail`, or 404 when the card was deleted meanwhile."""
+    if not await repositories.cards.get(card_id):
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Card not found"
+        )
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=detail
+    )
+
+
+@router.post(
+    "/{card_id}/checklist",
+    response_model=ChecklistItemSchema,
+    status_code=status.HTTP_201_CREATED
+)
+async def add_checklist_item(
+    card_id: str,
+    item_data: ChecklistItemCreate,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Append an item to a card's checklist.
+
+    - **text**: Item text (1-200 characters)
+    - **id**: Optional client-generated ID (default: random UUID)
+
+    Only the new item is written (`$push`), and the card's checklist
+    counters are incremented in the same update; the rest of the card is
+    untouched.
+    """
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+
+    item = ChecklistItem(
+        id=item_data.id or str(uuid.uuid4()),
+        text=item_data.text,
+        completed=item_data.completed
+    )
+
+    now = datetime.utcnow()
+    if not await repositories.cards.add_checklist_item(card_id, item.model_dump(), now):
+        raise await checklist_conflict(card_id, "Checklist item already exists", repositories)
+    await apply_stats_delta(
+        lst.board_id, {"checklist_total": 1, "checklist_completed": int(item.completed)}
+    )
+    await update_embedded_card(lst.board_id, card.id, {
+        "$push": {"checklist": item.model_dump()},
+        "$inc": {"revision": 1},
+        "$set": {"updated_at": now}
+    })
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "checklist.item_added", card_id, item_id=item.id
+    )
+
+    return item
+
+
+@router.patch("/{card_id}/checklist/{item_id}", response_model=ChecklistItemSchema)
+async def update_checklist_item(
+    card_id: str,
+    item_id: str,
+    item_data: ChecklistItemUpdate,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Edit or toggle one checklist item.
+
+    Only the changed fields of the item are written, with a positional
+    `$set` (`checklist.$[item]`), so concurrent edits to other items of the
+    same card are preserved. A toggle adjusts `checklist_completed` in the
+    same update.
+    """
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+
+    update_data = item_data.model_dump(exclude_unset=True, exclude_none=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Nothing to update"
+        )
+
+    now = datetime.utcnow()
+    previous = await repositories.cards.update_checklist_item(card_id, item_id, update_data, now)
+    if previous is None:
+        raise checklist_item_not_found()
+    item = {**previous, **update_data}
+    await apply_stats_delta(
+        lst.board_id, {"checklist_completed": int(item["completed"]) - int(previous["completed"])}
+    )
+    await update_embedded_card(lst.board_id, card.id, {
+        "$set": {
+            **{f"checklist.$[i].{field}": value for field, value in update_data.items()},
+            "updated_at": now
+        },
+        "$inc": {"revision": 1}
+    }, item_id=item_id)
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "checklist.item_updated", card_id,
+        item_id=item_id, fields=sorted(update_data)
+    )
+
+    return item
+
+
+@router.delete(
+    "/{card_id}/checklist/{item_id}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+async def delete_checklist_item(
+    card_id: str,
+    item_id: str,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Remove one item from a card's checklist.
+
+    The item is removed with `$pull`, and the card's checklist counters are
+    decremented in the same update.
+    """
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+
+    now = datetime.utcnow()
+    previous = await repositories.cards.delete_checklist_item(card_id, item_id, now)
+    if previous is None:
+        raise checklist_item_not_found()
+    await apply_stats_delta(
+        lst.board_id,
+        {"checklist_total": -1, "checklist_completed": -int(previous["completed"])}
+    )
+    await update_embedded_card(lst.board_id, card.id, {
+        "$pull": {"checklist": {"id": item_id}},
+        "$inc": {"revision": 1},
+        "$set": {"updated_at": now}
+    })
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "checklist.item_deleted", card_id, item_id=item_id
     )
+
+    return None
+
+
+@router.put("/{card_id}/checklist/order", response_model=ListType[ChecklistItemSchema])
+async def reorder_checklist(
+    card_id: str,
+    reorder_data: ChecklistReorder,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Reorder a card's checklist.
+
+    `item_ids` must contain every current item exactly once. The array is
+    rebuilt inside MongoDB by a pipeline update, the one checklist write
+    that rewrites the whole array; if items were added or removed
+    concurrently the request fails with 409 instead of dropping them.
+    """
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+
+    item_ids = reorder_data.item_ids
+    if len(set(item_ids)) != len(item_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate checklist item IDs"
+        )
+    if not item_ids and not card.checklist:
+        # Nothing to reorder; `$all: []` would match no card at all
+        return []
+
+    now = datetime.utcnow()
+    checklist = await repositories.cards.reorder_checklist(card_id, item_ids, now)
+    if checklist is None:
+        raise await checklist_conflict(
+            card_id, "Checklist changed, reload the card and try again", repositories
+        )
+    await update_embedded_card(lst.board_id, card.id, {
+        "$set": {"checklist": checklist, "updated_at": now},
+        "$inc": {"revision": 1}
+    })
+    board_versions.bump(lst.board_id)
+
+    return checklist
+
+
+async def verify_archived_card_ownership(
+    card_id: str, user_id: str, repositories: Repositories
+) -> ArchivedCard:
+    """Helper function to load an archived card and verify board ownership"""
+    archived = await ArchivedCard.get(card_id)
+    if not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archived card not found"
+        )
+
+    board = await repositories.boards.get(archived.board_id) if archived.board_id else None
+    if not board or board.owner_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this card"
+        )
+
+    return archived
+
+
+@router.post("/{card_id}/archive", response_model=ArchivedCardResponse)
+async def archive_card(
+    card_id: str,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Move a card into the archive.
+
+    Archived cards no longer appear on the board; restore them with
+    POST /cards/{card_id}/unarchive.
+    """
+    card, lst = await verify_card_ownership(card_id, str(current_user.id), repositories)
+    await settle_board(lst.board_id)
+
+    await archive_cards({"_id": card.id})
+
+    archived = await ArchivedCard.get(card.id)
+    if not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Card not found"
+        )
+    record_activity(lst.board_id, str(current_user.id), "card.archived", card_id)
+
+    return archived_card_to_response(archived)
+
+
+@router.post("/{card_id}/unarchive", response_model=CardResponse)
+async def unarchive_card(
+    card_id: str,
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Restore an archived card to the end of its original list.
+
+    Fails with 409 if that list has been deleted.
+    """
+    archived = await verify_archived_card_ownership(card_id, str(current_user.id), repositories)
+
+    if not await repositories.lists.get(archived.list_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The card's list no longer exists"
+        )
+
+    card = await restore_card(archived)
+    if not card:
+        raise card_limit_reached()
+    record_activity(archived.board_id, str(current_user.id), "card.restored", card_id)
+    if card.due_date is not None:
+        reminder_scheduler.card_changed(card_id)
+
+    return card_to_response(card)
+
+
+@router.get("/archived/{board_id}", response_model=ListType[ArchivedCardResponse])
+async def get_archived_cards(
+    board_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
+):
+    """
+    Get archived cards of a board, most recently archived first.
+
+    - **skip**: Number of cards to skip
+    - **limit**: Maximum number of cards to return (max 200)
+    """
+    board = await repositories.boards.get(board_id)
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+    if board.owner_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this board"
+        )
+
+    archived = await ArchivedCard.find(
+        ArchivedCard.board_id == board_id
+    ).sort(-ArchivedCard.archived_at).skip(skip).limit(limit).to_list()
+
+    return [archived_card_to_response(card) for card in archived]
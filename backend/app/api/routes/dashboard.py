@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Request
+from app.models.user import User
+from app.schemas.dashboard import DashboardResponse
+from app.api.dependencies.auth import get_current_active_user
+from app.services.dashboard import load_dashboard
+from app.utils.dashboard_cache import dashboard_cache
+from app.utils.media_types import MessagePackRoute
+from app.utils.single_flight import SingleFlight
+from app.utils.snapshots import Snapshot, snapshot_response
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"], route_class=MessagePackRoute)
+
+dashboard_reads = SingleFlight()
+
+
+async def load_dashboard_snapshot(user_id: str, version: int) -> Snapshot:
+    """Build a user's dashboard, encoded as JSON, and cache it."""
+    dashboard = await load_dashboard(user_id)
+    snapshot = Snapshot(dashboard.model_dump_json().encode())
+    dashboard_cache.set(user_id, version, [board.id for board in dashboard.boards], snapshot)
+    return snapshot
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    request: Request,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get everything the dashboard shows in one request.
+
+    Returns every board of the current user with its list, card, overdue
+    and checklist counts, the cards due soonest and the most recently
+    changed cards. Built with one aggregation and cached per user until one
+    of the user's boards changes.
+    """
+    user_id = str(current_user.id)
+
+    snapshot = dashboard_cache.get(user_id)
+    if snapshot is None:
+        version = dashboard_cache.version(user_id)
+        snapshot = await dashboard_reads.do(
+            (user_id, version),
+            lambda: load_dashboard_snapshot(user_id, version)
+        )
+
+    return snapshot_response(request, snapshot)
@@ -1,20 +1,65 @@
 from datetime import datetime
-from typing import List as ListType
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List as ListType, Literal, Optional
+from fastapi import APIRouter, HTTPException, Query, status, Depends, Request
+from bson import ObjectId
+from pydantic import TypeAdapter
 from app.models.list import List
+from app.models.archived_card import ArchivedCard
 from app.models.card import Card
 from app.models.board import Board
 from app.models.user import User
 from app.schemas.list import ListCreate, ListUpdate, ListReorder, ListResponse, ListWithCardsResponse
-from app.schemas.card import CardResponse
 from app.api.dependencies.auth import get_current_active_user
+from app.api.dependencies.idempotency import idempotent
+from app.api.dependencies.rate_limit import rate_limit_by_user
+from app.api.dependencies.repositories import get_repositories
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.repositories.base import Repositories
+from app.services.activity import record_activity
+from app.services.board_stats import rebuild_board_stats
+from app.services.counters import release_card_slots
+from app.services.embedded_boards import (
+    embed_list, embedded_storage, load_board_document, remove_embedded_list,
+    reorder_embedded_lists, replace_embedded_list, unpack_board_document
+)
+from app.services.write_behind import apply_positions, pending_positions, settle_board
+from app.utils.board_versions import BoardVersions, board_versions
+from app.utils.media_types import MessagePackRoute
+from app.utils.serializers import lists_with_card_summaries, lists_with_cards_response
+from app.utils.single_flight import SingleFlight
+from app.utils.snapshots import Snapshot, SnapshotCache, snapshot_response
+
+router = APIRouter(prefix="/lists", tags=["Lists"], route_class=MessagePackRoute)
+
+# Concurrent reads of the same board version share one fetch + encode, and
+# the encoded (and compressed) result is kept until the board changes
+board_reads = SingleFlight()
+board_snapshots = SnapshotCache(
+    max_entries=settings.BOARD_SNAPSHOT_CACHE_SIZE,
+    ttl_seconds=settings.BOARD_SNAPSHOT_TTL_SECONDS
+)
+board_lists_adapter = TypeAdapter(ListType[ListWithCardsResponse])
+
+BoardView = Literal["full", "summary"]
+BOARD_VIEWS = ("full", "summary")
+
+
+def invalidate_board_snapshot(board_id: Optional[str]) -> None:
+    # Version checks already reject stale entries; this frees them early
+    if board_id is None:
+        board_snapshots.clear()
+    else:
+        for view in BOARD_VIEWS:
+            board_snapshots.discard((board_id, view))
+
 
-router = APIRouter(prefix="/lists", tags=["Lists"])
+invalidation_bus.subscribe(BoardVersions.topic, invalidate_board_snapshot)
 
 
-async def verify_board_ownership(board_id: str, user_id: str) -> Board:
+async def verify_board_ownership(board_id: str, user_id: str, repositories: Repositories) -> Board:
     """Helper function to verify board ownership"""
-    board = await Board.get(board_id)
+    board = await repositories.boards.get(board_id)
     if not board:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -28,11 +73,53 @@ async def verify_board_ownership(board_id: str, user_id: str) -> Board:
     return board
 
 
-@router.post("/{board_id}", response_model=ListResponse, status_code=status.HTTP_201_CREATED)
+async def load_board_snapshot(
+    board_id: str, version: int, repositories: Repositories, view: BoardView = "full"
+) -> Snapshot:
+    """Fetch all lists of a board with their cards, encoded as JSON."""
+    # Card positions held in write-behind mode, not yet in MongoDB
+    positions = await pending_positions(board_id)
+
+    if embedded_storage():
+        # The whole board is one document
+        lists, cards = unpack_board_document(await load_board_document(board_id))
+        cards = apply_positions(cards, positions)
+        if view == "summary":
+            response = lists_with_card_summaries(lists, cards)
+        else:
+            response = lists_with_cards_response(lists, [Card.model_validate(card) for card in cards])
+        snapshot = Snapshot(board_lists_adapter.dump_json(response))
+        board_snapshots.set((board_id, view), version, snapshot)
+        return snapshot
+
+    # Get all lists, sorted by order
+    lists = await repositories.lists.for_board(board_id)
+
+    # Get all cards for these lists
+    list_ids = [str(l.id) for l in lists]
+    if view == "summary":
+        summaries = apply_positions(await repositories.cards.summaries_for_lists(list_ids), positions)
+        response = lists_with_card_summaries(lists, summaries)
+    else:
+        all_cards = apply_positions(await repositories.cards.for_lists(list_ids), positions)
+        response = lists_with_cards_response(lists, all_cards)
+
+    snapshot = Snapshot(board_lists_adapter.dump_json(response))
+    board_snapshots.set((board_id, view), version, snapshot)
+    return snapshot
+
+
+@router.post(
+    "/{board_id}",
+    response_model=ListResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(idempotent("create_list"))]
+)
 async def create_list(
     board_id: str,
     list_data: ListCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Create a new list in a board.
@@ -44,14 +131,12 @@ async def create_list(
     User must be the owner of the board.
     """
     # Verify board ownership
-    await verify_board_ownership(board_id, str(current_user.id))
+    await verify_board_ownership(board_id, str(current_user.id), repositories)
 
     # Determine order
     if list_data.order is None:
         # Auto-increment: get max order + 1
-        existing_lists = await List.find(List.board_id == board_id).to_list()
-        max_order = max([l.order for l in existing_lists], default=-1)
-        order = max_order + 1
+        order = await repositories.lists.max_order(board_id) + 1
     else:
         order = list_data.order
 
@@ -62,13 +147,19 @@ async def create_list(
         board_id=board_id
     )
 
-    await new_list.insert()
+    await repositories.lists.insert(new_list)
+    await embed_list(board_id, new_list)
+    board_versions.bump(board_id)
+    record_activity(
+        board_id, str(current_user.id), "list.created", str(new_list.id), title=new_list.title
+    )
 
     return ListResponse(
         id=str(new_list.id),
         title=new_list.title,
         order=new_list.order,
         board_id=new_list.board_id,
+        revision=new_list.revision,
         created_at=new_list.created_at.isoformat(),
         updated_at=new_list.updated_at.isoformat()
     )
@@ -77,100 +168,94 @@ async def create_list(
 @router.get("/{board_id}", response_model=ListType[ListWithCardsResponse])
 async def get_board_lists(
     board_id: str,
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    view: BoardView = Query("full", description="`summary` returns cards without description and checklist items"),
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Get all lists in a board with their cards.
 
-    Returns lists sorted by order, each with their cards.
-    User must be the owner of the board.
+    Returns lists sorted by order, each with their cards. With
+    `view=summary` each card carries only what the board shows (title,
+    labels, due date, checklist done/total); fetch the rest with
+    GET /cards/{card_id}.
+    User must be the owner of the board. Concurrent requests for the same
+    board share one database fetch, and the encoded result is cached until
+    the board changes; ownership is still checked per caller.
     """
     # Verify board ownership
-    await verify_board_ownership(board_id, str(current_user.id))
-
-    # Get all lists, sorted by order
-    lists = await List.find(List.board_id == board_id).sort("+order").to_list()
-
-    # Get all cards for these lists
-    list_ids = [str(l.id) for l in lists]
-    all_cards = await Card.find({"list_id": {"$in": list_ids}}).sort("+order").to_list()
-
-    # Group cards by list_id
-    cards_by_list = {}
-    for card in all_cards:
-        if card.list_id not in cards_by_list:
-            cards_by_list[card.list_id] = []
-        cards_by_list[card.list_id].append(
-            CardResponse(
-                id=str(card.id),
-                title=card.title,
-                description=card.description,
-                labels=card.labels,
-                due_date=card.due_date.isoformat().replace('+00:00', 'Z') if card.due_date else None,
-                checklist=[item.dict() if hasattr(item, 'dict') else item for item in card.checklist],
-                order=card.order,
-                list_id=card.list_id,
-                created_at=card.created_at.isoformat(),
-                updated_at=card.updated_at.isoformat()
-            )
+    await verify_board_ownership(board_id, str(current_user.id), repositories)
+
+    version = board_versions.get(board_id)
+    snapshot = board_snapshots.get((board_id, view), version)
+    if snapshot is None:
+        snapshot = await board_reads.do(
+            (board_id, view, version),
+            lambda: load_board_snapshot(board_id, version, repositories, view)
         )
 
-    # Build response
-    list_responses = []
-    for lst in lists:
-        list_id = str(lst.id)
-        list_responses.append(
-            ListWithCardsResponse(
-                id=list_id,
-                title=lst.title,
-                order=lst.order,
-                board_id=lst.board_id,
-                created_at=lst.created_at.isoformat(),
-                updated_at=lst.updated_at.isoformat(),
-                cards=cards_by_list.get(list_id, [])
-            )
-        )
-
-    return list_responses
+    return snapshot_response(request, snapshot)
 
 
 @router.put("/{list_id}", response_model=ListResponse)
 async def update_list(
     list_id: str,
     list_data: ListUpdate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Update a list.
 
     User must be the owner of the board containing this list.
+    Only provided fields are written, in a single conditional update.
+    Send the `revision` you last saw to get 409 instead of overwriting
+    someone else's edit.
     """
-    lst = await List.get(list_id)
+    update_data = list_data.model_dump(exclude_unset=True)
+    expected_revision = update_data.pop("revision", None)
 
-    if not lst:
+    if not ObjectId.is_valid(list_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="List not found"
         )
+    board_ids = await repositories.boards.ids_for_owner(str(current_user.id))
+    lst = await repositories.lists.update(
+        list_id, board_ids, {**update_data, "updated_at": datetime.utcnow()}, expected_revision
+    )
 
-    # Verify board ownership
-    await verify_board_ownership(lst.board_id, str(current_user.id))
-
-    # Update fields
-    update_data = list_data.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        setattr(lst, field, value)
-
-    lst.updated_at = datetime.utcnow()
+    if not lst:
+        # Find out why the conditional update matched nothing
+        existing = await repositories.lists.get(list_id)
+        if not existing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="List not found"
+            )
+        if existing.board_id not in board_ids:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this board"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="List was modified by someone else, reload and try again"
+        )
 
-    await lst.save()
+    await replace_embedded_list(lst.board_id, lst)
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "list.updated", list_id, fields=sorted(update_data)
+    )
 
     return ListResponse(
         id=str(lst.id),
         title=lst.title,
         order=lst.order,
         board_id=lst.board_id,
+        revision=lst.revision,
         created_at=lst.created_at.isoformat(),
         updated_at=lst.updated_at.isoformat()
     )
@@ -179,14 +264,15 @@ async def update_list(
 @router.delete("/{list_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_list(
     list_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Delete a list and all its cards.
 
     User must be the owner of the board containing this list.
     """
-    lst = await List.get(list_id)
+    lst = await repositories.lists.get(list_id)
 
     if not lst:
         raise HTTPException(
@@ -195,22 +281,38 @@ async def delete_list(
         )
 
     # Verify board ownership
-    await verify_board_ownership(lst.board_id, str(current_user.id))
+    await verify_board_ownership(lst.board_id, str(current_user.id), repositories)
+    await settle_board(lst.board_id)
 
-    # Delete all cards in this list
-    await Card.find(Card.list_id == list_id).delete()
+    # Delete all cards in this list, archived ones included
+    result = await Card.find(Card.list_id == list_id).delete()
+    if result:
+        await release_card_slots(lst.board_id, result.deleted_count)
+    await ArchivedCard.find(ArchivedCard.list_id == list_id).delete()
 
     # Delete the list
     await lst.delete()
+    await rebuild_board_stats(lst.board_id)
+    await remove_embedded_list(lst.board_id, list_id)
+    board_versions.bump(lst.board_id)
+    record_activity(
+        lst.board_id, str(current_user.id), "list.deleted", list_id,
+        title=lst.title, cards_deleted=result.deleted_count if result else 0
+    )
 
     return None
 
 
-@router.post("/{board_id}/reorder", response_model=dict)
+@router.post(
+    "/{board_id}/reorder",
+    response_model=dict,
+    dependencies=[Depends(rate_limit_by_user("reorder_lists"))]
+)
 async def reorder_lists(
     board_id: str,
     reorder_data: ListReorder,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    repositories: Repositories = Depends(get_repositories)
 ):
     """
     Reorder lists in a board.
@@ -219,14 +321,18 @@ async def reorder_lists(
     User must be the owner of the board.
     """
     # Verify board ownership
-    await verify_board_ownership(board_id, str(current_user.id))
-
-    # Update each list's order
-    for list_id, new_order in reorder_data.list_orders.items():
-        lst = await List.get(list_id)
-        if lst and lst.board_id == board_id:
-            lst.order = new_order
-            lst.updated_at = datetime.utcnow()
-            await lst.save()
+    await verify_board_ownership(board_id, str(current_user.id), repositories)
+
+    # Lists of other boards are left alone
+    now = datetime.utcnow()
+    orders = [
+        (list_id, new_order)
+        for list_id, new_order in reorder_data.list_orders.items()
+        if ObjectId.is_valid(list_id)
+    ]
+    if orders:
+        await repositories.lists.set_orders(board_id, orders, now)
+        await reorder_embedded_lists(board_id, orders, now)
+    board_versions.bump(board_id)
 
     return {"message": "Lists reordered successfully"}
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Todo-List API"
@@ -7,11 +7,15 @@ class Settings(BaseSettings):
     DESCRIPTION: str = "Todo-List Web Application API"
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = 1  # gunicorn worker processes, see gunicorn.conf.py
     DEBUG: bool = True
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_REUSE_GRACE_SECONDS: int = 10  # A just-rotated refresh token returns its new pair; 0 disables
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
     CORS_ORIGINS: List[str] = ["http://localhost:8000", "http://127.0.0.1:8000", "http://localhost:5173","http://127.0.0.1:5173"]
     MONGODB_URL: str = "mongodb://127.0.0.1:27017"
     MONGODB_DB_NAME: str = "todolist_db"
@@ -19,9 +23,67 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: str = ""
     REDIS_DB: int = 0
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
     MAX_FILE_SIZE: int = 10485760
     MAX_BOARDS_PER_USER: int = 7
     MAX_CARDS_PER_BOARD: int = 20
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    MSGPACK_ENABLED: bool = True  # Offer application/msgpack (needs the msgpack package)
+    BOARD_SNAPSHOT_CACHE_SIZE: int = 512
+    BOARD_SNAPSHOT_TTL_SECONDS: int = 60
+    BOARD_STORAGE_MODE: str = "collections"  # or "embedded", see services/embedded_boards
+    ARCHIVE_ENABLED: bool = False  # Opt-in; moves cards out of board views
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_COMPLETED_AFTER_DAYS: int = 14  # 0 disables
+    ARCHIVE_STALE_AFTER_DAYS: int = 0  # Opt-in; 0 disables
+    BOARD_STATS_REPAIR_ENABLED: bool = True
+    BOARD_STATS_REPAIR_INTERVAL_SECONDS: int = 86400
+    DASHBOARD_CACHE_SIZE: int = 1024
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
+    DASHBOARD_ITEMS: int = 10  # Upcoming cards, recent cards and activity events shown
+    DASHBOARD_UPCOMING_DAYS: int = 7
+    ACTIVITY_FLUSH_SIZE: int = 200  # Buffered events that trigger a write
+    ACTIVITY_FLUSH_INTERVAL_SECONDS: float = 1.0
+    ACTIVITY_MAX_PENDING: int = 10000  # Oldest events are dropped beyond this
+    ACTIVITY_RETENTION_DAYS: int = 90
+    REMINDERS_ENABLED: bool = True
+    REMINDER_LEAD_SECONDS: int = 900  # Remind this long before a card is due
+    REMINDER_WINDOW_SECONDS: int = 3600  # Due dates held in memory ahead of time
+    REMINDER_MAX_SCHEDULED: int = 50000  # Upper bound of reminders held in memory
+    REMINDER_TICK_SECONDS: float = 1.0
+    REMINDER_LEASE_SECONDS: int = 30
+    REMINDER_SINK: str = "log"  # "log" or "file"
+    REMINDER_SINK_PATH: str = "reminders.jsonl"
+    WRITE_BEHIND_ENABLED: bool = False  # Card reorders and moves, see services/write_behind
+    WRITE_BEHIND_QUIET_SECONDS: float = 2.0  # Flush a board this long after its last change
+    WRITE_BEHIND_MAX_DELAY_SECONDS: float = 10.0  # ... and no later than this after its first
+    WRITE_BEHIND_MAX_PENDING: int = 50  # Pending cards of a board that trigger a flush
+    WRITE_BEHIND_LOCK_SECONDS: int = 30  # Claim on a board while one process flushes it
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # How long a response can be replayed
+    IDEMPOTENCY_LOCK_SECONDS: int = 60  # Claim on a key while its request runs
+    SLOW_QUERY_THRESHOLD_MS: float = 100  # 0 disables
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # Share of slow find/aggregate commands explained
+    PROFILING_ENABLED: bool = True  # Superusers only, per request (needs pyinstrument)
+    PROFILING_INTERVAL_SECONDS: float = 0.001
+    PROFILING_DIR: str = ""  # Also keep every profile here; empty keeps none
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, str] = {
+        "login": "10/minute",
+        "register": "5/minute",
+        "refresh": "30/minute",
+        "create_card": "120/minute",
+        "reorder_cards": "120/minute",
+        "move_card": "120/minute",
+        "reorder_lists": "60/minute",
+    }
+    TRUSTED_PROXIES: List[str] = []  # IPs/CIDRs of reverse proxies whose X-Forwarded-For is believed
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
@@ -1,20 +1,30 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from app.core.config import settings
+from app.core.query_counter import QueryCounterListener
+from app.core.slow_queries import slow_query_log
 from app.models.user import User
 from app.models.board import Board
 from app.models.list import List
 from app.models.card import Card
+from app.models.archived_card import ArchivedCard
+from app.models.board_stats import BoardStats
+from app.models.board_document import BoardDocument
+from app.models.activity import ActivityEvent
 
 
 async def init_db():
     """Initialize database connection and Beanie ODM."""
-    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        event_listeners=[QueryCounterListener(), slow_query_log]
+    )
+    slow_query_log.attach(client)
 
     # Initialize Beanie with ALL models
     await init_beanie(
         database=client[settings.MONGODB_DB_NAME],
-        document_models=[User, Board, List, Card]  # ← THÊM List, Card
+        document_models=[User, Board, List, Card, ArchivedCard, BoardStats, ActivityEvent, BoardDocument]  # ← THÊM List, Card
     )
 
     print(f"✅ Connected to MongoDB: {settings.MONGODB_DB_NAME}")
@@ -0,0 +1,129 @@
+"""
+Cross-process cache invalidation over Redis pub/sub.
+
+Every in-process cache subscribes to a topic (e.g. "board") and drops what
+it holds for a key when that key is published. `publish` runs the local
+handlers immediately and forwards the key to every other API process, whose
+handlers run as soon as the message arrives.
+
+A handler called with key None must drop everything it holds for the topic:
+that happens after the subscription was lost, since messages published
+meanwhile are gone.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Optional[str]], None]
+
+MAX_RECONNECT_DELAY = 30.0
+
+
+class InvalidationBus:
+    """Fan out invalidations to local handlers and to other processes."""
+
+    def __init__(self, redis: Redis, channel: str):
+        self.redis = redis
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._outbox: Optional["asyncio.Queue[Tuple[str, str]]"] = None
+        self._tasks: List[asyncio.Task] = []
+        self._subscribed = asyncio.Event()
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def publish(self, topic: str, key: str) -> None:
+        """Invalidate `key` here now and in every other process shortly."""
+        self._dispatch(topic, key)
+        if self._outbox is not None:
+            self._outbox.put_nowait((topic, key))
+
+    def _dispatch(self, topic: str, key: Optional[str]) -> None:
+        for handler in self._handlers.get(topic, []):
+            handler(key)
+
+    def _reset_all(self) -> None:
+        for topic in self._handlers:
+            self._dispatch(topic, None)
+
+    async def start(self) -> None:
+        """Start forwarding and receiving; a no-op when already running."""
+        if self._tasks:
+            return
+        # New id per start, so forked workers never share one
+        self.origin = uuid.uuid4().hex
+        self._outbox = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._publisher()),
+            asyncio.create_task(self._listener()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        self._outbox = None
+        self._subscribed.clear()
+
+    async def wait_subscribed(self, timeout: float = 5.0) -> None:
+        await asyncio.wait_for(self._subscribed.wait(), timeout)
+
+    async def _publisher(self) -> None:
+        while True:
+            topic, key = await self._outbox.get()
+            message = json.dumps({"origin": self.origin, "topic": topic, "key": key})
+            try:
+                await self.redis.publish(self.channel, message)
+            except RedisError as exc:
+                logger.warning("Could not publish invalidation of %s %s: %s", topic, key, exc)
+
+    async def _listener(self) -> None:
+        delay = 0.5
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if delay > 0.5:
+                    # Reconnected: whatever was published meanwhile is lost
+                    self._reset_all()
+                delay = 0.5
+                self._subscribed.set()
+                async for message in pubsub.listen():
+                    self._receive(message)
+            except RedisError as exc:
+                self._subscribed.clear()
+                if delay == 0.5:
+                    logger.warning("Invalidation bus disconnected: %s", exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+            finally:
+                await pubsub.aclose()
+
+    def _receive(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        self._dispatch(payload.get("topic"), payload.get("key"))
+
+
+invalidation_bus = InvalidationBus(redis_client, settings.CACHE_INVALIDATION_CHANNEL)
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Tuple
+from pymongo import monitoring
+
+
+class QueryCounter:
+    """Collects the MongoDB commands issued while it is active."""
+
+    def __init__(self):
+        self.commands: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.commands)
+
+    def record(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = event.command.get(event.command_name)
+        if isinstance(collection, str):
+            self.commands.append(f"{event.command_name} {collection}")
+        else:
+            self.commands.append(event.command_name)
+
+
+# Counters active in the current context. Motor copies the context into its
+# executor threads, so the listener sees the counters of the calling request.
+_active_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar(
+    "active_query_counters", default=()
+)
+
+
+class QueryCounterListener(monitoring.CommandListener):
+    """Pymongo command listener feeding every active QueryCounter."""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        for counter in _active_counters.get():
+            counter.record(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryCounter]:
+    """
+    Count MongoDB commands issued inside the block.
+
+    Trackers nest: a command is recorded by every tracker that is active,
+    so a test can wrap a request that is also tracked by the middleware.
+    """
+    counter = QueryCounter()
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
@@ -0,0 +1,16 @@
+from redis.asyncio import Redis
+from app.core.config import settings
+
+# Shared connection pool; connections are opened lazily on first command.
+redis_client = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    password=settings.REDIS_PASSWORD or None,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+)
+
+
+async def close_redis():
+    """Close the shared Redis connection pool."""
+    await redis_client.aclose()
@@ -0,0 +1,188 @@
+"""
+Slow-query log with sampled explain plans.
+
+Every MongoDB command that takes longer than
+`settings.SLOW_QUERY_THRESHOLD_MS` is logged together with the request that
+issued it. A sample of the slow `find` and `aggregate` commands is re-run
+as `explain` with "executionStats" verbosity, and the plan summary is
+logged next to it: a COLLSCAN, or many documents examined per document
+returned, points at a missing index.
+"""
+import asyncio
+import logging
+import random
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from pymongo import monitoring
+from pymongo.errors import PyMongoError
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = ("find", "aggregate")
+
+# Fields pymongo adds to a command that explain must not be given
+SESSION_FIELDS = ("lsid", "txnNumber", "autocommit", "startTransaction", "readConcern")
+
+_current_route: ContextVar[Optional[str]] = ContextVar("slow_query_route", default=None)
+
+
+@contextmanager
+def tag_queries(route: str) -> Iterator[None]:
+    """Attribute MongoDB commands issued inside the block to `route`."""
+    token = _current_route.set(route)
+    try:
+        yield
+    finally:
+        _current_route.reset(token)
+
+
+@dataclass
+class SlowQuery:
+    command_name: str
+    collection: Optional[str]
+    duration_ms: float
+    route: Optional[str]
+    plan: Optional[Dict[str, Any]] = field(default=None)
+
+
+def summarize_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an explain("executionStats") result to what points at an index problem.
+
+    Handles both shapes: find explains, and aggregate explains whose stats
+    sit under the first stage's `$cursor`.
+    """
+    stages: List[str] = []
+    stats: Dict[str, Any] = {}
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            stage = node.get("stage")
+            if isinstance(stage, str):
+                stages.append(stage)
+            if "executionStats" in node and not stats:
+                stats.update(node["executionStats"])
+            for key, value in node.items():
+                if key in ("inputStage", "inputStages", "queryPlan", "winningPlan",
+                           "queryPlanner", "stages", "$cursor", "executionStages"):
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(explain)
+    # "executionStages" repeats the winning plan's stages; keep each once, in order
+    stages = list(dict.fromkeys(stages))
+    return {
+        "stages": stages,
+        "collection_scan": "COLLSCAN" in stages,
+        "returned": stats.get("nReturned"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "time_ms": stats.get("executionTimeMillis"),
+    }
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    """
+    Pymongo command listener logging slow commands.
+
+    Pymongo calls it from Motor's worker threads; explains are scheduled
+    back onto the event loop of the client passed to `attach`, at most one
+    at a time so a slow database is not loaded further.
+    """
+
+    def __init__(self, recent: int = 100):
+        self.recent: Deque[SlowQuery] = deque(maxlen=recent)
+        # request id -> (collection, command kept for explain)
+        self._commands: Dict[int, Tuple[Optional[str], Optional[Dict[str, Any]]]] = {}
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._explaining = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def attach(self, client) -> None:
+        """Run explains through `client`, on the current event loop."""
+        self._client = client
+        self._loop = asyncio.get_running_loop()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if settings.SLOW_QUERY_THRESHOLD_MS <= 0:
+            return
+        collection = event.command.get(event.command_name)
+        self._commands[event.request_id] = (
+            collection if isinstance(collection, str) else None,
+            event.command if event.command_name in EXPLAINABLE else None,
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection, command = self._commands.pop(event.request_id, (None, None))
+        threshold = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold <= 0 or event.duration_micros < threshold * 1000:
+            return
+
+        slow = SlowQuery(
+            command_name=event.command_name,
+            collection=collection,
+            duration_ms=event.duration_micros / 1000,
+            route=_current_route.get(),
+        )
+        self.recent.append(slow)
+        logger.warning(
+            "Slow MongoDB %s on %s took %.1f ms (%s)",
+            slow.command_name, slow.collection or event.database_name,
+            slow.duration_ms, slow.route or "no request"
+        )
+
+        if (
+            command is not None
+            and self._loop is not None
+            and not self._explaining
+            and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        ):
+            self._explaining = True
+            try:
+                self._loop.call_soon_threadsafe(self._schedule_explain, slow, event.database_name, command)
+            except RuntimeError:  # Loop already closed
+                self._explaining = False
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._commands.pop(event.request_id, None)
+
+    def _schedule_explain(self, slow: SlowQuery, database: str, command: Dict[str, Any]) -> None:
+        task = asyncio.get_running_loop().create_task(self.explain(slow, database, command))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def explain(self, slow: SlowQuery, database: str, command: Dict[str, Any]) -> None:
+        """Re-run a slow command as explain and log its plan."""
+        explained = {
+            key: value for key, value in command.items()
+            if not key.startswith("$") and key not in SESSION_FIELDS
+        }
+        try:
+            result = await self._client[database].command(
+                {"explain": explained, "verbosity": "executionStats"}
+            )
+        except PyMongoError as exc:
+            logger.warning("Could not explain slow %s on %s: %s", slow.command_name, slow.collection, exc)
+            return
+        finally:
+            self._explaining = False
+
+        slow.plan = summarize_plan(result)
+        logger.warning(
+            "Plan of slow %s on %s (%s): %s%s",
+            slow.command_name, slow.collection, slow.route or "no request",
+            " > ".join(slow.plan["stages"]) or "unknown",
+            f", {slow.plan['docs_examined']} docs / {slow.plan['keys_examined']} keys "
+            f"examined for {slow.plan['returned']} returned"
+            if slow.plan["returned"] is not None else ""
+        )
+
+
+slow_query_log = SlowQueryLog()
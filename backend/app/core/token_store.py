@@ -0,0 +1,228 @@
+"""
+Refresh-token rotation and session revocation, stored in Redis.
+
+Every login starts a session (`sid`, carried by both tokens). Redis keeps
+the jti of the one refresh token of that session that may still be used:
+
+    auth:refresh:<sid>  -> jti of the current refresh token (TTL = refresh lifetime)
+    auth:grace:<sid>    -> hash of the jti just rotated away and the token pair
+                           issued for it (TTL = REFRESH_REUSE_GRACE_SECONDS)
+    auth:revoked        -> sorted set of revoked sids, scored by when their
+                           last access token expires
+
+Refreshing swaps the stored jti for a new one. The token just rotated away
+keeps working for a few seconds, answering with the pair it was already
+exchanged for, so a client retrying a refresh whose response it lost (or two
+tabs refreshing at once) is not logged out. Presenting any other refresh
+token whose jti is no longer current means it was used twice (stolen or
+replayed), so the whole session is revoked.
+
+Access tokens are checked against the revoked set through an in-process
+Bloom filter: a sid that is not in the filter is certainly not revoked, and
+only the rare filter hit costs a Redis round trip. Workers learn about new
+revocations through the invalidation bus. Until the filter has been loaded
+from Redis every check is a direct lookup in Redis, so a worker that could
+not load it never lets a revoked session through, yet keeps serving
+requests; only a lookup that fails too is treated as revoked.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Optional, Set, Tuple
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.core.redis import redis_client
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+REFRESH_KEY = "auth:refresh:{}"
+GRACE_KEY = "auth:grace:{}"
+REVOKED_KEY = "auth:revoked"
+SESSION_TOPIC = "session"
+
+# Seconds between attempts to load the revocation filter
+LOAD_RETRY_SECONDS = 1.0
+
+# Rotation outcomes
+ROTATED = 1
+REVOKED = 0
+REUSED = -1
+RETRIED = 2
+
+# KEYS[1] = auth:refresh:<sid>, KEYS[2] = auth:grace:<sid>
+# ARGV = presented jti, new jti, TTL in seconds, issued pair (JSON), grace seconds
+ROTATE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return {0}
+end
+if current == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', tonumber(ARGV[3]))
+    if tonumber(ARGV[5]) > 0 then
+        redis.call('HSET', KEYS[2], 'jti', ARGV[1], 'tokens', ARGV[4])
+        redis.call('EXPIRE', KEYS[2], tonumber(ARGV[5]))
+    end
+    return {1}
+end
+if redis.call('HGET', KEYS[2], 'jti') == ARGV[1] then
+    return {2, redis.call('HGET', KEYS[2], 'tokens')}
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+return {-1}
+"""
+
+rotate_refresh = redis_client.register_script(ROTATE_SCRIPT)
+
+
+def refresh_ttl() -> int:
+    return settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+
+
+def access_ttl() -> int:
+    return settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+async def start_session(sid: str, refresh_jti: str) -> None:
+    """Record the first refresh token of a new session."""
+    await redis_client.set(REFRESH_KEY.format(sid), refresh_jti, ex=refresh_ttl())
+
+
+async def rotate(
+    sid: str, jti: str, new_jti: str, tokens: Tuple[str, str]
+) -> Tuple[int, Optional[Tuple[str, str]]]:
+    """
+    Replace the session's current refresh token.
+
+    Args:
+        tokens: The (access, refresh) pair being issued for `new_jti`
+
+    Returns:
+        (outcome, tokens): ROTATED if `jti` was current, REVOKED if the
+        session no longer exists, REUSED if `jti` had already been rotated
+        away (the session has then been ended), RETRIED if `jti` was rotated
+        away within the grace window; `tokens` is then the pair issued back then
+    """
+    result = await rotate_refresh(
+        keys=[REFRESH_KEY.format(sid), GRACE_KEY.format(sid)],
+        args=[jti, new_jti, refresh_ttl(), json.dumps(tokens), settings.REFRESH_REUSE_GRACE_SECONDS]
+    )
+    outcome = int(result[0])
+    if outcome == RETRIED:
+        access_token, refresh_token = json.loads(result[1])
+        return outcome, (access_token, refresh_token)
+    return outcome, None
+
+
+async def revoke_session(sid: str) -> None:
+    """End a session: its refresh token stops working, and so do its access tokens."""
+    now = time.time()
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(REFRESH_KEY.format(sid), GRACE_KEY.format(sid))
+        pipe.zadd(REVOKED_KEY, {sid: now + access_ttl()})
+        pipe.zremrangebyscore(REVOKED_KEY, "-inf", now)
+        await pipe.execute()
+    invalidation_bus.publish(SESSION_TOPIC, sid)
+
+
+class RevocationFilter:
+    """In-process Bloom filter of revoked session ids."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        # False until the filter holds every revocation known to Redis
+        self.loaded = False
+        self._added_while_loading: Optional[Set[str]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._reload: Optional[asyncio.Task] = None
+
+    def add(self, sid: Optional[str]) -> None:
+        if sid is None:
+            # Lost some bus messages: ask Redis until reloaded
+            self.loaded = False
+            if self._reload is None or self._reload.done():
+                self._reload = asyncio.get_running_loop().create_task(self.load_until_loaded())
+            return
+        self._filter.add(sid)
+        if self._added_while_loading is not None:
+            self._added_while_loading.add(sid)
+
+    def might_be_revoked(self, sid: str) -> bool:
+        return sid in self._filter
+
+    async def load(self) -> bool:
+        """
+        Rebuild the filter from Redis, dropping sessions whose tokens expired.
+
+        Returns:
+            False if Redis could not be read; the filter is then not trusted
+        """
+        self._added_while_loading = set()
+        try:
+            revoked = await redis_client.zrangebyscore(REVOKED_KEY, time.time(), "+inf")
+        except RedisError as exc:
+            logger.warning("Could not load revoked sessions: %s", exc)
+            self.loaded = False
+            return False
+        finally:
+            added, self._added_while_loading = self._added_while_loading, None
+        self._filter = BloomFilter(self.capacity, self.error_rate, [*revoked, *added])
+        self.loaded = True
+        return True
+
+    async def load_until_loaded(self) -> None:
+        """Retry `load` until Redis answers."""
+        while not await self.load():
+            await asyncio.sleep(LOAD_RETRY_SECONDS)
+
+    def start(self) -> None:
+        """Load now and rebuild once per access-token lifetime."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._rebuild_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._reload is not None:
+            self._reload.cancel()
+            self._reload = None
+
+    async def _rebuild_loop(self) -> None:
+        while True:
+            await self.load_until_loaded()
+            await asyncio.sleep(access_ttl())
+
+
+revocations = RevocationFilter(
+    settings.REVOCATION_BLOOM_CAPACITY,
+    settings.REVOCATION_BLOOM_ERROR_RATE
+)
+invalidation_bus.subscribe(SESSION_TOPIC, revocations.add)
+
+
+async def is_session_revoked(sid: str) -> bool:
+    """
+    Bloom filter first; Redis only confirms the (rare) filter hits.
+
+    Until the filter is loaded (the worker started while Redis was down, or
+    lost bus messages) every session is looked up in Redis directly, while
+    `load_until_loaded` keeps retrying in the background. A session is
+    treated as revoked only if that lookup fails as well.
+    """
+    if revocations.loaded and not revocations.might_be_revoked(sid):
+        return False
+    try:
+        expires_at = await redis_client.zscore(REVOKED_KEY, sid)
+    except RedisError as exc:
+        logger.warning("Could not confirm revocation of session %s: %s", sid, exc)
+        return True
+    return expires_at is not None and expires_at > time.time()
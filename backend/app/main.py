@@ -3,30 +3,95 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.database import init_db
-from app.api.routes import auth, boards, lists, cards  # ← THÊM lists, cards
+from app.core.invalidation import invalidation_bus
+from app.core.redis import close_redis
+from app.core.token_store import revocations
+from app.api.dependencies.idempotency import IdempotentReplay, idempotent_replay_handler
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.slow_queries import SlowQueryRouteMiddleware
+from app.middleware.content_negotiation import MessagePackMiddleware
+from app.middleware.query_count import QueryCountMiddleware
+from app.services.activity import activity_log
+from app.services.archive import archive_scheduler
+from app.services.board_stats import board_stats_repair
+from app.services.reminders import reminder_scheduler
+from app.services.write_behind import write_behind
+from app.utils.media_types import NegotiatedResponse
+from app.api.routes import auth, boards, lists, cards, dashboard  # ← THÊM lists, cards
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 Starting up...")
     await init_db()
+    await invalidation_bus.start()
+    revocations.start()
+    activity_log.start()
+    if settings.WRITE_BEHIND_ENABLED:
+        write_behind.start()
+    if settings.ARCHIVE_ENABLED:
+        archive_scheduler.start()
+    if settings.BOARD_STATS_REPAIR_ENABLED:
+        board_stats_repair.start()
+    if settings.REMINDERS_ENABLED:
+        reminder_scheduler.start()
     yield
     print("🛑 Shutting down...")
+    await reminder_scheduler.stop()
+    await board_stats_repair.stop()
+    await archive_scheduler.stop()
+    if settings.WRITE_BEHIND_ENABLED:
+        await write_behind.stop()
+    await activity_log.stop()
+    await revocations.stop()
+    await invalidation_bus.stop()
+    await close_redis()
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description=settings.DESCRIPTION,
+    default_response_class=NegotiatedResponse,
     lifespan=lifespan
 )
 
+app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
+
+# Replays are stored as JSON and re-encoded for MessagePack clients on the way out
+app.add_middleware(IdempotencyMiddleware)
+# Re-encoding runs inside compression, so MessagePack bodies get compressed too
+app.add_middleware(MessagePackMiddleware)
+app.add_middleware(CompressionMiddleware)
+
+app.add_middleware(SlowQueryRouteMiddleware)
+
+# Debug-only: report MongoDB commands per request in X-Query-Count
+if settings.DEBUG:
+    app.add_middleware(QueryCountMiddleware)
+
+# Profiles cover every other middleware too
+app.add_middleware(ProfilingMiddleware)
+
+# Outermost, so responses sent by middlewares (profiles, malformed
+# MessagePack bodies) carry the CORS headers as well
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Query-Count",
+        "Idempotent-Replayed",
+        "X-Profiled-Status",
+        "Retry-After",
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+        "X-RateLimit-Reset",
+    ],
 )
 
 # Include routers
@@ -34,6 +99,7 @@ app.include_router(auth.router, prefix="/api")
 app.include_router(boards.router, prefix="/api")
 app.include_router(lists.router, prefix="/api")  # ← THÊM lists
 app.include_router(cards.router, prefix="/api")  # ← THÊM cards
+app.include_router(dashboard.router, prefix="/api")
 
 
 @app.get("/")
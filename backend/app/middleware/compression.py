@@ -0,0 +1,99 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.utils.compression import ENCODERS, compress, negotiate_encoding
+
+# Bodies that are already compressed gain nothing from another pass
+UNCOMPRESSIBLE_TYPES = ("image/", "video/", "audio/", "application/zip", "application/gzip")
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd, brotli or gzip, negotiated per request.
+
+    Bodies smaller than `settings.COMPRESSION_MIN_SIZE` and responses that
+    already carry a Content-Encoding (e.g. pre-compressed board snapshots)
+    are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await CompressionResponder(self.app, encoding)(scope, receive, send)
+
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str):
+        self.app = app
+        self.encoding = encoding
+        self.send: Send = None
+        self.start_message: Message = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk shows the size
+            message["headers"] = list(message.get("headers", []))
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or content_type.startswith(UNCOMPRESSIBLE_TYPES)
+            )
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body and len(body) < settings.COMPRESSION_MIN_SIZE:
+                self.passthrough = True
+                await self._flush_start()
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                compressed = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await self._flush_start()
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming response: compress chunk by chunk
+            del headers["Content-Length"]
+            self.encoder = ENCODERS[self.encoding]()
+            await self._flush_start()
+
+        compressed = self.encoder.compress(body)
+        if not more_body:
+            compressed += self.encoder.flush()
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def _flush_start(self):
+        if self.start_message is not None:
+            await self.send(self.start_message)
+            self.start_message = None
@@ -0,0 +1,88 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.media_types import (
+    JSON_TYPE, MSGPACK_TYPE, is_msgpack, json_to_msgpack, msgpack_available, negotiate_media_type
+)
+
+
+def add_vary_accept(headers: MutableHeaders) -> None:
+    vary = [token.strip().lower() for token in headers.get("vary", "").split(",")]
+    if "accept" not in vary:
+        headers.add_vary_header("Accept")
+
+
+class MessagePackMiddleware:
+    """
+    Keep responses the routes did not encode themselves in the negotiated type.
+
+    Routes pack MessagePack directly (`MessagePackRoute`); this covers the
+    JSON responses built elsewhere (error handlers, idempotent replays) by
+    re-encoding them when the Accept header prefers `application/msgpack`.
+    Responses that are already MessagePack pass through untouched. Must run
+    inside CompressionMiddleware so the re-encoded body is what gets
+    compressed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not msgpack_available():
+            await self.app(scope, receive, send)
+            return
+
+        media_type = negotiate_media_type(Headers(scope=scope).get("accept"))
+        await MessagePackResponder(self.app, media_type)(scope, receive, send)
+
+
+class MessagePackResponder:
+    def __init__(self, app: ASGIApp, media_type: str):
+        self.app = app
+        self.media_type = media_type
+        self.send: Send = None
+        self.start_message: Message = None
+        self.chunks = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_encoded)
+
+    async def send_encoded(self, message: Message):
+        if message["type"] == "http.response.start":
+            message["headers"] = list(message.get("headers", []))
+            headers = MutableHeaders(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if content_type.startswith(JSON_TYPE) or is_msgpack(content_type):
+                # Caches must not hand one client's encoding to another
+                add_vary_accept(headers)
+                if (
+                    self.media_type == MSGPACK_TYPE
+                    and content_type.startswith(JSON_TYPE)
+                    and "content-encoding" not in headers
+                ):
+                    # Hold the headers until the whole body is re-encoded
+                    self.start_message = message
+                    self.chunks = []
+                    return
+            await self.send(message)
+            return
+
+        if self.chunks is None or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        body = b"".join(self.chunks)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if body:
+            try:
+                body = json_to_msgpack(body)
+                headers["Content-Type"] = MSGPACK_TYPE
+                headers["Content-Length"] = str(len(body))
+            except ValueError:
+                pass  # Not actually JSON: send it as it came
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": body})
@@ -0,0 +1,43 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.api.dependencies.idempotency import SCOPE_KEY, complete
+
+
+class IdempotencyMiddleware:
+    """
+    Store the responses of requests that claimed an Idempotency-Key.
+
+    The `idempotent` route dependency claims the key; this records what the
+    route answered so a retry can be replayed, or releases the claim when
+    the route failed. Must run inside MessagePackMiddleware so the stored
+    body is the route's own JSON.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or "idempotency-key" not in Headers(scope=scope):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        content_type = ""
+        chunks = []
+
+        async def send_recorded(message: Message):
+            nonlocal status_code, content_type
+            if SCOPE_KEY in scope:
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    content_type = Headers(raw=message.get("headers", [])).get("content-type", "")
+                elif message["type"] == "http.response.body":
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_recorded)
+        finally:
+            claim = scope.pop(SCOPE_KEY, None)
+            if claim is not None:
+                await complete(claim, status_code, content_type, b"".join(chunks))
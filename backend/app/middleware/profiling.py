@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.api.dependencies.auth import access_token_subject
+from app.core.config import settings
+from app.models.user import User
+
+# pyinstrument is optional: without it the profile flag is ignored.
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+except ImportError:  # pragma: no cover
+    Profiler = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+PROFILE_PARAM = "profile"
+
+# format -> (renderer, media type, file extension)
+FORMATS = {
+    "speedscope": (lambda: SpeedscopeRenderer(), "application/json", "speedscope.json"),
+    "html": (lambda: HTMLRenderer(), "text/html; charset=utf-8", "html"),
+}
+DEFAULT_FORMAT = "speedscope"
+
+
+def requested_format(scope: Scope) -> Optional[str]:
+    """
+    Profile format asked for through the `X-Profile` header or `?profile=`.
+
+    Returns:
+        A key of FORMATS, or None when the request is not to be profiled
+    """
+    value = Headers(scope=scope).get(PROFILE_HEADER)
+    if value is None:
+        values = parse_qs(scope.get("query_string", b"").decode()).get(PROFILE_PARAM)
+        if not values:
+            return None
+        value = values[0]
+    value = value.strip().lower()
+    if value in ("", "1", "true"):
+        return DEFAULT_FORMAT
+    return value if value in FORMATS else None
+
+
+async def is_superuser(scope: Scope) -> bool:
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    user_id = await access_token_subject(token)
+    if user_id is None:
+        return False
+    user = await User.get(user_id)
+    return user is not None and user.is_active and user.is_superuser
+
+
+class ProfilingMiddleware:
+    """
+    Profile a single request on demand, for superusers only.
+
+    A request sent with `X-Profile: speedscope|html` (or `?profile=...`) by a
+    superuser runs under a sampling profiler, and the profile replaces the
+    response: a speedscope JSON document (open it at speedscope.app) or
+    pyinstrument's HTML flame view. The route's own status code is kept in
+    `X-Profiled-Status`. With `settings.PROFILING_DIR` set, each profile is
+    also written there. Everyone else, and every request without the flag,
+    passes straight through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or Profiler is None or not settings.PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        profile_format = requested_format(scope)
+        if profile_format is None or not await is_superuser(scope):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def discard(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        # async_mode attributes time spent awaiting (e.g. MongoDB) to the await
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL_SECONDS, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        make_renderer, media_type, extension = FORMATS[profile_format]
+        body = profiler.output(renderer=make_renderer()).encode()
+        name = profile_name(scope, extension)
+        headers = MutableHeaders()
+        headers["Content-Type"] = media_type
+        headers["Content-Length"] = str(len(body))
+        headers["Content-Disposition"] = f'attachment; filename="{name}"'
+        headers["X-Profiled-Status"] = str(status_code)
+        if settings.PROFILING_DIR:
+            await asyncio.to_thread(store_profile, name, body)
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+
+def profile_name(scope: Scope, extension: str) -> str:
+    path = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-") or "root"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method'].lower()}-{path}.{extension}"
+
+
+def store_profile(name: str, body: bytes) -> None:
+    directory = Path(settings.PROFILING_DIR)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / name).write_bytes(body)
+    except OSError as exc:
+        logger.warning("Could not store profile %s: %s", name, exc)
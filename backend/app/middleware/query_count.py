@@ -0,0 +1,34 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.query_counter import track_queries
+
+QUERY_COUNT_HEADER = b"x-query-count"
+
+
+class QueryCountMiddleware:
+    """
+    Expose the number of MongoDB commands issued by a request.
+
+    Adds an `X-Query-Count` header to every HTTP response. Only meant for
+    debug builds; see `settings.DEBUG` in `app.main`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as counter:
+
+            async def send_with_count(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (QUERY_COUNT_HEADER, str(counter.count).encode())
+                    )
+                    message["headers"] = headers
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
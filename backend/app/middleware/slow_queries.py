@@ -0,0 +1,17 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.slow_queries import tag_queries
+
+
+class SlowQueryRouteMiddleware:
+    """Tag the MongoDB commands of each request with its method and path for the slow-query log."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with tag_queries(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
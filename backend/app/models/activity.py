@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Dict
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from app.core.config import settings
+
+
+class ActivityEvent(Document):
+    """
+    One entry of a board's activity history. Append-only: written in
+    batches by services/activity and removed by the TTL index after
+    ACTIVITY_RETENTION_DAYS.
+    """
+    board_id: str
+    actor_id: str  # User who made the change
+    action: str  # e.g. card.created, list.deleted
+    entity_id: str  # ID of the card, list or board the action is about
+    details: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "activity"
+        indexes = [
+            IndexModel([("board_id", ASCENDING), ("_id", DESCENDING)]),
+            IndexModel(
+                [("created_at", ASCENDING)],
+                expireAfterSeconds=settings.ACTIVITY_RETENTION_DAYS * 24 * 3600
+            ),
+        ]
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional, List
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from app.models.card import ChecklistItem
+
+
+class ArchivedCard(Document):
+    """
+    Card moved out of the hot `cards` collection.
+
+    Keeps the card's _id so it can be restored unchanged. board_id is copied
+    from the card's list at archive time so the archive can be browsed per
+    board without touching `lists`.
+    """
+    title: str = Field(..., min_length=3, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
+    labels: List[str] = Field(default_factory=list)
+    due_date: Optional[datetime] = None
+    checklist: List[ChecklistItem] = Field(default_factory=list)
+    order: int = Field(default=0, ge=0)
+    list_id: str
+    board_id: Optional[str] = None
+    revision: int = Field(default=0, ge=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+    archive_reason: str = "manual"  # manual | completed | stale
+
+    class Settings:
+        name = "cards_archive"
+        indexes = [
+            IndexModel([("board_id", ASCENDING), ("archived_at", DESCENDING)]),
+            IndexModel([("list_id", ASCENDING)]),
+        ]
@@ -10,6 +10,9 @@ class Board(Document):
     description: Optional[str] = Field(None, max_length=200)
     background_color: str = Field(default="#3b82f6")  # Default blue
     owner_id: Indexed(str)  # Reference to User
+    is_template: bool = False  # Starting point for new boards, see /duplicate
+    revision: int = Field(default=0, ge=0)  # Bumped on every content edit
+    card_count: int = Field(default=0, ge=0)  # Maintained with $inc, see services/counters
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from beanie import Document
+from pydantic import Field
+
+
+class BoardDocument(Document):
+    """
+    A whole board in one document, for BOARD_STORAGE_MODE=embedded.
+
+    `_id` is the board's id. Each entry of `lists` is a list document (its
+    `_id` an ObjectId) with a `cards` array holding that list's card
+    documents. Neither array is kept sorted; readers sort by `order`.
+    Maintained with positional updates by services/embedded_boards.
+
+    `writes` counts the mirrored writes; a stub that has it but no `lists`
+    marks a board whose document must be rebuilt.
+    """
+    lists: List[Dict[str, Any]] = Field(default_factory=list)
+    writes: int = 0
+    embedded_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "board_documents"
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Dict
+from beanie import Document, Indexed
+from pydantic import Field
+
+
+class BoardStats(Document):
+    """
+    Per-board counters, kept up to date with $inc by the card and list
+    routes (see services/board_stats) and rebuilt from `cards` by the
+    repair job.
+
+    due_counts buckets cards by due day (UTC, "YYYY-MM-DD") so overdue
+    counts stay correct as time passes without any write.
+    """
+    board_id: Indexed(str, unique=True)
+    card_count: int = 0
+    list_counts: Dict[str, int] = Field(default_factory=dict)  # list_id -> cards
+    due_counts: Dict[str, int] = Field(default_factory=dict)  # due day -> cards
+    checklist_total: int = 0
+    checklist_completed: int = 0
+    rebuilt_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "board_stats"
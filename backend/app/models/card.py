@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
 from beanie import Document, Indexed
-from pydantic import Field, BaseModel
+from pydantic import Field, BaseModel, model_validator
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 
 class ChecklistItem(BaseModel):
@@ -18,13 +19,32 @@ class Card(Document):
     labels: List[str] = Field(default_factory=list)
     due_date: Optional[datetime] = None
     checklist: List[ChecklistItem] = Field(default_factory=list)  # NEW
+    # Kept in step with `checklist` so board views can skip the array
+    checklist_total: int = Field(default=0, ge=0)
+    checklist_completed: int = Field(default=0, ge=0)
     order: int = Field(default=0, ge=0)
     list_id: Indexed(str)
+    revision: int = Field(default=0, ge=0)  # Bumped on every content edit
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @model_validator(mode="after")
+    def count_checklist(self) -> "Card":
+        self.checklist_total = len(self.checklist)
+        self.checklist_completed = sum(1 for item in self.checklist if item.completed)
+        return self
+
     class Settings:
         name = "cards"
+        indexes = [
+            # Per-list "due soonest" / "changed last" lookups of the dashboard
+            IndexModel([("list_id", ASCENDING), ("due_date", ASCENDING)]),
+            IndexModel([("list_id", ASCENDING), ("updated_at", DESCENDING)]),
+            # Range scans of the reminder scheduler
+            IndexModel([("due_date", ASCENDING)]),
+            # Age scans of the archive policy
+            IndexModel([("updated_at", ASCENDING)]),
+        ]
 
     class Config:
         json_schema_extra = {
@@ -9,6 +9,7 @@ class List(Document):
     title: str = Field(..., min_length=3, max_length=50)
     order: int = Field(default=0, ge=0)  # Greater or equal to 0
     board_id: Indexed(str)  # Reference to Board
+    revision: int = Field(default=0, ge=0)  # Bumped on every content edit
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
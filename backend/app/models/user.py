@@ -10,6 +10,7 @@ class User(Document):
     full_name: Optional[str] = None
     is_active: bool = True
     is_superuser: bool = False
+    board_count: int = Field(default=0, ge=0)  # Maintained with $inc, see services/counters
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -0,0 +1,224 @@
+"""
+Repository interfaces for users, boards, lists and cards.
+
+Routes load and store these documents through a `Repositories` bundle (see
+api/dependencies/repositories) rather than through Beanie. The app always
+runs on `mongo`; tests and benchmarks of route logic override the dependency
+with `memory`. Both hand out the Beanie models, so routes and serializers
+are the same for either.
+
+The repositories cover the documents' own writes, including the
+revision-checked updates of boards, lists and cards and the checklist item
+updates. The services maintaining quota counters, board stats, the embedded
+board documents, the archive and the activity log still talk to MongoDB
+directly, and so do cascade deletes.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List as ListType, Optional, Tuple
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+
+# (id, new order) pairs of a reorder request, ids already validated
+Orders = ListType[Tuple[str, int]]
+
+
+class UserRepository(ABC):
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[User]:
+        ...
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        ...
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[User]:
+        ...
+
+    @abstractmethod
+    async def insert(self, user: User) -> User:
+        """Store a new user, assigning its id."""
+
+
+class BoardRepository(ABC):
+    @abstractmethod
+    async def get(self, board_id: str) -> Optional[Board]:
+        ...
+
+    @abstractmethod
+    async def for_owner(self, owner_id: str) -> ListType[Board]:
+        """Boards owned by a user."""
+
+    @abstractmethod
+    async def ids_for_owner(self, owner_id: str) -> ListType[str]:
+        """IDs of the boards owned by a user."""
+
+    @abstractmethod
+    async def insert(self, board: Board) -> Board:
+        """Store a new board, assigning its id."""
+
+    @abstractmethod
+    async def update(
+        self, board_id: str, owner_id: str, changes: Dict[str, Any], revision: Optional[int] = None
+    ) -> Optional[Board]:
+        """
+        Set `changes` on a board of `owner_id` and bump its revision, only
+        while the board is at `revision` (at any revision when None).
+
+        Returns the updated board, None when nothing matched.
+        """
+
+    @abstractmethod
+    async def delete(self, board: Board) -> bool:
+        """Delete a board; False when it was already gone."""
+
+
+class ListRepository(ABC):
+    @abstractmethod
+    async def get(self, list_id: str) -> Optional[List]:
+        ...
+
+    @abstractmethod
+    async def for_board(self, board_id: str) -> ListType[List]:
+        """Lists of a board, sorted by order."""
+
+    @abstractmethod
+    async def max_order(self, board_id: str) -> int:
+        """Highest order of a board's lists, -1 for a board without lists."""
+
+    @abstractmethod
+    async def insert(self, lst: List) -> List:
+        """Store a new list, assigning its id."""
+
+    @abstractmethod
+    async def update(
+        self,
+        list_id: str,
+        board_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[List]:
+        """
+        Set `changes` on a list of one of `board_ids` and bump its revision,
+        only while the list is at `revision` (at any revision when None).
+
+        Returns the updated list, None when nothing matched.
+        """
+
+    @abstractmethod
+    async def set_orders(self, board_id: str, orders: Orders, now: datetime) -> None:
+        """Reorder lists of a board; ids of other boards' lists are ignored."""
+
+
+class CardRepository(ABC):
+    @abstractmethod
+    async def get(self, card_id: str) -> Optional[Card]:
+        ...
+
+    @abstractmethod
+    async def for_lists(self, list_ids: Iterable[str]) -> ListType[Card]:
+        """Cards of several lists, sorted by order."""
+
+    @abstractmethod
+    async def summaries_for_lists(self, list_ids: Iterable[str]) -> ListType[Dict[str, Any]]:
+        """
+        What the board shows of the cards of several lists, sorted by order.
+
+        Raw documents without description and checklist items, but with
+        `checklist_total` and `checklist_completed`.
+        """
+
+    @abstractmethod
+    async def positions_for_list(self, list_id: str) -> ListType[Dict[str, Any]]:
+        """
+        Where a list's cards are, sorted by order.
+
+        Raw documents of `_id`, `order` and `list_id` only.
+        """
+
+    @abstractmethod
+    async def max_order(self, list_id: str) -> int:
+        """Highest order of a list's cards, -1 for an empty list."""
+
+    @abstractmethod
+    async def insert(self, card: Card) -> Card:
+        """Store a new card, assigning its id."""
+
+    @abstractmethod
+    async def update(
+        self,
+        card_id: str,
+        list_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[Card]:
+        """
+        Set `changes` on a card of one of `list_ids` and bump its revision,
+        only while the card is at `revision` (at any revision when None).
+
+        Returns the card as it was before the update, None when nothing
+        matched.
+        """
+
+    @abstractmethod
+    async def delete(self, card: Card) -> bool:
+        """Delete a card; False when it was already gone."""
+
+    @abstractmethod
+    async def set_orders(self, list_id: str, orders: Orders, now: datetime) -> None:
+        """Reorder cards of a list; ids of other lists' cards are ignored."""
+
+    @abstractmethod
+    async def move(self, card: Card, list_id: str, order: int, now: datetime) -> None:
+        """Move a card to a list and position, updating `card` as well."""
+
+    @abstractmethod
+    async def add_checklist_item(self, card_id: str, item: Dict[str, Any], now: datetime) -> bool:
+        """
+        Append an item to a card's checklist, keeping its checklist counters.
+
+        Returns False when the card is gone or already has an item with that id.
+        """
+
+    @abstractmethod
+    async def update_checklist_item(
+        self, card_id: str, item_id: str, changes: Dict[str, Any], now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Set `changes` on one checklist item, keeping the checklist counters.
+
+        Returns the item as it was before, None when the card has no such item.
+        """
+
+    @abstractmethod
+    async def delete_checklist_item(
+        self, card_id: str, item_id: str, now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Remove one checklist item, keeping the checklist counters.
+
+        Returns the removed item, None when the card has no such item.
+        """
+
+    @abstractmethod
+    async def reorder_checklist(
+        self, card_id: str, item_ids: ListType[str], now: datetime
+    ) -> Optional[ListType[Dict[str, Any]]]:
+        """
+        Put a card's checklist in the order of `item_ids`.
+
+        Returns the reordered checklist, None when the card is gone or
+        `item_ids` does not name every item exactly once.
+        """
+
+
+@dataclass
+class Repositories:
+    users: UserRepository
+    boards: BoardRepository
+    lists: ListRepository
+    cards: CardRepository
@@ -0,0 +1,355 @@
+"""
+In-memory repositories, for tests and benchmarks of route logic.
+
+Documents are held by id in dicts, with secondary indexes for the lookups
+routes make (email, username, owner, board, list). Lists of a board and
+cards of a list are kept in SortedKeyLists ordered by (order, id), so
+reading a board is a merge of already sorted runs and reordering touches
+only the moved entries. Reads return copies, like a database would.
+
+Nothing is persisted and nothing is shared between processes.
+"""
+import heapq
+from datetime import datetime
+from typing import Any, Dict, Iterable, List as ListType, Optional, Type
+from beanie import Document, PydanticObjectId
+from beanie.odm.settings.document import DocumentSettings
+from bson import ObjectId
+from sortedcontainers import SortedKeyList
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+from app.repositories.base import (
+    BoardRepository, CardRepository, ListRepository, Orders, Repositories, UserRepository
+)
+
+
+def bind_models(*models: Type[Document]) -> None:
+    """
+    Let Beanie documents be built without `init_beanie`.
+
+    Beanie refuses to instantiate a document whose collection was never
+    initialised; give such models their settings, without a collection.
+    Models already initialised against MongoDB are left alone.
+    """
+    for model in models:
+        if model._document_settings is None:
+            settings = {
+                key: value for key, value in vars(getattr(model, "Settings", object)).items()
+                if not key.startswith("__")
+            }
+            model._document_settings = DocumentSettings.model_validate(settings)
+
+
+def _key(value: str) -> Optional[PydanticObjectId]:
+    return PydanticObjectId(value) if ObjectId.is_valid(value) else None
+
+
+def _position(document) -> tuple:
+    return document.order, document.id
+
+
+def _copy(document):
+    return document.model_copy(deep=True) if document is not None else None
+
+
+def _revision_matches(document, revision: Optional[int]) -> bool:
+    return revision is None or document.revision == revision
+
+
+def _updated(document, changes: Dict[str, Any]):
+    """A new version of `document` with `changes` set and its revision bumped."""
+    return type(document).model_validate(
+        {**document.model_dump(), **changes, "revision": document.revision + 1}
+    )
+
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self):
+        self._by_id: Dict[PydanticObjectId, User] = {}
+        self._by_email: Dict[str, User] = {}
+        self._by_username: Dict[str, User] = {}
+
+    async def get(self, user_id: str) -> Optional[User]:
+        return _copy(self._by_id.get(_key(user_id)))
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return _copy(self._by_email.get(email))
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return _copy(self._by_username.get(username))
+
+    async def insert(self, user: User) -> User:
+        user.id = user.id or PydanticObjectId()
+        stored = _copy(user)
+        self._by_id[user.id] = stored
+        self._by_email[user.email] = stored
+        self._by_username[user.username] = stored
+        return user
+
+
+class InMemoryBoardRepository(BoardRepository):
+    def __init__(self):
+        self._by_id: Dict[PydanticObjectId, Board] = {}
+        self._by_owner: Dict[str, ListType[Board]] = {}
+
+    async def get(self, board_id: str) -> Optional[Board]:
+        return _copy(self._by_id.get(_key(board_id)))
+
+    async def for_owner(self, owner_id: str) -> ListType[Board]:
+        return [_copy(board) for board in self._by_owner.get(owner_id, [])]
+
+    async def ids_for_owner(self, owner_id: str) -> ListType[str]:
+        return [str(board.id) for board in self._by_owner.get(owner_id, [])]
+
+    async def insert(self, board: Board) -> Board:
+        board.id = board.id or PydanticObjectId()
+        stored = _copy(board)
+        self._by_id[board.id] = stored
+        self._by_owner.setdefault(board.owner_id, []).append(stored)
+        return board
+
+    async def update(
+        self, board_id: str, owner_id: str, changes: Dict[str, Any], revision: Optional[int] = None
+    ) -> Optional[Board]:
+        stored = self._by_id.get(_key(board_id))
+        if stored is None or stored.owner_id != owner_id or not _revision_matches(stored, revision):
+            return None
+        updated = _updated(stored, changes)
+        self._by_id[updated.id] = updated
+        boards = self._by_owner[owner_id]
+        boards[boards.index(stored)] = updated
+        return _copy(updated)
+
+    async def delete(self, board: Board) -> bool:
+        stored = self._by_id.pop(board.id, None)
+        if stored is None:
+            return False
+        self._by_owner[stored.owner_id].remove(stored)
+        return True
+
+
+class InMemoryListRepository(ListRepository):
+    def __init__(self):
+        self._by_id: Dict[PydanticObjectId, List] = {}
+        self._by_board: Dict[str, SortedKeyList] = {}
+
+    def _board(self, board_id: str) -> SortedKeyList:
+        return self._by_board.setdefault(board_id, SortedKeyList(key=_position))
+
+    async def get(self, list_id: str) -> Optional[List]:
+        return _copy(self._by_id.get(_key(list_id)))
+
+    async def for_board(self, board_id: str) -> ListType[List]:
+        return [_copy(lst) for lst in self._by_board.get(board_id, ())]
+
+    async def max_order(self, board_id: str) -> int:
+        lists = self._by_board.get(board_id)
+        return lists[-1].order if lists else -1
+
+    async def insert(self, lst: List) -> List:
+        lst.id = lst.id or PydanticObjectId()
+        stored = _copy(lst)
+        self._by_id[lst.id] = stored
+        self._board(lst.board_id).add(stored)
+        return lst
+
+    async def update(
+        self,
+        list_id: str,
+        board_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[List]:
+        stored = self._by_id.get(_key(list_id))
+        if stored is None or stored.board_id not in set(board_ids) or not _revision_matches(stored, revision):
+            return None
+        updated = _updated(stored, changes)
+        self._by_id[updated.id] = updated
+        self._board(stored.board_id).remove(stored)
+        self._board(updated.board_id).add(updated)
+        return _copy(updated)
+
+    async def set_orders(self, board_id: str, orders: Orders, now: datetime) -> None:
+        lists = self._board(board_id)
+        for list_id, order in orders:
+            stored = self._by_id.get(_key(list_id))
+            if stored is None or stored.board_id != board_id:
+                continue
+            lists.remove(stored)
+            stored.order, stored.updated_at = order, now
+            lists.add(stored)
+
+
+class InMemoryCardRepository(CardRepository):
+    def __init__(self):
+        self._by_id: Dict[PydanticObjectId, Card] = {}
+        self._by_list: Dict[str, SortedKeyList] = {}
+
+    def _list(self, list_id: str) -> SortedKeyList:
+        return self._by_list.setdefault(list_id, SortedKeyList(key=_position))
+
+    def _sorted(self, list_ids: Iterable[str]) -> Iterable[Card]:
+        runs = [self._by_list[list_id] for list_id in list_ids if list_id in self._by_list]
+        return heapq.merge(*runs, key=_position)
+
+    async def get(self, card_id: str) -> Optional[Card]:
+        return _copy(self._by_id.get(_key(card_id)))
+
+    async def for_lists(self, list_ids: Iterable[str]) -> ListType[Card]:
+        return [_copy(card) for card in self._sorted(list_ids)]
+
+    async def summaries_for_lists(self, list_ids: Iterable[str]) -> ListType[Dict[str, Any]]:
+        return [
+            {
+                "_id": card.id,
+                "title": card.title,
+                "labels": list(card.labels),
+                "due_date": card.due_date,
+                "order": card.order,
+                "list_id": card.list_id,
+                "revision": card.revision,
+                "checklist_total": card.checklist_total,
+                "checklist_completed": card.checklist_completed,
+            }
+            for card in self._sorted(list_ids)
+        ]
+
+    async def positions_for_list(self, list_id: str) -> ListType[Dict[str, Any]]:
+        return [
+            {"_id": card.id, "order": card.order, "list_id": card.list_id}
+            for card in self._sorted([list_id])
+        ]
+
+    async def max_order(self, list_id: str) -> int:
+        cards = self._by_list.get(list_id)
+        return cards[-1].order if cards else -1
+
+    async def insert(self, card: Card) -> Card:
+        card.id = card.id or PydanticObjectId()
+        stored = _copy(card)
+        self._by_id[card.id] = stored
+        self._list(card.list_id).add(stored)
+        return card
+
+    async def delete(self, card: Card) -> bool:
+        stored = self._by_id.pop(card.id, None)
+        if stored is None:
+            return False
+        self._list(stored.list_id).remove(stored)
+        return True
+
+    def _replace(self, stored: Card, updated: Card) -> None:
+        self._by_id[updated.id] = updated
+        self._list(stored.list_id).remove(stored)
+        self._list(updated.list_id).add(updated)
+
+    async def update(
+        self,
+        card_id: str,
+        list_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[Card]:
+        stored = self._by_id.get(_key(card_id))
+        if stored is None or stored.list_id not in set(list_ids) or not _revision_matches(stored, revision):
+            return None
+        self._replace(stored, _updated(stored, changes))
+        return stored  # Detached from the indexes, so it is already a copy
+
+    async def set_orders(self, list_id: str, orders: Orders, now: datetime) -> None:
+        cards = self._list(list_id)
+        for card_id, order in orders:
+            stored = self._by_id.get(_key(card_id))
+            if stored is None or stored.list_id != list_id:
+                continue
+            cards.remove(stored)
+            stored.order, stored.updated_at = order, now
+            cards.add(stored)
+
+    async def move(self, card: Card, list_id: str, order: int, now: datetime) -> None:
+        card.list_id, card.order, card.updated_at = list_id, order, now
+        stored = self._by_id.get(card.id)
+        if stored is None:
+            return
+        self._list(stored.list_id).remove(stored)
+        stored.list_id, stored.order, stored.updated_at = list_id, order, now
+        self._list(list_id).add(stored)
+
+    def _checklist_item(self, card_id: str, item_id: str):
+        """A card and the index of one of its checklist items, (None, None) if missing."""
+        stored = self._by_id.get(_key(card_id))
+        if stored is not None:
+            for index, item in enumerate(stored.checklist):
+                if item.id == item_id:
+                    return stored, index
+        return None, None
+
+    async def add_checklist_item(self, card_id: str, item: Dict[str, Any], now: datetime) -> bool:
+        stored = self._by_id.get(_key(card_id))
+        if stored is None or any(existing.id == item["id"] for existing in stored.checklist):
+            return False
+        self._replace(stored, _updated(stored, {
+            "checklist": [*stored.model_dump()["checklist"], item],
+            "checklist_total": stored.checklist_total + 1,
+            "checklist_completed": stored.checklist_completed + int(item["completed"]),
+            "updated_at": now,
+        }))
+        return True
+
+    async def update_checklist_item(
+        self, card_id: str, item_id: str, changes: Dict[str, Any], now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        stored, index = self._checklist_item(card_id, item_id)
+        if stored is None:
+            return None
+        checklist = stored.model_dump()["checklist"]
+        previous = checklist[index]
+        checklist[index] = {**previous, **changes}
+        completed = int(checklist[index]["completed"]) - int(previous["completed"])
+        self._replace(stored, _updated(stored, {
+            "checklist": checklist,
+            "checklist_completed": stored.checklist_completed + completed,
+            "updated_at": now,
+        }))
+        return previous
+
+    async def delete_checklist_item(
+        self, card_id: str, item_id: str, now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        stored, index = self._checklist_item(card_id, item_id)
+        if stored is None:
+            return None
+        checklist = stored.model_dump()["checklist"]
+        previous = checklist.pop(index)
+        self._replace(stored, _updated(stored, {
+            "checklist": checklist,
+            "checklist_total": stored.checklist_total - 1,
+            "checklist_completed": stored.checklist_completed - int(previous["completed"]),
+            "updated_at": now,
+        }))
+        return previous
+
+    async def reorder_checklist(
+        self, card_id: str, item_ids: ListType[str], now: datetime
+    ) -> Optional[ListType[Dict[str, Any]]]:
+        stored = self._by_id.get(_key(card_id))
+        if stored is None:
+            return None
+        items = {item["id"]: item for item in stored.model_dump()["checklist"]}
+        if len(item_ids) != len(items) or set(item_ids) != set(items):
+            return None
+        checklist = [items[item_id] for item_id in item_ids]
+        self._replace(stored, _updated(stored, {"checklist": checklist, "updated_at": now}))
+        return checklist
+
+
+def memory_repositories() -> Repositories:
+    bind_models(User, Board, List, Card)
+    return Repositories(
+        users=InMemoryUserRepository(),
+        boards=InMemoryBoardRepository(),
+        lists=InMemoryListRepository(),
+        cards=InMemoryCardRepository(),
+    )
@@ -0,0 +1,327 @@
+"""MongoDB repositories, on the Beanie models."""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List as ListType, Optional, Tuple, Type
+from beanie import Document
+from beanie.odm.queries.update import UpdateResponse
+from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+from app.repositories.base import (
+    BoardRepository, CardRepository, ListRepository, Orders, Repositories, UserRepository
+)
+
+# What a reorder needs of a card
+CARD_POSITION_FIELDS = {"order": 1, "list_id": 1}
+
+# What a card needs on the board: no description, no checklist items
+CARD_SUMMARY_FIELDS = {
+    "title": 1,
+    "labels": 1,
+    "due_date": 1,
+    "order": 1,
+    "list_id": 1,
+    "revision": 1,
+    # Cards last written before the counters existed count their checklist here
+    "checklist_total": {"$ifNull": ["$checklist_total", {"$size": {"$ifNull": ["$checklist", []]}}]},
+    "checklist_completed": {"$ifNull": ["$checklist_completed", {"$size": {"$filter": {
+        "input": {"$ifNull": ["$checklist", []]},
+        "cond": {"$eq": ["$$this.completed", True]}
+    }}}]},
+}
+
+
+def revision_filter(revision: int):
+    """Match an expected revision; documents written before revisions existed count as 0."""
+    return {"$in": [0, None]} if revision == 0 else revision
+
+
+async def conditional_update(
+    model: Type[Document],
+    query: Dict[str, Any],
+    changes: Dict[str, Any],
+    revision: Optional[int],
+    response_type: UpdateResponse
+):
+    """`$set` changes and bump the revision of the document matching `query` and `revision`."""
+    if revision is not None:
+        query["revision"] = revision_filter(revision)
+    return await model.find_one(query).update(
+        {"$set": changes, "$inc": {"revision": 1}},
+        response_type=response_type
+    )
+
+
+async def update_pinned_item(
+    card_id: ObjectId,
+    item_id: str,
+    update_for: Callable[[Optional[bool]], Dict[str, Any]],
+    states: Tuple[Optional[bool], ...] = (False, True),
+    array_filters: Optional[ListType[dict]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply a positional update to one checklist item.
+
+    The filter pins the item's current `completed` state (each of `states`
+    is tried in turn; None matches any), and `update_for(state)` builds the
+    update for that state, so the `$inc` of the card's checklist counters
+    it carries is exact even under concurrent toggles.
+
+    Returns:
+        The item as it was before the update, or None when the card has no
+        such item
+    """
+    collection = Card.get_motor_collection()
+    while True:
+        for completed in states:
+            item_filter: Dict[str, Any] = {"id": item_id}
+            if completed is not None:
+                item_filter["completed"] = completed
+            previous = await collection.find_one_and_update(
+                {"_id": card_id, "checklist": {"$elemMatch": item_filter}},
+                update_for(completed),
+                array_filters=array_filters,
+                projection={"checklist": {"$elemMatch": {"id": item_id}}},
+                return_document=ReturnDocument.BEFORE
+            )
+            if previous is not None:
+                return previous["checklist"][0]
+        # Every state missed: the item is gone, or was toggled between tries
+        if not await collection.count_documents({"_id": card_id, "checklist.id": item_id}, limit=1):
+            return None
+
+
+class MongoUserRepository(UserRepository):
+    async def get(self, user_id: str) -> Optional[User]:
+        return await User.get(user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await User.find_one(User.email == email)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return await User.find_one(User.username == username)
+
+    async def insert(self, user: User) -> User:
+        return await user.insert()
+
+
+class MongoBoardRepository(BoardRepository):
+    async def get(self, board_id: str) -> Optional[Board]:
+        return await Board.get(board_id)
+
+    async def for_owner(self, owner_id: str) -> ListType[Board]:
+        return await Board.find(Board.owner_id == owner_id).to_list()
+
+    async def ids_for_owner(self, owner_id: str) -> ListType[str]:
+        # Bounded by MAX_BOARDS_PER_USER and served by the owner_id index
+        board_ids = await Board.distinct("_id", {"owner_id": owner_id})
+        return [str(board_id) for board_id in board_ids]
+
+    async def insert(self, board: Board) -> Board:
+        return await board.insert()
+
+    async def update(
+        self, board_id: str, owner_id: str, changes: Dict[str, Any], revision: Optional[int] = None
+    ) -> Optional[Board]:
+        return await conditional_update(
+            Board, {"_id": ObjectId(board_id), "owner_id": owner_id}, changes, revision,
+            UpdateResponse.NEW_DOCUMENT
+        )
+
+    async def delete(self, board: Board) -> bool:
+        result = await board.delete()
+        return bool(result and result.deleted_count)
+
+
+class MongoListRepository(ListRepository):
+    async def get(self, list_id: str) -> Optional[List]:
+        return await List.get(list_id)
+
+    async def for_board(self, board_id: str) -> ListType[List]:
+        return await List.find(List.board_id == board_id).sort("+order").to_list()
+
+    async def max_order(self, board_id: str) -> int:
+        last = await List.find(List.board_id == board_id).sort(-List.order).first_or_none()
+        return last.order if last else -1
+
+    async def insert(self, lst: List) -> List:
+        return await lst.insert()
+
+    async def update(
+        self,
+        list_id: str,
+        board_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[List]:
+        return await conditional_update(
+            List, {"_id": ObjectId(list_id), "board_id": {"$in": list(board_ids)}}, changes, revision,
+            UpdateResponse.NEW_DOCUMENT
+        )
+
+    async def set_orders(self, board_id: str, orders: Orders, now: datetime) -> None:
+        # One round trip; lists of other boards never match the filter
+        updates = [
+            UpdateOne(
+                {"_id": ObjectId(list_id), "board_id": board_id},
+                {"$set": {"order": order, "updated_at": now}}
+            )
+            for list_id, order in orders
+        ]
+        if updates:
+            await List.get_motor_collection().bulk_write(updates, ordered=False)
+
+
+class MongoCardRepository(CardRepository):
+    async def get(self, card_id: str) -> Optional[Card]:
+        return await Card.get(card_id)
+
+    async def for_lists(self, list_ids: Iterable[str]) -> ListType[Card]:
+        return await Card.find({"list_id": {"$in": list(list_ids)}}).sort("+order").to_list()
+
+    async def summaries_for_lists(self, list_ids: Iterable[str]) -> ListType[Dict[str, Any]]:
+        # Projected raw documents: less to transfer and nothing to hydrate
+        return await Card.get_motor_collection().aggregate([
+            {"$match": {"list_id": {"$in": list(list_ids)}}},
+            {"$sort": {"order": 1}},
+            {"$project": CARD_SUMMARY_FIELDS}
+        ]).to_list(None)
+
+    async def positions_for_list(self, list_id: str) -> ListType[Dict[str, Any]]:
+        return await Card.get_motor_collection().find(
+            {"list_id": list_id}, CARD_POSITION_FIELDS
+        ).sort("order", 1).to_list(None)
+
+    async def max_order(self, list_id: str) -> int:
+        last = await Card.find(Card.list_id == list_id).sort(-Card.order).first_or_none()
+        return last.order if last else -1
+
+    async def insert(self, card: Card) -> Card:
+        return await card.insert()
+
+    async def delete(self, card: Card) -> bool:
+        result = await card.delete()
+        return bool(result and result.deleted_count)
+
+    async def update(
+        self,
+        card_id: str,
+        list_ids: Iterable[str],
+        changes: Dict[str, Any],
+        revision: Optional[int] = None
+    ) -> Optional[Card]:
+        return await conditional_update(
+            Card, {"_id": ObjectId(card_id), "list_id": {"$in": list(list_ids)}}, changes, revision,
+            UpdateResponse.OLD_DOCUMENT
+        )
+
+    async def set_orders(self, list_id: str, orders: Orders, now: datetime) -> None:
+        # One round trip; cards of other lists never match the filter
+        updates = [
+            UpdateOne(
+                {"_id": ObjectId(card_id), "list_id": list_id},
+                {"$set": {"order": order, "updated_at": now}}
+            )
+            for card_id, order in orders
+        ]
+        if updates:
+            await Card.get_motor_collection().bulk_write(updates, ordered=False)
+
+    async def move(self, card: Card, list_id: str, order: int, now: datetime) -> None:
+        # Only the position fields are written
+        await card.set({Card.list_id: list_id, Card.order: order, Card.updated_at: now})
+
+    async def add_checklist_item(self, card_id: str, item: Dict[str, Any], now: datetime) -> bool:
+        # Only the new item is written; the counters follow in the same update
+        result = await Card.get_motor_collection().update_one(
+            {"_id": ObjectId(card_id), "checklist.id": {"$ne": item["id"]}},
+            {
+                "$push": {"checklist": item},
+                "$inc": {
+                    "checklist_total": 1,
+                    "checklist_completed": int(item["completed"]),
+                    "revision": 1
+                },
+                "$set": {"updated_at": now}
+            }
+        )
+        return result.matched_count == 1
+
+    async def update_checklist_item(
+        self, card_id: str, item_id: str, changes: Dict[str, Any], now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        completed = changes.get("completed")
+
+        def item_update(current: Optional[bool]) -> Dict[str, Any]:
+            counters: Dict[str, Any] = {"revision": 1}
+            if completed is not None and current is not None and completed != current:
+                counters["checklist_completed"] = 1 if completed else -1
+            return {
+                "$set": {
+                    **{f"checklist.$[item].{field}": value for field, value in changes.items()},
+                    "updated_at": now
+                },
+                "$inc": counters
+            }
+
+        return await update_pinned_item(
+            ObjectId(card_id), item_id, item_update,
+            # Without a toggle the counters stay, whatever the item's state
+            states=(None,) if completed is None else (not completed, completed),
+            array_filters=[{"item.id": item_id}]
+        )
+
+    async def delete_checklist_item(
+        self, card_id: str, item_id: str, now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        return await update_pinned_item(
+            ObjectId(card_id), item_id,
+            lambda completed: {
+                "$pull": {"checklist": {"id": item_id}},
+                "$inc": {
+                    "checklist_total": -1,
+                    "checklist_completed": -int(completed),
+                    "revision": 1
+                },
+                "$set": {"updated_at": now}
+            }
+        )
+
+    async def reorder_checklist(
+        self, card_id: str, item_ids: ListType[str], now: datetime
+    ) -> Optional[ListType[Dict[str, Any]]]:
+        # The one checklist write that rewrites the whole array, in a pipeline
+        # update; items added or removed meanwhile make the filter miss
+        updated = await Card.get_motor_collection().find_one_and_update(
+            {
+                "_id": ObjectId(card_id),
+                "checklist": {"$size": len(item_ids)},
+                "checklist.id": {"$all": item_ids}
+            },
+            [{"$set": {
+                "checklist": {"$map": {
+                    "input": {"$literal": item_ids},
+                    "as": "item_id",
+                    "in": {"$first": {"$filter": {
+                        "input": "$checklist",
+                        "cond": {"$eq": ["$$this.id", "$$item_id"]}
+                    }}}
+                }},
+                "updated_at": now,
+                "revision": {"$add": [{"$ifNull": ["$revision", 0]}, 1]}
+            }}],
+            projection={"checklist": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        return updated["checklist"] if updated else None
+
+
+def mongo_repositories() -> Repositories:
+    return Repositories(
+        users=MongoUserRepository(),
+        boards=MongoBoardRepository(),
+        lists=MongoListRepository(),
+        cards=MongoCardRepository(),
+    )
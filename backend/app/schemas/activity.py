@@ -0,0 +1,38 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class ActivityEventResponse(BaseModel):
+    """Schema for one entry of a board's activity log"""
+    id: str
+    board_id: str
+    actor_id: str
+    action: str  # e.g. "card.created", "list.deleted"
+    entity_id: str
+    details: Dict[str, Any] = {}
+    created_at: str
+
+
+class ActivityFeedResponse(BaseModel):
+    """Schema for a page of a board's activity log, newest first"""
+    events: List[ActivityEventResponse]
+    next_before: Optional[str] = None  # Pass as `before` to get the next page
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "events": [
+                    {
+                        "id": "65a1f77bcf86cd7994390200",
+                        "board_id": "507f1f77bcf86cd799439011",
+                        "actor_id": "507f1f77bcf86cd799439012",
+                        "action": "card.moved",
+                        "entity_id": "507f1f77bcf86cd799439013",
+                        "details": {"from_list_id": "507f1f77bcf86cd799439014",
+                                    "to_list_id": "507f1f77bcf86cd799439015"},
+                        "created_at": "2024-12-13T00:00:00"
+                    }
+                ],
+                "next_before": None
+            }
+        }
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -25,13 +25,32 @@ class BoardUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=3, max_length=50)
     description: Optional[str] = Field(None, max_length=200)
     background_color: Optional[str] = None
+    is_template: Optional[bool] = None
+    revision: Optional[int] = Field(None, ge=0)  # Expected revision; 409 if it changed
 
     class Config:
         json_schema_extra = {
             "example": {
                 "title": "Updated Project Name",
                 "description": "Updated description",
-                "background_color": "#ef4444"
+                "background_color": "#ef4444",
+                "revision": 3
+            }
+        }
+
+
+class BoardDuplicate(BaseModel):
+    """Schema for duplicating a board or creating a board from a template"""
+    title: Optional[str] = Field(None, min_length=3, max_length=50)
+    include_cards: bool = True
+    as_template: bool = False
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "title": "Sprint 12",
+                "include_cards": True,
+                "as_template": False
             }
         }
 
@@ -44,6 +63,8 @@ class BoardResponse(BaseModel):
     description: Optional[str]
     background_color: str
     owner_id: str
+    is_template: bool = False
+    revision: int = 0
     created_at: str
     updated_at: str
 
@@ -83,3 +104,31 @@ class BoardListResponse(BaseModel):
                 "total": 1
             }
         }
+
+
+class BoardStatsResponse(BaseModel):
+    """Schema for board statistics"""
+    board_id: str
+    card_count: int
+    list_counts: Dict[str, int]  # list_id -> number of cards
+    overdue_count: int  # Due before today (UTC)
+    due_today_count: int
+    checklist_total: int
+    checklist_completed: int
+    checklist_completion: float  # 0.0-1.0; 0.0 without checklist items
+    updated_at: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "board_id": "507f1f77bcf86cd799439011",
+                "card_count": 12,
+                "list_counts": {"507f1f77bcf86cd799439012": 7, "507f1f77bcf86cd799439013": 5},
+                "overdue_count": 2,
+                "due_today_count": 1,
+                "checklist_total": 20,
+                "checklist_completed": 15,
+                "checklist_completion": 0.75,
+                "updated_at": "2024-01-01T00:00:00"
+            }
+        }
@@ -40,6 +40,7 @@ class CardUpdate(BaseModel):
     due_date: Optional[datetime] = None
     checklist: Optional[List[ChecklistItemSchema]] = None
     order: Optional[int] = Field(None, ge=0)
+    revision: Optional[int] = Field(None, ge=0)  # Expected revision; 409 if it changed
 
     class Config:
         json_schema_extra = {
@@ -48,7 +49,8 @@ class CardUpdate(BaseModel):
                 "description": "Updated description",
                 "labels": ["green"],
                 "due_date": "2024-12-31T23:59:59",
-                "order": 1
+                "order": 1,
+                "revision": 3
             }
         }
 
@@ -83,6 +85,45 @@ class CardMove(BaseModel):
         }
 
 
+class ChecklistItemCreate(BaseModel):
+    """Schema for adding a checklist item"""
+    id: Optional[str] = Field(None, min_length=1, max_length=64)
+    text: str = Field(..., min_length=1, max_length=200)
+    completed: bool = Field(default=False)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "text": "Write README"
+            }
+        }
+
+
+class ChecklistItemUpdate(BaseModel):
+    """Schema for editing or toggling a checklist item"""
+    text: Optional[str] = Field(None, min_length=1, max_length=200)
+    completed: Optional[bool] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "completed": True
+            }
+        }
+
+
+class ChecklistReorder(BaseModel):
+    """Schema for reordering checklist items; must list every item once"""
+    item_ids: List[str]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "item_ids": ["2", "1", "3"]
+            }
+        }
+
+
 # Response schemas
 class CardResponse(BaseModel):
     """Schema for card response"""
@@ -94,6 +135,7 @@ class CardResponse(BaseModel):
     checklist: List[ChecklistItemSchema]
     order: int
     list_id: str
+    revision: int = 0
     created_at: str
     updated_at: str
 
@@ -111,3 +153,56 @@ class CardResponse(BaseModel):
                 "updated_at": "2024-12-13T00:00:00"
             }
         }
+
+
+class CardSummaryResponse(BaseModel):
+    """Schema for a card as shown on the board; details via GET /cards/{card_id}"""
+    id: str
+    title: str
+    labels: List[str]
+    due_date: Optional[str]
+    checklist_total: int = 0
+    checklist_completed: int = 0
+    order: int
+    list_id: str
+    revision: int = 0
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "507f1f77bcf86cd799439011",
+                "title": "Write documentation",
+                "labels": ["red", "blue"],
+                "due_date": "2024-12-31T23:59:59",
+                "checklist_total": 2,
+                "checklist_completed": 1,
+                "order": 0,
+                "list_id": "507f1f77bcf86cd799439012",
+                "revision": 3
+            }
+        }
+
+
+class ArchivedCardResponse(CardResponse):
+    """Schema for a card in the archive"""
+    board_id: Optional[str]
+    archived_at: str
+    archive_reason: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "507f1f77bcf86cd799439011",
+                "title": "Write documentation",
+                "description": "Create comprehensive API docs",
+                "labels": ["red", "blue"],
+                "due_date": "2024-12-31T23:59:59",
+                "order": 0,
+                "list_id": "507f1f77bcf86cd799439012",
+                "board_id": "507f1f77bcf86cd799439013",
+                "created_at": "2024-12-13T00:00:00",
+                "updated_at": "2024-12-13T00:00:00",
+                "archived_at": "2025-01-13T00:00:00",
+                "archive_reason": "completed"
+            }
+        }
@@ -0,0 +1,63 @@
+from typing import List, Optional
+from pydantic import BaseModel
+from app.schemas.activity import ActivityEventResponse
+from app.schemas.board import BoardResponse
+
+
+class DashboardBoard(BoardResponse):
+    """A board with the counters shown on its dashboard tile"""
+    list_count: int = 0
+    card_count: int = 0
+    overdue_count: int = 0
+    due_today_count: int = 0
+    checklist_total: int = 0
+    checklist_completed: int = 0
+
+
+class DashboardCard(BaseModel):
+    """A card shown on the dashboard, with where it lives"""
+    id: str
+    title: str
+    labels: List[str] = []
+    due_date: Optional[str] = None
+    updated_at: str
+    list_id: str
+    list_title: str
+    board_id: str
+    board_title: str
+
+
+class DashboardResponse(BaseModel):
+    """Schema for the dashboard: every board plus cards across boards"""
+    boards: List[DashboardBoard]
+    upcoming: List[DashboardCard]  # Due from now on, soonest first
+    recently_updated: List[DashboardCard]  # Most recently changed cards
+    recent_activity: List[ActivityEventResponse]  # Latest events of the boards, newest first
+    generated_at: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "boards": [{
+                    "id": "507f1f77bcf86cd799439011",
+                    "title": "My Project",
+                    "description": "Project management board",
+                    "background_color": "#3b82f6",
+                    "owner_id": "507f1f77bcf86cd799439012",
+                    "is_template": False,
+                    "revision": 3,
+                    "created_at": "2024-01-01T00:00:00",
+                    "updated_at": "2024-01-01T00:00:00",
+                    "list_count": 3,
+                    "card_count": 12,
+                    "overdue_count": 1,
+                    "due_today_count": 2,
+                    "checklist_total": 8,
+                    "checklist_completed": 5
+                }],
+                "upcoming": [],
+                "recently_updated": [],
+                "recent_activity": [],
+                "generated_at": "2024-01-01T00:00:00"
+            }
+        }
@@ -21,12 +21,14 @@ class ListUpdate(BaseModel):
     """Schema for updating a list"""
     title: Optional[str] = Field(None, min_length=3, max_length=50)
     order: Optional[int] = Field(None, ge=0)
+    revision: Optional[int] = Field(None, ge=0)  # Expected revision; 409 if it changed
 
     class Config:
         json_schema_extra = {
             "example": {
                 "title": "In Progress",
-                "order": 1
+                "order": 1,
+                "revision": 3
             }
         }
 
@@ -54,6 +56,7 @@ class ListResponse(BaseModel):
     title: str
     order: int
     board_id: str
+    revision: int = 0
     created_at: str
     updated_at: str
 
@@ -76,6 +79,7 @@ class ListWithCardsResponse(BaseModel):
     title: str
     order: int
     board_id: str
+    revision: int = 0
     created_at: str
     updated_at: str
     cards: list = []  # Will be populated with CardResponse
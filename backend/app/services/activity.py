@@ -0,0 +1,214 @@
+"""
+Board activity log with buffered writes.
+
+Routes call `record_activity` after a change; the event is appended to an
+in-process buffer and the request returns without waiting for MongoDB. The
+buffer is written with one insert_many when it reaches ACTIVITY_FLUSH_SIZE
+events or every ACTIVITY_FLUSH_INTERVAL_SECONDS, whichever comes first, and
+once more on shutdown.
+
+Event IDs are ObjectIds minted when the event is recorded, so the feed
+orders buffered and stored events the same way, and a batch retried after a
+partial failure never stores an event twice.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List as ListType, Optional
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, PyMongoError
+from app.core.config import settings
+from app.models.activity import ActivityEvent
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class ActivityBuffer:
+    """In-process buffer of activity events, flushed in batches."""
+
+    def __init__(self, flush_size: int, flush_interval: float, max_pending: int):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: ListType[dict] = []
+        self._in_flight: ListType[dict] = []
+        self._flushing: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def record(
+        self,
+        board_id: str,
+        actor_id: str,
+        action: str,
+        entity_id: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        now = datetime.utcnow()
+        self._pending.append({
+            "_id": ObjectId(),
+            "board_id": board_id,
+            "actor_id": actor_id,
+            "action": action,
+            "entity_id": entity_id,
+            "details": details or {},
+            # MongoDB keeps milliseconds; drop the rest so the feed reads
+            # the same before and after the flush
+            "created_at": now.replace(microsecond=now.microsecond // 1000 * 1000)
+        })
+        self._trim()
+        if len(self._pending) >= self.flush_size:
+            self._schedule()
+
+    def _trim(self) -> None:
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped += overflow
+            logger.warning("Activity buffer full, dropped %d events", overflow)
+
+    def pending_for(self, *board_ids: str) -> ListType[dict]:
+        """Events of these boards not yet stored, newest first."""
+        wanted = set(board_ids)
+        return [
+            event for event in reversed(self._in_flight + self._pending)
+            if event["board_id"] in wanted
+        ]
+
+    def discard(self, board_id: str) -> None:
+        """Forget the buffered events of a board."""
+        self._pending = [event for event in self._pending if event["board_id"] != board_id]
+
+    def _schedule(self) -> asyncio.Task:
+        """Start a write unless one is running; returns the running one."""
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.get_running_loop().create_task(self._write())
+        return self._flushing
+
+    async def flush(self) -> int:
+        """Write every buffered event now. Returns the number written."""
+        if self._flushing is not None and not self._flushing.done():
+            await self._flushing
+        return await self._schedule()
+
+    async def _write(self) -> int:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        self._in_flight = batch
+        failed: ListType[dict] = []
+        try:
+            await ActivityEvent.get_motor_collection().insert_many(batch, ordered=False)
+        except BulkWriteError as exc:
+            # Duplicates were stored by an earlier, partly failed attempt
+            failed = [
+                batch[error["index"]]
+                for error in exc.details.get("writeErrors", [])
+                if error["code"] != DUPLICATE_KEY_ERROR
+            ]
+        except PyMongoError as exc:
+            logger.warning("Could not write %d activity events: %s", len(batch), exc)
+            failed = batch
+        finally:
+            self._in_flight = []
+        if failed:
+            # Keep them for the next flush, ahead of newer events
+            self._pending[:0] = failed
+            self._trim()
+        return len(batch) - len(failed)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the timer and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Activity flush failed")
+
+
+activity_log = ActivityBuffer(
+    flush_size=settings.ACTIVITY_FLUSH_SIZE,
+    flush_interval=settings.ACTIVITY_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.ACTIVITY_MAX_PENDING
+)
+
+
+def record_activity(
+    board_id: str,
+    actor_id: str,
+    action: str,
+    entity_id: str,
+    **details: Any
+) -> None:
+    """Add an event to a board's history without waiting for the write."""
+    activity_log.record(board_id, actor_id, action, entity_id, details)
+
+
+async def delete_board_activity(board_id: str) -> None:
+    """Drop the history of a deleted board, stored and buffered."""
+    activity_log.discard(board_id)
+    await ActivityEvent.get_motor_collection().delete_many({"board_id": board_id})
+
+
+async def board_activity(
+    board_id: str, before: Optional[str] = None, limit: int = 50
+) -> ListType[dict]:
+    """
+    A page of a board's history, newest first, including events still in
+    this process's buffer.
+
+    Args:
+        board_id: Board whose history to read
+        before: Only events older than this event ID (the previous page's last)
+        limit: Maximum number of events
+    """
+    query: Dict[str, Any] = {"board_id": board_id}
+    if before is not None:
+        query["_id"] = {"$lt": ObjectId(before)}
+    stored = await ActivityEvent.get_motor_collection().find(query).sort(
+        "_id", -1
+    ).limit(limit).to_list(limit)
+
+    pending = [
+        event for event in activity_log.pending_for(board_id)
+        if before is None or event["_id"] < ObjectId(before)
+    ]
+    return _newest(stored, pending, limit)
+
+
+async def recent_activity(board_ids: ListType[str], limit: int) -> ListType[dict]:
+    """
+    The latest events across several boards, newest first, including events
+    still in this process's buffer. Served by the (board_id, _id) index.
+    """
+    if not board_ids:
+        return []
+    stored = await ActivityEvent.get_motor_collection().find(
+        {"board_id": {"$in": board_ids}}
+    ).sort("_id", -1).limit(limit).to_list(limit)
+    return _newest(stored, activity_log.pending_for(*board_ids), limit)
+
+
+def _newest(stored: ListType[dict], pending: ListType[dict], limit: int) -> ListType[dict]:
+    """Merge stored and buffered events; a flushed event may be in both."""
+    events = {event["_id"]: event for event in stored}
+    for event in pending:
+        events.setdefault(event["_id"], event)
+    return sorted(events.values(), key=lambda event: event["_id"], reverse=True)[:limit]
@@ -0,0 +1,184 @@
+"""
+Card archive: moves cards between the hot `cards` collection and the cold
+`cards_archive` collection.
+
+Cards are moved in batches of ARCHIVE_BATCH_SIZE: each batch is copied into
+the archive and then deleted from `cards`. If a run dies between the two
+steps the next run finds the copies already archived (duplicate _id) and
+just finishes the delete, so moving a card never loses or duplicates it.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List as ListType, Optional
+from beanie import PydanticObjectId
+from beanie.operators import In
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from app.core.config import settings
+from app.models.archived_card import ArchivedCard
+from app.models.card import Card
+from app.models.list import List
+from app.services.board_stats import apply_stats_delta, card_delta, merge_deltas
+from app.services.counters import release_card_slots, reserve_card_slots
+from app.services.embedded_boards import embed_card, remove_embedded_cards
+from app.services.jobs import PeriodicJob
+from app.utils.board_versions import board_versions
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+POLICY_LOCK_KEY = "archive:policy:lock"
+
+
+async def _board_ids(list_ids: ListType[str]) -> Dict[str, str]:
+    """Map list IDs to their board IDs."""
+    object_ids = [PydanticObjectId(i) for i in list_ids if ObjectId.is_valid(i)]
+    lists = await List.find(In(List.id, object_ids)).to_list()
+    return {str(lst.id): lst.board_id for lst in lists}
+
+
+async def _insert_ignoring_duplicates(collection, documents: ListType[dict]) -> None:
+    """insert_many that treats already-present _ids as success."""
+    try:
+        await collection.insert_many(documents, ordered=False)
+    except BulkWriteError as exc:
+        errors = exc.details.get("writeErrors", [])
+        if any(error["code"] != DUPLICATE_KEY_ERROR for error in errors):
+            raise
+
+
+async def archive_cards(
+    query: Dict[str, Any],
+    reason: str = "manual",
+    batch_size: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Move every card matching `query` into the archive.
+
+    Args:
+        query: Raw MongoDB filter on the `cards` collection
+        reason: Stored as archive_reason (manual, completed or stale)
+        batch_size: Cards moved per round trip (default ARCHIVE_BATCH_SIZE)
+
+    Returns:
+        Dict of {board_id: number of cards archived}
+    """
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cards = Card.get_motor_collection()
+    archive = ArchivedCard.get_motor_collection()
+    archived: Dict[str, int] = {}
+    stats: Dict[str, Dict[str, int]] = {}
+    card_ids: Dict[str, ListType[Any]] = {}
+
+    while True:
+        batch = await cards.find(query).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+
+        boards = await _board_ids(list({doc["list_id"] for doc in batch}))
+        now = datetime.utcnow()
+        for doc in batch:
+            doc["board_id"] = boards.get(doc["list_id"])
+            doc["archived_at"] = now
+            doc["archive_reason"] = reason
+
+        await _insert_ignoring_duplicates(archive, batch)
+        await cards.delete_many({"_id": {"$in": [doc["_id"] for doc in batch]}})
+
+        for doc in batch:
+            if doc["board_id"]:
+                archived[doc["board_id"]] = archived.get(doc["board_id"], 0) + 1
+                card_ids.setdefault(doc["board_id"], []).append(doc["_id"])
+                stats[doc["board_id"]] = merge_deltas(
+                    stats.get(doc["board_id"], {}), card_delta(doc, -1)
+                )
+
+        if len(batch) < batch_size:
+            break
+
+    for board_id, count in archived.items():
+        await release_card_slots(board_id, count)
+        await apply_stats_delta(board_id, stats[board_id])
+        await remove_embedded_cards(board_id, card_ids[board_id])
+        board_versions.bump(board_id)
+    return archived
+
+
+async def restore_card(archived: ArchivedCard) -> Optional[Card]:
+    """
+    Move an archived card back to the end of its list.
+
+    The caller checks that the list still exists. Returns None, leaving the
+    card archived, if the board is at MAX_CARDS_PER_BOARD.
+    """
+    if archived.board_id and not await reserve_card_slots(archived.board_id):
+        return None
+
+    last = await Card.find(Card.list_id == archived.list_id).sort(-Card.order).first_or_none()
+
+    card = Card(
+        id=archived.id,
+        title=archived.title,
+        description=archived.description,
+        labels=archived.labels,
+        due_date=archived.due_date,
+        checklist=archived.checklist,
+        order=last.order + 1 if last else 0,
+        list_id=archived.list_id,
+        revision=archived.revision,
+        created_at=archived.created_at
+    )
+    try:
+        await card.insert()
+        if archived.board_id:
+            await apply_stats_delta(archived.board_id, card_delta(card))
+    except DuplicateKeyError:
+        # Restored by an earlier attempt that did not finish the delete
+        if archived.board_id:
+            await release_card_slots(archived.board_id)
+        card = await Card.get(archived.id)
+    await ArchivedCard.get_motor_collection().delete_one({"_id": archived.id})
+    if archived.board_id:
+        if card is not None:
+            await embed_card(archived.board_id, card)
+        board_versions.bump(archived.board_id)
+
+    return card
+
+
+def policy_queries(now: datetime) -> Dict[str, Dict[str, Any]]:
+    """
+    Filters of the scheduled archive policy, keyed by archive reason.
+
+    - completed: checklist is non-empty and every item is done, and the card
+      has not been touched for ARCHIVE_COMPLETED_AFTER_DAYS
+    - stale: card has not been touched for ARCHIVE_STALE_AFTER_DAYS
+    """
+    queries = {}
+    if settings.ARCHIVE_COMPLETED_AFTER_DAYS > 0:
+        queries["completed"] = {
+            "updated_at": {"$lt": now - timedelta(days=settings.ARCHIVE_COMPLETED_AFTER_DAYS)},
+            "checklist.0": {"$exists": True},
+            "checklist": {"$not": {"$elemMatch": {"completed": False}}},
+        }
+    if settings.ARCHIVE_STALE_AFTER_DAYS > 0:
+        queries["stale"] = {
+            "updated_at": {"$lt": now - timedelta(days=settings.ARCHIVE_STALE_AFTER_DAYS)},
+        }
+    return queries
+
+
+async def run_archive_policy() -> int:
+    """Archive every card the policy selects. Returns the number archived."""
+    total = 0
+    for reason, query in policy_queries(datetime.utcnow()).items():
+        archived = await archive_cards(query, reason=reason)
+        total += sum(archived.values())
+    if total:
+        logger.info("Archived %d cards", total)
+    return total
+
+
+archive_scheduler = PeriodicJob(
+    "archive", settings.ARCHIVE_INTERVAL_SECONDS, run_archive_policy, lock_key=POLICY_LOCK_KEY
+)
@@ -0,0 +1,124 @@
+"""
+Server-side board duplication.
+
+A copy is written with a handful of bulk commands instead of one request per
+list and card: the board is inserted, then all of its lists in one
+insert_many, then the cards in chunks of COPY_CHUNK_SIZE streamed straight
+from a cursor. Every copied document gets a fresh ObjectId and cards are
+re-pointed at the new list IDs.
+
+The new board is invisible to other requests until this returns, so a failed
+copy is simply deleted again.
+"""
+from datetime import datetime
+from typing import Dict, List as ListType, Optional
+from bson import ObjectId
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+
+COPY_CHUNK_SIZE = 1000
+
+
+async def _copy_lists(source_id: str, board_id: str, now: datetime) -> Dict[str, str]:
+    """Copy the lists of a board; returns {old list ID: new list ID}."""
+    lists = List.get_motor_collection()
+    documents = await lists.find({"board_id": source_id}).sort("order", 1).to_list(None)
+    id_map: Dict[str, str] = {}
+    for doc in documents:
+        new_id = ObjectId()
+        id_map[str(doc["_id"])] = str(new_id)
+        doc.update(_id=new_id, board_id=board_id, revision=0, created_at=now, updated_at=now)
+    if documents:
+        await lists.insert_many(documents)
+    return id_map
+
+
+async def _copy_cards(id_map: Dict[str, str], now: datetime) -> int:
+    """Copy the cards of the mapped lists in chunks; returns how many were copied."""
+    if not id_map:
+        return 0
+    cards = Card.get_motor_collection()
+    cursor = cards.find({"list_id": {"$in": list(id_map)}}).batch_size(COPY_CHUNK_SIZE)
+    copied = 0
+    chunk: ListType[dict] = []
+    async for doc in cursor:
+        doc.update(
+            _id=ObjectId(),
+            list_id=id_map[doc["list_id"]],
+            revision=0,
+            created_at=now,
+            updated_at=now
+        )
+        chunk.append(doc)
+        if len(chunk) == COPY_CHUNK_SIZE:
+            await cards.insert_many(chunk)
+            copied += len(chunk)
+            chunk = []
+    if chunk:
+        await cards.insert_many(chunk)
+        copied += len(chunk)
+    return copied
+
+
+async def _delete_copy(board_id: str, list_ids: ListType[str]) -> None:
+    """Remove a partially written copy."""
+    await Card.get_motor_collection().delete_many({"list_id": {"$in": list_ids}})
+    await List.get_motor_collection().delete_many({"board_id": board_id})
+    await Board.get_motor_collection().delete_one({"_id": ObjectId(board_id)})
+
+
+async def duplicate_board(
+    source: Board,
+    owner_id: str,
+    title: Optional[str] = None,
+    include_cards: bool = True,
+    as_template: bool = False
+) -> Board:
+    """
+    Copy a board with its lists and, optionally, its cards.
+
+    The caller checks ownership and reserves the owner's board slot.
+
+    Args:
+        source: Board to copy (a regular board or a template)
+        owner_id: Owner of the new board
+        title: Title of the new board (default: the source title, prefixed
+            with "Copy of" unless the source is a template)
+        include_cards: Copy cards as well as lists
+        as_template: Mark the new board as a template
+
+    Returns:
+        The new board, with card_count set
+    """
+    if title is None:
+        title = source.title if source.is_template else f"Copy of {source.title}"[:50]
+
+    now = datetime.utcnow()
+    board = Board(
+        title=title,
+        description=source.description,
+        background_color=source.background_color,
+        owner_id=owner_id,
+        is_template=as_template,
+        created_at=now,
+        updated_at=now
+    )
+    await board.insert()
+    board_id = str(board.id)
+
+    id_map: Dict[str, str] = {}
+    try:
+        id_map = await _copy_lists(str(source.id), board_id, now)
+        if include_cards:
+            board.card_count = await _copy_cards(id_map, now)
+            if board.card_count:
+                await Board.get_motor_collection().update_one(
+                    {"_id": board.id},
+                    {"$set": {"card_count": board.card_count}}
+                )
+    except Exception:
+        await _delete_copy(board_id, list(id_map.values()))
+        raise
+
+    return board
@@ -0,0 +1,167 @@
+"""
+Board statistics maintained incrementally.
+
+Every card contributes 1 to its board's card_count, to its list's count and
+to its due day's bucket, and its checklist items to checklist_total and
+checklist_completed. The card and list routes turn each mutation into one
+$inc of the contributions that changed, so reading the stats of a board is a
+single document fetch.
+
+Boards without a stats document (created before stats existed) get one the
+first time their stats are read. rebuild_board_stats recomputes a board from
+`cards` with one aggregation; besides first reads it runs after bulk deletes
+and from the periodic repair job, which also undoes any drift caused by an
+increment racing a rebuild.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+from app.core.config import settings
+from app.models.board import Board
+from app.models.board_stats import BoardStats
+from app.models.card import Card
+from app.models.list import List
+from app.services.jobs import PeriodicJob
+
+logger = logging.getLogger(__name__)
+
+Delta = Dict[str, int]
+
+
+def due_day(due_date: Optional[datetime]) -> Optional[str]:
+    """Bucket key of a due date: its UTC day as YYYY-MM-DD."""
+    if due_date is None:
+        return None
+    if due_date.tzinfo is not None:
+        due_date = due_date.astimezone(timezone.utc)
+    return due_date.strftime("%Y-%m-%d")
+
+
+def _field(card: Union[Card, Dict[str, Any]], name: str) -> Any:
+    return card.get(name) if isinstance(card, dict) else getattr(card, name)
+
+
+def _completed(item: Any) -> bool:
+    return bool(item.get("completed") if isinstance(item, dict) else item.completed)
+
+
+def card_delta(card: Union[Card, Dict[str, Any]], sign: int = 1) -> Delta:
+    """
+    Contribution of one card (a document or a raw dict) to its board's stats.
+
+    Use sign=-1 for a card that is removed or is about to change.
+    """
+    delta = {"card_count": sign, f"list_counts.{_field(card, 'list_id')}": sign}
+    day = due_day(_field(card, "due_date"))
+    if day:
+        delta[f"due_counts.{day}"] = sign
+    checklist = _field(card, "checklist") or []
+    if checklist:
+        delta["checklist_total"] = sign * len(checklist)
+        delta["checklist_completed"] = sign * sum(1 for item in checklist if _completed(item))
+    return delta
+
+
+def merge_deltas(*deltas: Delta) -> Delta:
+    """Sum deltas, dropping the counters that cancel out."""
+    merged: Delta = {}
+    for delta in deltas:
+        for field, value in delta.items():
+            merged[field] = merged.get(field, 0) + value
+    return {field: value for field, value in merged.items() if value}
+
+
+async def apply_stats_delta(board_id: str, *deltas: Delta) -> None:
+    """
+    Add deltas to a board's stats in one update.
+
+    Boards without a stats document are left alone; their stats are built
+    from scratch when first read.
+    """
+    delta = merge_deltas(*deltas)
+    if not delta:
+        return
+    await BoardStats.get_motor_collection().update_one(
+        {"board_id": board_id},
+        {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}}
+    )
+
+
+async def rebuild_board_stats(board_id: str) -> BoardStats:
+    """Recompute a board's stats from its cards with one aggregation."""
+    lists = await List.get_motor_collection().find(
+        {"board_id": board_id}, {"_id": 1}
+    ).to_list(None)
+    list_ids = [str(lst["_id"]) for lst in lists]
+
+    result = await Card.get_motor_collection().aggregate([
+        {"$match": {"list_id": {"$in": list_ids}}},
+        {"$facet": {
+            "lists": [{
+                "$group": {
+                    "_id": "$list_id",
+                    "cards": {"$sum": 1},
+                    "checklist_total": {
+                        "$sum": {"$size": {"$ifNull": ["$checklist", []]}}
+                    },
+                    "checklist_completed": {
+                        "$sum": {"$size": {"$filter": {
+                            "input": {"$ifNull": ["$checklist", []]},
+                            "cond": {"$eq": ["$$this.completed", True]}
+                        }}}
+                    }
+                }
+            }],
+            "due": [
+                {"$match": {"due_date": {"$type": "date"}}},
+                {"$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$due_date"}},
+                    "cards": {"$sum": 1}
+                }}
+            ]
+        }}
+    ]).to_list(1)
+    facets = result[0] if result else {"lists": [], "due": []}
+
+    now = datetime.utcnow()
+    fields = {
+        "card_count": sum(group["cards"] for group in facets["lists"]),
+        "list_counts": {
+            **{list_id: 0 for list_id in list_ids},
+            **{group["_id"]: group["cards"] for group in facets["lists"]}
+        },
+        "due_counts": {group["_id"]: group["cards"] for group in facets["due"]},
+        "checklist_total": sum(group["checklist_total"] for group in facets["lists"]),
+        "checklist_completed": sum(group["checklist_completed"] for group in facets["lists"]),
+        "rebuilt_at": now,
+        "updated_at": now
+    }
+    await BoardStats.get_motor_collection().update_one(
+        {"board_id": board_id}, {"$set": fields}, upsert=True
+    )
+    return BoardStats(board_id=board_id, **fields)
+
+
+async def get_board_stats(board_id: str) -> BoardStats:
+    """Stats of a board, built on first read."""
+    stats = await BoardStats.find_one(BoardStats.board_id == board_id)
+    return stats or await rebuild_board_stats(board_id)
+
+
+async def delete_board_stats(board_id: str) -> None:
+    await BoardStats.get_motor_collection().delete_one({"board_id": board_id})
+
+
+async def repair_all_board_stats() -> int:
+    """Rebuild the stats of every board. Returns the number of boards."""
+    repaired = 0
+    async for board in Board.get_motor_collection().find({}, {"_id": 1}):
+        await rebuild_board_stats(str(board["_id"]))
+        repaired += 1
+    logger.info("Rebuilt stats of %d boards", repaired)
+    return repaired
+
+
+board_stats_repair = PeriodicJob(
+    "board-stats-repair", settings.BOARD_STATS_REPAIR_INTERVAL_SECONDS, repair_all_board_stats
+)
@@ -0,0 +1,94 @@
+"""
+Counters kept on User (board_count) and Board (card_count) for quota checks.
+
+A slot is reserved with one conditional $inc that only matches while the
+counter is below the limit, so the check and the increment are a single
+atomic write and concurrent creates can never overshoot the quota.
+"""
+from typing import Awaitable, Callable, Type
+from beanie import Document, PydanticObjectId
+from beanie.operators import In
+from app.core.config import settings
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+
+
+async def _reserve(
+    document_cls: Type[Document],
+    doc_id: str,
+    field: str,
+    limit: int,
+    count: int,
+    recount: Callable[[], Awaitable[int]]
+) -> bool:
+    collection = document_cls.get_motor_collection()
+    _id = PydanticObjectId(doc_id)
+
+    result = await collection.update_one(
+        {"_id": _id, field: {"$lte": limit - count}},
+        {"$inc": {field: count}}
+    )
+    if result.modified_count:
+        return True
+
+    # Documents created before the counters existed have no field yet:
+    # count once, then retry the conditional increment
+    backfilled = await collection.update_one(
+        {"_id": _id, field: {"$exists": False}},
+        {"$set": {field: await recount()}}
+    )
+    if not backfilled.modified_count:
+        return False
+
+    result = await collection.update_one(
+        {"_id": _id, field: {"$lte": limit - count}},
+        {"$inc": {field: count}}
+    )
+    return bool(result.modified_count)
+
+
+async def _release(document_cls: Type[Document], doc_id: str, field: str, count: int) -> None:
+    if count <= 0:
+        return
+    await document_cls.get_motor_collection().update_one(
+        {"_id": PydanticObjectId(doc_id), field: {"$gte": count}},
+        {"$inc": {field: -count}}
+    )
+
+
+async def count_user_boards(user_id: str) -> int:
+    return await Board.find(Board.owner_id == user_id).count()
+
+
+async def count_board_cards(board_id: str) -> int:
+    lists = await List.find(List.board_id == board_id).to_list()
+    list_ids = [str(lst.id) for lst in lists]
+    if not list_ids:
+        return 0
+    return await Card.find(In(Card.list_id, list_ids)).count()
+
+
+async def reserve_board_slot(user_id: str) -> bool:
+    """Count one more board for a user; False if MAX_BOARDS_PER_USER is reached."""
+    return await _reserve(
+        User, user_id, "board_count", settings.MAX_BOARDS_PER_USER, 1,
+        lambda: count_user_boards(user_id)
+    )
+
+
+async def release_board_slot(user_id: str) -> None:
+    await _release(User, user_id, "board_count", 1)
+
+
+async def reserve_card_slots(board_id: str, count: int = 1) -> bool:
+    """Count `count` more cards on a board; False if MAX_CARDS_PER_BOARD would be exceeded."""
+    return await _reserve(
+        Board, board_id, "card_count", settings.MAX_CARDS_PER_BOARD, count,
+        lambda: count_board_cards(board_id)
+    )
+
+
+async def release_card_slots(board_id: str, count: int = 1) -> None:
+    await _release(Board, board_id, "card_count", count)
@@ -0,0 +1,154 @@
+"""
+Dashboard: every board of a user with its counters, plus upcoming and
+recently changed cards across those boards, read with one aggregation, and
+the latest activity events of those boards, read with one more query.
+
+The pipeline starts from the user's boards, joins each board's stats
+document and lists, then fans out per list into `cards` through indexed
+lookups that each return at most DASHBOARD_ITEMS cards, so its cost depends
+on the number of lists, not on the number of cards.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List as ListType
+from app.core.config import settings
+from app.models.board import Board
+from app.models.board_stats import BoardStats
+from app.schemas.dashboard import DashboardBoard, DashboardCard, DashboardResponse
+from app.services.activity import recent_activity
+from app.services.board_stats import rebuild_board_stats
+from app.utils.serializers import activity_to_response, board_stats_to_response
+
+CARD_FIELDS = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "title": 1,
+    "labels": 1,
+    "due_date": 1,
+    "updated_at": 1,
+    "list_id": 1,
+}
+
+
+def _cards_facet(match: Dict[str, Any], sort: Dict[str, int], limit: int) -> ListType[dict]:
+    """Top `limit` cards of all non-template boards by `sort`."""
+    sort_key = next(iter(sort))
+    return [
+        {"$match": {"is_template": {"$ne": True}}},
+        {"$unwind": "$lists"},
+        {"$lookup": {
+            "from": "cards",
+            "localField": "lists.list_id",
+            "foreignField": "list_id",
+            "pipeline": [
+                {"$match": match},
+                {"$sort": sort},
+                {"$limit": limit},
+                {"$project": CARD_FIELDS}
+            ],
+            "as": "cards"
+        }},
+        {"$unwind": "$cards"},
+        {"$sort": {f"cards.{sort_key}": sort[sort_key]}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "card": "$cards",
+            "list_title": "$lists.title",
+            "board_id": 1,
+            "board_title": "$title"
+        }}
+    ]
+
+
+def dashboard_pipeline(user_id: str, now: datetime) -> ListType[dict]:
+    limit = settings.DASHBOARD_ITEMS
+    upcoming_until = now + timedelta(days=settings.DASHBOARD_UPCOMING_DAYS)
+    return [
+        {"$match": {"owner_id": user_id}},
+        {"$sort": {"_id": 1}},
+        {"$set": {"board_id": {"$toString": "$_id"}}},
+        {"$lookup": {
+            "from": "board_stats",
+            "localField": "board_id",
+            "foreignField": "board_id",
+            "pipeline": [{"$project": {"_id": 0, "list_counts": 0}}],
+            "as": "stats"
+        }},
+        {"$lookup": {
+            "from": "lists",
+            "localField": "board_id",
+            "foreignField": "board_id",
+            "pipeline": [{"$project": {"_id": 0, "list_id": {"$toString": "$_id"}, "title": 1}}],
+            "as": "lists"
+        }},
+        {"$facet": {
+            "boards": [
+                {"$set": {"list_count": {"$size": "$lists"}}},
+                {"$project": {"lists": 0}}
+            ],
+            "upcoming": _cards_facet(
+                {"due_date": {"$gte": now, "$lt": upcoming_until}}, {"due_date": 1}, limit
+            ),
+            "recent": _cards_facet({}, {"updated_at": -1}, limit)
+        }}
+    ]
+
+
+def _card(doc: dict) -> DashboardCard:
+    card = doc["card"]
+    return DashboardCard(
+        id=card["id"],
+        title=card["title"],
+        labels=card.get("labels") or [],
+        due_date=card["due_date"].isoformat() if card.get("due_date") else None,
+        updated_at=card["updated_at"].isoformat(),
+        list_id=card["list_id"],
+        list_title=doc["list_title"],
+        board_id=doc["board_id"],
+        board_title=doc["board_title"]
+    )
+
+
+async def load_dashboard(user_id: str) -> DashboardResponse:
+    """Build a user's dashboard."""
+    now = datetime.utcnow()
+    result = await Board.get_motor_collection().aggregate(
+        dashboard_pipeline(user_id, now)
+    ).to_list(1)
+    facets = result[0] if result else {"boards": [], "upcoming": [], "recent": []}
+
+    boards = []
+    for doc in facets["boards"]:
+        if doc["stats"]:
+            stats = BoardStats(**doc["stats"][0])
+        else:
+            # First look at a board created before stats existed
+            stats = await rebuild_board_stats(doc["board_id"])
+        counters = board_stats_to_response(stats, now.date())
+        boards.append(DashboardBoard(
+            id=doc["board_id"],
+            title=doc["title"],
+            description=doc.get("description"),
+            background_color=doc["background_color"],
+            owner_id=doc["owner_id"],
+            is_template=doc.get("is_template", False),
+            revision=doc.get("revision", 0),
+            created_at=doc["created_at"].isoformat(),
+            updated_at=doc["updated_at"].isoformat(),
+            list_count=doc["list_count"],
+            card_count=counters.card_count,
+            overdue_count=counters.overdue_count,
+            due_today_count=counters.due_today_count,
+            checklist_total=counters.checklist_total,
+            checklist_completed=counters.checklist_completed
+        ))
+
+    events = await recent_activity([board.id for board in boards], settings.DASHBOARD_ITEMS)
+
+    return DashboardResponse(
+        boards=boards,
+        upcoming=[_card(doc) for doc in facets["upcoming"]],
+        recently_updated=[_card(doc) for doc in facets["recent"]],
+        recent_activity=[activity_to_response(event) for event in events],
+        generated_at=now.isoformat()
+    )
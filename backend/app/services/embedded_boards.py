@@ -0,0 +1,394 @@
+"""
+Embedded board documents, for BOARD_STORAGE_MODE=embedded.
+
+In embedded mode each board is also stored as one `board_documents` entry,
+
+    {_id: <board id>, lists: [{_id, title, order, ..., cards: [{_id, title, order, ...}]}]}
+
+so loading a board view is a single `_id` fetch instead of a `lists` read
+plus a `$in` read on `cards`. The `lists` and `cards` collections remain the
+system of record, since archiving, stats, the dashboard and reminders query
+cards across boards. Every write to them is repeated on the board's document
+with positional array operators (`lists.$[l].cards.$[c]`), before the
+board's version is bumped so a cached view never runs ahead of its document.
+
+A board without a document gets one built from the collections the first
+time it is read. Every mirrored write bumps the document's `writes` stamp;
+a write that finds no document (or a document it cannot update) leaves a
+stub holding only the stamp instead. A build stores its result only if the
+stamp is still the one it saw before reading the collections, so a write
+landing during a build is never lost to it: the next read builds again.
+Checklist counters are not embedded; readers count the items.
+
+Moving data between the modes:
+
+    python -m app.services.embedded_boards to-embedded [--board ID ...]
+    python -m app.services.embedded_boards to-collections [--board ID ...]
+
+Run `to-embedded` before switching to embedded mode: documents left over
+from an earlier embedded period are stale. Since the collections stay
+current in both modes, `to-collections` only removes the documents.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List as ListType, Optional, Tuple, Union
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from app.core.config import settings
+from app.models.board import Board
+from app.models.board_document import BoardDocument
+from app.models.card import Card
+from app.models.list import List
+
+logger = logging.getLogger(__name__)
+
+# A card anywhere on the board, matched by the "c" array filter
+CARD_PATH = "lists.$[].cards.$[c]"
+CARD_COUNTERS = ("checklist_total", "checklist_completed")
+
+Document = Dict[str, Any]
+
+
+def embedded_storage() -> bool:
+    return settings.BOARD_STORAGE_MODE == "embedded"
+
+
+def _documents():
+    return BoardDocument.get_motor_collection()
+
+
+def card_entry(card: Union[Card, Document]) -> Document:
+    """A card (document or raw dict) as stored in its list's `cards` array."""
+    if isinstance(card, dict):
+        entry = dict(card)
+    else:
+        entry = {**card.model_dump(exclude={"id", "revision_id"}), "_id": card.id}
+    for counter in CARD_COUNTERS:
+        entry.pop(counter, None)
+    return entry
+
+
+def list_entry(lst: Union[List, Document], cards: Optional[ListType[Document]] = None) -> Document:
+    """A list (document or raw dict) as stored in the board's `lists` array."""
+    if isinstance(lst, dict):
+        entry = dict(lst)
+    else:
+        entry = {**lst.model_dump(exclude={"id", "revision_id"}), "_id": lst.id}
+    entry["cards"] = cards or []
+    return entry
+
+
+def with_checklist_counts(card: Document) -> Document:
+    """An embedded card with the checklist counters the `cards` collection stores."""
+    checklist = card.get("checklist") or []
+    return {
+        **card,
+        "checklist_total": len(checklist),
+        "checklist_completed": sum(1 for item in checklist if item.get("completed")),
+    }
+
+
+def unpack_board_document(document: Document) -> Tuple[ListType[List], ListType[Document]]:
+    """
+    Lists and cards of a board document, in board order.
+
+    Returns:
+        The lists sorted by order, and the raw cards (with checklist counts)
+        sorted by order within each list
+    """
+    entries = sorted(document.get("lists", []), key=lambda entry: entry.get("order", 0))
+    lists, cards = [], []
+    for entry in entries:
+        entry = dict(entry)
+        list_cards = entry.pop("cards", [])
+        lists.append(List.model_validate(entry))
+        cards.extend(
+            with_checklist_counts(card)
+            for card in sorted(list_cards, key=lambda card: card.get("order", 0))
+        )
+    return lists, cards
+
+
+async def build_board_document(board_id: str) -> Document:
+    """Assemble a board's document from the `lists` and `cards` collections."""
+    lists = await List.get_motor_collection().find({"board_id": board_id}).to_list(None)
+    cards_by_list: Dict[str, ListType[Document]] = {}
+    async for card in Card.get_motor_collection().find(
+        {"list_id": {"$in": [str(lst["_id"]) for lst in lists]}}
+    ):
+        cards_by_list.setdefault(card["list_id"], []).append(card_entry(card))
+    return {
+        "_id": ObjectId(board_id),
+        "lists": [list_entry(lst, cards_by_list.get(str(lst["_id"]))) for lst in lists],
+        "embedded_at": datetime.utcnow(),
+    }
+
+
+async def _build(board_id: str, current: Optional[Document]) -> Document:
+    """
+    Build a board's document and store it unless a write came first.
+
+    Args:
+        current: The stored document (or stub) as read before the build,
+            None when there was none
+    """
+    document = await build_board_document(board_id)
+    try:
+        if current is None:
+            await _documents().insert_one({**document, "writes": 0})
+        else:
+            await _documents().replace_one(
+                {"_id": document["_id"], "writes": current.get("writes")},
+                {**document, "writes": current.get("writes") or 0}
+            )
+    except DuplicateKeyError:
+        # A write created a stub meanwhile; serve this build, store none
+        pass
+    return document
+
+
+async def embed_board(board_id: str) -> Document:
+    """(Re)build a board's document from the collections and store it."""
+    current = await _documents().find_one({"_id": ObjectId(board_id)}, {"writes": 1})
+    return await _build(board_id, current)
+
+
+async def load_board_document(board_id: str) -> Document:
+    """Fetch a board's document, building it on first use."""
+    document = await _documents().find_one({"_id": ObjectId(board_id)})
+    if document is None or "lists" not in document:
+        document = await _build(board_id, document)
+    return document
+
+
+async def delete_board_document(board_id: str) -> None:
+    if embedded_storage():
+        await _documents().delete_one({"_id": ObjectId(board_id)})
+
+
+async def invalidate_board_document(board_id: str) -> None:
+    """
+    Turn a board's document into a stub, so the next read rebuilds it.
+
+    Bumps the stamp as well, so a build already running does not store
+    what it read.
+    """
+    if not embedded_storage():
+        return
+    try:
+        await _documents().update_one(
+            {"_id": ObjectId(board_id)},
+            {"$unset": {"lists": ""}, "$inc": {"writes": 1}},
+            upsert=True
+        )
+    except PyMongoError:
+        logger.exception("Embedded document of board %s is stale; run to-embedded", board_id)
+
+
+async def _discard(board_id: str, exc: Exception) -> None:
+    logger.warning("Dropping embedded document of board %s after a failed update: %s", board_id, exc)
+    await invalidate_board_document(board_id)
+
+
+def _stamped(update: Document) -> Document:
+    return {**update, "$inc": {**update.get("$inc", {}), "writes": 1}}
+
+
+async def _update(
+    board_id: str,
+    update: Document,
+    array_filters: Optional[ListType[Document]] = None,
+    query: Optional[Document] = None
+) -> None:
+    """Apply one update to a board's document, or leave a stub when it has none."""
+    if not embedded_storage():
+        return
+    try:
+        result = await _documents().update_one(
+            {"_id": ObjectId(board_id), "lists": {"$exists": True}, **(query or {})},
+            _stamped(update),
+            array_filters=array_filters
+        )
+    except PyMongoError as exc:
+        await _discard(board_id, exc)
+        return
+    if not result.matched_count:
+        # No document yet, or `query` failed: a build may be running
+        await invalidate_board_document(board_id)
+
+
+async def embed_card(board_id: str, card: Card) -> None:
+    """Add a new (or restored) card to the end of its list's `cards`."""
+    await _update(
+        board_id,
+        {"$push": {"lists.$[l].cards": card_entry(card)}},
+        array_filters=[{"l._id": ObjectId(card.list_id)}],
+        query={"lists.cards._id": {"$ne": card.id}}
+    )
+
+
+async def replace_embedded_card(board_id: str, card: Card) -> None:
+    """Overwrite a card's embedded copy with `card`, in the same list."""
+    await _update(
+        board_id,
+        {"$set": {CARD_PATH: card_entry(card)}},
+        array_filters=[{"c._id": card.id}]
+    )
+
+
+async def update_embedded_card(
+    board_id: str,
+    card_id: Union[str, ObjectId],
+    update: Dict[str, Document],
+    item_id: Optional[str] = None
+) -> None:
+    """
+    Apply an update written against a card to the card's embedded copy.
+
+    Args:
+        update: Update document whose paths are relative to the card, e.g.
+            {"$push": {"checklist": item}}
+        item_id: Checklist item matched by `$[i]` in those paths
+    """
+    array_filters = [{"c._id": ObjectId(card_id)}]
+    if item_id is not None:
+        array_filters.append({"i.id": item_id})
+    await _update(
+        board_id,
+        {
+            operator: {f"{CARD_PATH}.{path}": value for path, value in fields.items()}
+            for operator, fields in update.items()
+        },
+        array_filters=array_filters
+    )
+
+
+async def remove_embedded_cards(board_id: str, card_ids: Iterable[Union[str, ObjectId]]) -> None:
+    await _update(
+        board_id,
+        {"$pull": {"lists.$[].cards": {"_id": {"$in": [ObjectId(card_id) for card_id in card_ids]}}}}
+    )
+
+
+async def move_embedded_card(source_board_id: str, target_board_id: str, card: Card) -> None:
+    """Move a card's embedded copy to `card.list_id`, written as `card`."""
+    if not embedded_storage():
+        return
+    if source_board_id != target_board_id:
+        await remove_embedded_cards(source_board_id, [card.id])
+        await embed_card(target_board_id, card)
+        return
+
+    # $pull and $push on lists.$[...].cards conflict within one update
+    board = {"_id": ObjectId(source_board_id), "lists": {"$exists": True}}
+    try:
+        result = await _documents().bulk_write([
+            UpdateOne(board, _stamped({"$pull": {"lists.$[].cards": {"_id": card.id}}})),
+            UpdateOne(
+                board,
+                _stamped({"$push": {"lists.$[l].cards": card_entry(card)}}),
+                array_filters=[{"l._id": ObjectId(card.list_id)}]
+            ),
+        ], ordered=True)
+    except PyMongoError as exc:
+        await _discard(source_board_id, exc)
+        return
+    if result.matched_count < 2:
+        await invalidate_board_document(source_board_id)
+
+
+async def reorder_embedded_cards(
+    board_id: str, list_id: str, orders: ListType[Tuple[str, int]], now: datetime
+) -> None:
+    """Set the order of several cards of one list in a single update."""
+    if not orders:
+        return
+    fields, array_filters = {}, [{"l._id": ObjectId(list_id)}]
+    for index, (card_id, order) in enumerate(orders):
+        fields[f"lists.$[l].cards.$[c{index}].order"] = order
+        fields[f"lists.$[l].cards.$[c{index}].updated_at"] = now
+        array_filters.append({f"c{index}._id": ObjectId(card_id)})
+    await _update(board_id, {"$set": fields}, array_filters=array_filters)
+
+
+async def embed_list(board_id: str, lst: List) -> None:
+    await _update(
+        board_id,
+        {"$push": {"lists": list_entry(lst)}},
+        query={"lists._id": {"$ne": lst.id}}
+    )
+
+
+async def replace_embedded_list(board_id: str, lst: List) -> None:
+    """Overwrite a list's embedded fields with `lst`, keeping its cards."""
+    entry = list_entry(lst)
+    del entry["cards"]
+    await _update(
+        board_id,
+        {"$set": {f"lists.$[l].{field}": value for field, value in entry.items() if field != "_id"}},
+        array_filters=[{"l._id": lst.id}]
+    )
+
+
+async def remove_embedded_list(board_id: str, list_id: str) -> None:
+    await _update(board_id, {"$pull": {"lists": {"_id": ObjectId(list_id)}}})
+
+
+async def reorder_embedded_lists(
+    board_id: str, orders: ListType[Tuple[str, int]], now: datetime
+) -> None:
+    """Set the order of several lists of a board in a single update."""
+    if not orders:
+        return
+    fields, array_filters = {}, []
+    for index, (list_id, order) in enumerate(orders):
+        fields[f"lists.$[l{index}].order"] = order
+        fields[f"lists.$[l{index}].updated_at"] = now
+        array_filters.append({f"l{index}._id": ObjectId(list_id)})
+    await _update(board_id, {"$set": fields}, array_filters=array_filters)
+
+
+async def migrate_to_embedded(board_ids: Optional[ListType[str]] = None) -> int:
+    """Build the documents of `board_ids` (default: every board) from the collections."""
+    if board_ids is None:
+        boards = Board.get_motor_collection().find({}, {"_id": 1})
+        board_ids = [str(board["_id"]) async for board in boards]
+    for board_id in board_ids:
+        await embed_board(board_id)
+    return len(board_ids)
+
+
+async def migrate_to_collections(board_ids: Optional[ListType[str]] = None) -> int:
+    """
+    Remove the documents of `board_ids` (default: every board).
+
+    Nothing is written back: the collections are the system of record in
+    both modes, and a document is at best as current as they are.
+    """
+    query = {"_id": {"$in": [ObjectId(board_id) for board_id in board_ids]}} if board_ids else {}
+    result = await _documents().delete_many(query)
+    return result.deleted_count
+
+
+async def migrate(direction: str, board_ids: Optional[ListType[str]] = None) -> int:
+    from app.core.database import init_db
+
+    await init_db()
+    if direction == "to-embedded":
+        return await migrate_to_embedded(board_ids)
+    return await migrate_to_collections(board_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move boards between the storage modes")
+    parser.add_argument("direction", choices=["to-embedded", "to-collections"])
+    parser.add_argument(
+        "--board", action="append", dest="boards", metavar="ID",
+        help="only this board (repeatable; default: every board)"
+    )
+    args = parser.parse_args()
+    count = asyncio.run(migrate(args.direction, args.boards))
+    print(f"✅ Moved {count} boards {args.direction} in {settings.MONGODB_DB_NAME}")
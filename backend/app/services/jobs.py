@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from redis.exceptions import RedisError
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Runs a coroutine function every `interval` seconds in the background.
+
+    When several API processes run, a Redis lock lets only one of them do a
+    given run; if Redis is down every process runs it, so jobs must be
+    idempotent.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: int,
+        run: Callable[[], Awaitable[Any]],
+        lock_key: Optional[str] = None
+    ):
+        self.name = name
+        self.interval = interval
+        self.run = run
+        self.lock_key = lock_key or f"jobs:{name}:lock"
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _acquire(self) -> bool:
+        try:
+            return bool(await redis_client.set(self.lock_key, "1", nx=True, ex=self.interval))
+        except RedisError as exc:
+            logger.warning("%s lock unavailable, running anyway: %s", self.name, exc)
+            return True
+
+    async def _loop(self) -> None:
+        while True:
+            if await self._acquire():
+                try:
+                    await self.run()
+                except Exception:
+                    logger.exception("%s job failed", self.name)
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,374 @@
+"""
+Due-date reminders.
+
+One API process at a time, the holder of a Redis lease, sends a reminder
+REMINDER_LEAD_SECONDS before each card is due. It keeps only the due dates of
+the next REMINDER_WINDOW_SECONDS in a heap (at most REMINDER_MAX_SCHEDULED of
+them), loaded with a range query on the `due_date` index and topped up as
+time passes, so neither memory nor the work per tick grows with the number
+of cards.
+
+Card routes publish the ID of every card whose due date was set, changed or
+cleared, and of every deleted card, on the "reminders" topic of the
+invalidation bus; the scheduler re-reads those cards with one query on its
+next tick. A move changes neither the card's ID nor its due date, and the
+recipient (the board's owner) is looked up when the reminder is sent, so
+moves need no event.
+
+The due date up to which reminders have been sent is stored next to the
+lease, so a new lease holder resumes where the previous one stopped and at
+most one tick's worth of reminders is sent twice. While Redis is unreachable
+no process can tell who holds the lease, so none sends reminders.
+"""
+import asyncio
+import heapq
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List as ListType, Optional, Set, Tuple
+from bson import ObjectId
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.invalidation import InvalidationBus, invalidation_bus
+from app.core.redis import redis_client
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "reminders:lease"
+SENT_UNTIL_KEY = "reminders:sent_until"
+
+# KEYS = lease, sent_until; ARGV = holder id, lease TTL, sent_until to store ("" for none)
+# Returns {1, stored sent_until} while the caller holds the lease, {0} otherwise
+LEASE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and holder ~= ARGV[1] then
+    return {0}
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', tonumber(ARGV[2]))
+if ARGV[3] ~= '' then
+    redis.call('SET', KEYS[2], ARGV[3])
+end
+return {1, redis.call('GET', KEYS[2])}
+"""
+
+renew_lease = redis_client.register_script(LEASE_SCRIPT)
+
+
+@dataclass(frozen=True)
+class Reminder:
+    """A card that is about to be due, and who to tell."""
+    card_id: str
+    title: str
+    due_date: datetime
+    board_id: str
+    owner_id: str
+
+
+class ReminderSink(ABC):
+    """Where reminders are delivered."""
+
+    @abstractmethod
+    async def send(self, reminders: ListType[Reminder]) -> None:
+        ...
+
+
+class LogSink(ReminderSink):
+    """Writes reminders to the application log."""
+
+    async def send(self, reminders: ListType[Reminder]) -> None:
+        for reminder in reminders:
+            logger.info(
+                "Reminder for user %s: card %s (%r) on board %s is due at %s",
+                reminder.owner_id, reminder.card_id, reminder.title,
+                reminder.board_id, reminder.due_date.isoformat()
+            )
+
+
+class FileSink(ReminderSink):
+    """Appends reminders to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    async def send(self, reminders: ListType[Reminder]) -> None:
+        lines = "".join(
+            json.dumps({**asdict(reminder), "due_date": reminder.due_date.isoformat()}) + "\n"
+            for reminder in reminders
+        )
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+def make_sink(kind: str, path: str) -> ReminderSink:
+    if kind == "log":
+        return LogSink()
+    if kind == "file":
+        return FileSink(path)
+    raise ValueError(f"Unknown reminder sink: {kind}")
+
+
+class ReminderScheduler:
+    """
+    Heap of the reminders due soon, kept in sync through card events.
+
+    Invariant while active: every card due in [sent_until, loaded_until) is
+    in the heap, and every card due before sent_until has been reminded.
+    """
+
+    topic = "reminders"
+
+    def __init__(
+        self,
+        bus: Optional[InvalidationBus],
+        sink: ReminderSink,
+        lead_seconds: int,
+        window_seconds: int,
+        max_scheduled: int,
+        tick_seconds: float,
+        lease_seconds: int
+    ):
+        self.sink = sink
+        self.lead = timedelta(seconds=lead_seconds)
+        self.window = timedelta(seconds=window_seconds)
+        self.max_scheduled = max_scheduled
+        self.tick_seconds = tick_seconds
+        self.lease_seconds = lease_seconds
+        self._heap: ListType[Tuple[datetime, str]] = []
+        self._scheduled: Dict[str, datetime] = {}  # card_id -> due date; stale heap entries are skipped
+        self._changed: Set[str] = set()
+        self._sent_until: Optional[datetime] = None  # None while another process holds the lease
+        self._loaded_until: Optional[datetime] = None
+        self._holder = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+        self._bus = bus
+        if bus is not None:
+            bus.subscribe(self.topic, self._card_changed)
+
+    @property
+    def active(self) -> bool:
+        return self._sent_until is not None
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def card_changed(self, card_id: str) -> None:
+        """Have the scheduler, in whichever process runs it, re-read a card."""
+        if self._bus is not None:
+            self._bus.publish(self.topic, card_id)
+        else:
+            self._card_changed(card_id)
+
+    def reload(self) -> None:
+        """Have the scheduler reload its window, e.g. after cards were copied in bulk."""
+        if self._bus is not None:
+            self._bus.publish(self.topic, None)
+        else:
+            self._card_changed(None)
+
+    def _card_changed(self, card_id: Optional[str]) -> None:
+        if not self.active:
+            return
+        if card_id is None:
+            # Missed events: reload the window
+            self.resume(self._sent_until)
+            return
+        self._changed.add(card_id)
+
+    def resume(self, sent_until: datetime) -> None:
+        """Start over with every card due at or after `sent_until` still to remind."""
+        self._heap = []
+        self._scheduled = {}
+        self._changed = set()
+        self._sent_until = sent_until
+        self._loaded_until = sent_until
+
+    def suspend(self) -> None:
+        """Drop all state; another process holds the lease."""
+        self._heap = []
+        self._scheduled = {}
+        self._changed = set()
+        self._sent_until = None
+        self._loaded_until = None
+
+    def _schedule(self, card_id: str, due: datetime) -> None:
+        full = card_id not in self._scheduled and len(self._scheduled) >= self.max_scheduled
+        if full and due >= self._sent_until:
+            # Give up the latest due date and load it again when there is room
+            # (cards due before sent_until are sent on this tick)
+            latest_id, latest_due = max(self._scheduled.items(), key=lambda item: item[1])
+            if latest_due <= due:
+                self._loaded_until = min(self._loaded_until, due)
+                return
+            del self._scheduled[latest_id]
+            self._loaded_until = min(self._loaded_until, latest_due)
+        self._scheduled[card_id] = due
+        heapq.heappush(self._heap, (due, card_id))
+        if len(self._heap) > 2 * self.max_scheduled:
+            self._heap = [(due, card_id) for card_id, due in self._scheduled.items()]
+            heapq.heapify(self._heap)
+
+    async def _refresh(self, now: datetime) -> None:
+        """Re-read the cards named by events since the last tick."""
+        card_ids, self._changed = self._changed, set()
+        cards = await Card.get_motor_collection().find(
+            {"_id": {"$in": [ObjectId(card_id) for card_id in card_ids if ObjectId.is_valid(card_id)]}},
+            {"due_date": 1}
+        ).to_list(None)
+        due_dates = {str(card["_id"]): card.get("due_date") for card in cards}
+
+        for card_id in card_ids:
+            self._scheduled.pop(card_id, None)
+            due = due_dates.get(card_id)
+            if due is not None and now <= due < self._loaded_until:
+                self._schedule(card_id, due)
+
+    async def _load(self, until: datetime) -> None:
+        """Add the cards due in [loaded_until, until), as many as fit."""
+        room = self.max_scheduled - len(self._scheduled)
+        if room <= 0:
+            return
+        cards = await Card.get_motor_collection().find(
+            {"due_date": {"$gte": self._loaded_until, "$lt": until}},
+            {"due_date": 1}
+        ).sort("due_date", 1).limit(room + 1).to_list(room + 1)
+        if len(cards) > room:
+            # Stop before the first due date that does not fit entirely
+            until = cards[room]["due_date"]
+            cards = [card for card in cards[:room] if card["due_date"] < until]
+        for card in cards:
+            self._schedule(str(card["_id"]), card["due_date"])
+        self._loaded_until = max(self._loaded_until, until)
+
+    async def _resolve(self, due_cards: Dict[str, datetime]) -> ListType[Reminder]:
+        """Turn due card IDs into reminders, skipping cards changed or deleted meanwhile."""
+        cards = await Card.get_motor_collection().find(
+            {"_id": {"$in": [ObjectId(card_id) for card_id in due_cards]}},
+            {"title": 1, "due_date": 1, "list_id": 1}
+        ).to_list(None)
+        cards = [card for card in cards if card.get("due_date") == due_cards[str(card["_id"])]]
+        if not cards:
+            return []
+
+        lists = await List.get_motor_collection().find(
+            {"_id": {"$in": list({ObjectId(card["list_id"]) for card in cards})}},
+            {"board_id": 1}
+        ).to_list(None)
+        board_of = {str(lst["_id"]): lst["board_id"] for lst in lists}
+        boards = await Board.get_motor_collection().find(
+            {"_id": {"$in": [ObjectId(board_id) for board_id in set(board_of.values())]}},
+            {"owner_id": 1, "is_template": 1}
+        ).to_list(None)
+        owner_of = {
+            str(board["_id"]): board["owner_id"]
+            for board in boards
+            if not board.get("is_template")
+        }
+
+        reminders = []
+        for card in cards:
+            board_id = board_of.get(card["list_id"])
+            if board_id in owner_of:
+                reminders.append(Reminder(
+                    card_id=str(card["_id"]),
+                    title=card["title"],
+                    due_date=card["due_date"],
+                    board_id=board_id,
+                    owner_id=owner_of[board_id]
+                ))
+        return reminders
+
+    async def tick(self, now: Optional[datetime] = None) -> int:
+        """
+        Apply card events, top up the window and send the reminders now due.
+
+        Returns the number of reminders sent.
+        """
+        if not self.active:
+            return 0
+        now = now or datetime.utcnow()
+        if self._changed:
+            await self._refresh(now)
+        if self._loaded_until < now + self.lead + self.window / 2:
+            await self._load(now + self.lead + self.window)
+
+        send_until = min(now + self.lead, self._loaded_until)
+        due_cards: Dict[str, datetime] = {}
+        while self._heap and self._heap[0][0] < send_until:
+            due, card_id = heapq.heappop(self._heap)
+            if self._scheduled.get(card_id) == due:
+                del self._scheduled[card_id]
+                due_cards[card_id] = due
+
+        reminders = await self._resolve(due_cards) if due_cards else []
+        if reminders:
+            await self.sink.send(reminders)
+        self._sent_until = max(self._sent_until, send_until)
+        return len(reminders)
+
+    async def _hold_lease(self) -> Tuple[bool, Optional[datetime]]:
+        """Take or renew the lease. Returns whether it is held and the stored sent_until."""
+        sent_until = self._sent_until.isoformat() if self._sent_until else ""
+        try:
+            result = await renew_lease(
+                keys=[LEASE_KEY, SENT_UNTIL_KEY],
+                args=[self._holder, self.lease_seconds, sent_until]
+            )
+        except RedisError as exc:
+            # Another process may hold it: stay suspended rather than send twice
+            logger.warning("Reminder lease unavailable, suspending: %s", exc)
+            return False, None
+        stored = result[1] if len(result) > 1 else None
+        return bool(result[0]), datetime.fromisoformat(stored) if stored else None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                held, stored = await self._hold_lease()
+                if not held:
+                    if self.active:
+                        self.suspend()
+                else:
+                    if not self.active:
+                        # Catch up on at most one window of missed reminders
+                        now = datetime.utcnow()
+                        self.resume(max(stored or now, now - self.window))
+                    await self.tick()
+            except Exception:
+                logger.exception("Reminder tick failed")
+                if self.active:
+                    self.resume(self._sent_until)
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.suspend()
+
+
+reminder_scheduler = ReminderScheduler(
+    invalidation_bus,
+    make_sink(settings.REMINDER_SINK, settings.REMINDER_SINK_PATH),
+    lead_seconds=settings.REMINDER_LEAD_SECONDS,
+    window_seconds=settings.REMINDER_WINDOW_SECONDS,
+    max_scheduled=settings.REMINDER_MAX_SCHEDULED,
+    tick_seconds=settings.REMINDER_TICK_SECONDS,
+    lease_seconds=settings.REMINDER_LEASE_SECONDS
+)
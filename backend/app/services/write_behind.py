@@ -0,0 +1,337 @@
+"""
+Write-behind for card positions.
+
+With WRITE_BEHIND_ENABLED, `reorder_cards` and moves within a board do not
+write the cards. They record each card's new list and order in Redis and
+return; a drag that fires a dozen requests per second then costs a dozen
+Redis calls and one MongoDB write:
+
+    writebehind:<board id>:pending   card id -> [list id, order, timestamp]
+    writebehind:<board id>:flushing  entries taken by a flush that is running
+    writebehind:<board id>:since     when the oldest pending entry was recorded
+    writebehind:<board id>:lock      held by the process flushing the board
+    writebehind:due                  board id -> when its entries are flushed
+
+A board is flushed WRITE_BEHIND_QUIET_SECONDS after its last change, at the
+latest WRITE_BEHIND_MAX_DELAY_SECONDS after its first, and as soon as
+WRITE_BEHIND_MAX_PENDING cards are pending. A flush writes the cards with
+one bulk write, moves the list counts in the board's stats and invalidates
+the board's embedded document, which the next read rebuilds.
+
+Board views, card reads and moves apply the entries still in Redis, so every
+process sees the pending positions. Other writes to a board's cards flush it
+first. When Redis is unavailable, positions are written through as before.
+"""
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List as ListType, Optional, Set, Tuple
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.models.card import Card
+from app.services.board_stats import apply_stats_delta
+from app.services.embedded_boards import invalidate_board_document
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "writebehind:{}:pending"
+FLUSHING_KEY = "writebehind:{}:flushing"
+SINCE_KEY = "writebehind:{}:since"
+LOCK_KEY = "writebehind:{}:lock"
+DUE_KEY = "writebehind:due"
+
+# (list id, order) of a card
+Position = Tuple[str, int]
+
+# KEYS[1] = pending, KEYS[2] = since, KEYS[3] = due
+# ARGV = board id, now, quiet seconds, max delay seconds, then card id / entry pairs
+# Returns the number of pending cards of the board
+RECORD_SCRIPT = """
+for i = 5, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+local now = tonumber(ARGV[2])
+redis.call('SET', KEYS[2], ARGV[2], 'NX')
+local since = tonumber(redis.call('GET', KEYS[2]))
+redis.call('ZADD', KEYS[3], math.min(now + tonumber(ARGV[3]), since + tonumber(ARGV[4])), ARGV[1])
+return redis.call('HLEN', KEYS[1])
+"""
+
+# KEYS[1] = pending, KEYS[2] = flushing, KEYS[3] = since, KEYS[4] = lock, KEYS[5] = due
+# ARGV = board id, lock seconds, now
+# Moves the pending entries over those a failed flush left behind and returns
+# them all as a flat HGETALL reply; nothing while another flush holds the lock
+# or when there is nothing to write. The board stays due until the lock
+# expires, so entries of a flush that never finishes are taken again.
+TAKE_SCRIPT = """
+if not redis.call('SET', KEYS[4], '1', 'NX', 'EX', tonumber(ARGV[2])) then
+    return false
+end
+local pending = redis.call('HGETALL', KEYS[1])
+for i = 1, #pending, 2 do
+    redis.call('HSET', KEYS[2], pending[i], pending[i + 1])
+end
+redis.call('DEL', KEYS[1], KEYS[3])
+local taken = redis.call('HGETALL', KEYS[2])
+if #taken == 0 then
+    redis.call('DEL', KEYS[4])
+    redis.call('ZREM', KEYS[5], ARGV[1])
+else
+    redis.call('ZADD', KEYS[5], tonumber(ARGV[3]) + tonumber(ARGV[2]), ARGV[1])
+end
+return taken
+"""
+
+# KEYS[1] = pending, KEYS[2] = flushing, KEYS[3] = lock, KEYS[4] = due
+# ARGV = board id
+# Drops the written entries; the board is no longer due unless new ones came in
+DONE_SCRIPT = """
+redis.call('DEL', KEYS[2], KEYS[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('ZREM', KEYS[4], ARGV[1])
+end
+"""
+
+record_positions_script = redis_client.register_script(RECORD_SCRIPT)
+take_positions = redis_client.register_script(TAKE_SCRIPT)
+finish_flush = redis_client.register_script(DONE_SCRIPT)
+
+
+def write_behind_enabled() -> bool:
+    return settings.WRITE_BEHIND_ENABLED
+
+
+def _positions(entries: Dict[str, str]) -> Dict[str, Position]:
+    positions = {}
+    for card_id, entry in entries.items():
+        list_id, order, _ = json.loads(entry)
+        positions[card_id] = (list_id, order)
+    return positions
+
+
+async def record_positions(board_id: str, positions: Dict[str, Position]) -> bool:
+    """
+    Hold new card positions of a board until its next flush.
+
+    Returns:
+        False when Redis is unavailable; the caller writes them through
+    """
+    now = time.time()
+    args: ListType[Any] = [
+        board_id, now, settings.WRITE_BEHIND_QUIET_SECONDS, settings.WRITE_BEHIND_MAX_DELAY_SECONDS
+    ]
+    for card_id, (list_id, order) in positions.items():
+        args += [card_id, json.dumps([list_id, order, now])]
+    try:
+        pending = await record_positions_script(
+            keys=[PENDING_KEY.format(board_id), SINCE_KEY.format(board_id), DUE_KEY], args=args
+        )
+    except RedisError as exc:
+        logger.warning("Write-behind unavailable, writing positions through: %s", exc)
+        return False
+    if pending >= settings.WRITE_BEHIND_MAX_PENDING:
+        write_behind.schedule(board_id)
+    return True
+
+
+async def pending_positions(board_id: str) -> Dict[str, Position]:
+    """Positions of a board's cards not yet written, by card id."""
+    if not write_behind_enabled():
+        return {}
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hgetall(FLUSHING_KEY.format(board_id))
+        pipe.hgetall(PENDING_KEY.format(board_id))
+        flushing, pending = await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Could not read pending positions of board %s: %s", board_id, exc)
+        return {}
+    # Entries recorded after a flush started are the newer ones
+    return _positions({**flushing, **pending})
+
+
+async def pending_position(board_id: str, card_id: str) -> Optional[Position]:
+    """A card's position not yet written, if any."""
+    if not write_behind_enabled():
+        return None
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hget(FLUSHING_KEY.format(board_id), card_id)
+        pipe.hget(PENDING_KEY.format(board_id), card_id)
+        flushing, pending = await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Could not read pending position of card %s: %s", card_id, exc)
+        return None
+    entry = pending or flushing
+    return _positions({card_id: entry})[card_id] if entry else None
+
+
+def apply_positions(cards: ListType[Any], positions: Dict[str, Position]) -> ListType[Any]:
+    """
+    Move cards (documents or raw dicts) to their pending positions.
+
+    Returns:
+        The cards sorted by order, so grouping them by list keeps each list sorted
+    """
+    if not positions:
+        return cards
+    for card in cards:
+        if isinstance(card, dict):
+            position = positions.get(str(card["_id"]))
+            if position:
+                card["list_id"], card["order"] = position
+        else:
+            position = positions.get(str(card.id))
+            if position:
+                card.list_id, card.order = position
+    return sorted(cards, key=lambda card: card["order"] if isinstance(card, dict) else card.order)
+
+
+async def flush_board(board_id: str) -> int:
+    """Write a board's pending positions now. Returns the number of cards written."""
+    lock_key = LOCK_KEY.format(board_id)
+    try:
+        taken = await take_positions(
+            keys=[
+                PENDING_KEY.format(board_id), FLUSHING_KEY.format(board_id),
+                SINCE_KEY.format(board_id), lock_key, DUE_KEY
+            ],
+            args=[board_id, settings.WRITE_BEHIND_LOCK_SECONDS, time.time()]
+        )
+    except RedisError as exc:
+        logger.warning("Could not flush positions of board %s: %s", board_id, exc)
+        return 0
+    if not taken:
+        return 0
+    entries = dict(zip(taken[::2], taken[1::2]))
+
+    try:
+        written = await _write(board_id, entries)
+    except PyMongoError as exc:
+        # The entries stay in the flushing hash; the next flush retries them
+        logger.warning("Could not write %d positions of board %s: %s", len(entries), board_id, exc)
+        try:
+            await redis_client.zadd(DUE_KEY, {board_id: time.time() + settings.WRITE_BEHIND_QUIET_SECONDS})
+            await redis_client.delete(lock_key)
+        except RedisError:
+            pass
+        return 0
+
+    try:
+        await finish_flush(
+            keys=[PENDING_KEY.format(board_id), FLUSHING_KEY.format(board_id), lock_key, DUE_KEY],
+            args=[board_id]
+        )
+    except RedisError as exc:
+        # Written again by the next flush, which is harmless
+        logger.warning("Could not clear flushed positions of board %s: %s", board_id, exc)
+    return written
+
+
+async def _write(board_id: str, entries: Dict[str, str]) -> int:
+    collection = Card.get_motor_collection()
+    card_ids = [ObjectId(card_id) for card_id in entries]
+    stored = await collection.find({"_id": {"$in": card_ids}}, {"list_id": 1}).to_list(None)
+
+    updates, deltas = [], []
+    for document in stored:
+        list_id, order, at = json.loads(entries[str(document["_id"])])
+        updates.append(UpdateOne(
+            {"_id": document["_id"]},
+            {"$set": {"list_id": list_id, "order": order, "updated_at": datetime.utcfromtimestamp(at)}}
+        ))
+        if document["list_id"] != list_id:
+            deltas.append({f"list_counts.{document['list_id']}": -1, f"list_counts.{list_id}": 1})
+    if updates:
+        await collection.bulk_write(updates, ordered=False)
+        await apply_stats_delta(board_id, *deltas)
+        await invalidate_board_document(board_id)
+    return len(updates)
+
+
+async def settle_board(board_id: str) -> None:
+    """Flush a board's pending positions before writing its cards another way."""
+    if write_behind_enabled():
+        await flush_board(board_id)
+
+
+async def settle_boards(board_ids: Iterable[str]) -> None:
+    for board_id in set(board_ids):
+        await settle_board(board_id)
+
+
+async def discard_board(board_id: str) -> None:
+    """Forget the pending positions of a deleted board."""
+    if not write_behind_enabled():
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.delete(PENDING_KEY.format(board_id), FLUSHING_KEY.format(board_id), SINCE_KEY.format(board_id))
+        pipe.zrem(DUE_KEY, board_id)
+        await pipe.execute()
+    except RedisError as exc:
+        # Flushing them later matches no card
+        logger.warning("Could not discard pending positions of board %s: %s", board_id, exc)
+
+
+class WriteBehindFlusher:
+    """Flushes boards whose pending positions are due, in the background."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._scheduled: Set[asyncio.Task] = set()
+
+    def schedule(self, board_id: str) -> None:
+        """Flush a board soon, without waiting for it."""
+        task = asyncio.get_running_loop().create_task(flush_board(board_id))
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled.discard)
+
+    async def flush_due(self, everything: bool = False) -> int:
+        """Flush the boards that are due, or all boards with pending positions."""
+        try:
+            board_ids = await redis_client.zrangebyscore(
+                DUE_KEY, "-inf", "+inf" if everything else time.time()
+            )
+        except RedisError as exc:
+            logger.warning("Could not read boards due for a flush: %s", exc)
+            return 0
+        written = 0
+        for board_id in board_ids:
+            written += await flush_board(board_id)
+        return written
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the timer and write every pending position."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._scheduled:
+            await asyncio.gather(*self._scheduled, return_exceptions=True)
+        await self.flush_due(everything=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush_due()
+            except Exception:
+                logger.exception("Write-behind flush failed")
+
+
+write_behind = WriteBehindFlusher(interval=settings.WRITE_BEHIND_QUIET_SECONDS / 2)
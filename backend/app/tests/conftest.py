@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+import pytest
+from httpx import AsyncClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.database import init_db
+from app.core.query_counter import track_queries
+from app.core.redis import redis_client
+from app.main import app
+from app.models.user import User
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    """HTTP client bound to the app and a real MongoDB test database."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    probe = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=2000)
+    try:
+        await probe.admin.command("ping")
+    except PyMongoError:
+        pytest.skip(f"MongoDB is not reachable at {settings.MONGODB_URL}")
+    finally:
+        probe.close()
+
+    await init_db()
+    async with AsyncClient(app=app, base_url="http://test") as http_client:
+        yield http_client
+
+    database = User.get_motor_collection().database
+    await database.client.drop_database(database.name)
+    # The shared pool's connections belong to this test's event loop
+    await redis_client.connection_pool.disconnect()
+
+
+@pytest.fixture
+async def redis():
+    """A fresh Redis connection pool for the test's event loop."""
+    connection = Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD or None,
+        db=settings.REDIS_DB,
+        decode_responses=True,
+        socket_connect_timeout=2,
+    )
+    try:
+        await connection.ping()
+    except RedisError:
+        await connection.aclose()
+        pytest.skip(f"Redis is not reachable at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+    yield connection
+    await connection.aclose()
+
+
+@pytest.fixture
+async def auth_headers(client):
+    """Register a user and return its Authorization header."""
+    response = await client.post(
+        "/api/auth/register",
+        json={
+            "email": "budget@example.com",
+            "username": "budget",
+            "password": "password123",
+        },
+    )
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def board_id(client, auth_headers):
+    """Create an empty board owned by the `auth_headers` user."""
+    response = await client.post("/api/boards/", json={"title": "Test board"}, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when a block issues more MongoDB commands than declared.
+
+    Usage:
+        with query_budget(4):
+            await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    """
+
+    @contextmanager
+    def _budget(max_queries: int):
+        with track_queries() as counter:
+            yield counter
+        if counter.count > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {counter.count} commands issued, "
+                f"budget is {max_queries}:\n  " + "\n  ".join(counter.commands)
+            )
+
+    return _budget
@@ -0,0 +1,116 @@
+"""Board activity log with buffered writes."""
+import asyncio
+from app.models.activity import ActivityEvent
+from app.services.activity import ActivityBuffer, activity_log
+
+
+async def create_board_with_list(client, auth_headers):
+    board = (
+        await client.post(
+            "/api/boards/", json={"title": "Activity board"}, headers=auth_headers
+        )
+    ).json()
+    lst = (
+        await client.post(
+            f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+        )
+    ).json()
+    return board, lst
+
+
+async def get_activity(client, auth_headers, board_id, **params):
+    response = await client.get(
+        f"/api/boards/{board_id}/activity", params=params, headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_feed_includes_buffered_and_stored_events(client, auth_headers):
+    await activity_log.flush()
+    board, lst = await create_board_with_list(client, auth_headers)
+    card = (
+        await client.post(
+            f"/api/cards/{lst['id']}", json={"title": "Logged card"}, headers=auth_headers
+        )
+    ).json()
+
+    feed = await get_activity(client, auth_headers, board["id"])
+    assert [event["action"] for event in feed["events"]] == [
+        "card.created", "list.created", "board.created"
+    ]
+    assert feed["events"][0]["entity_id"] == card["id"]
+    assert feed["next_before"] is None
+
+    # Nothing was written yet; after the flush the feed reads the same
+    assert await ActivityEvent.find(ActivityEvent.board_id == board["id"]).count() == 0
+    assert await activity_log.flush() >= 3
+    assert await ActivityEvent.find(ActivityEvent.board_id == board["id"]).count() == 3
+    assert await get_activity(client, auth_headers, board["id"]) == feed
+
+
+async def test_feed_pages_by_event_id(client, auth_headers):
+    board, lst = await create_board_with_list(client, auth_headers)
+    for number in range(3):
+        await client.post(
+            f"/api/cards/{lst['id']}", json={"title": f"Card {number}"}, headers=auth_headers
+        )
+    await activity_log.flush()
+    await client.put(
+        f"/api/lists/{lst['id']}", json={"title": "Doing"}, headers=auth_headers
+    )
+
+    first = await get_activity(client, auth_headers, board["id"], limit=3)
+    assert [event["action"] for event in first["events"]] == [
+        "list.updated", "card.created", "card.created"
+    ]
+    assert first["events"][0]["details"] == {"fields": ["title"]}
+
+    second = await get_activity(
+        client, auth_headers, board["id"], limit=3, before=first["next_before"]
+    )
+    assert [event["action"] for event in second["events"]] == [
+        "card.created", "list.created", "board.created"
+    ]
+
+    last = await get_activity(
+        client, auth_headers, board["id"], limit=3, before=second["next_before"]
+    )
+    assert last == {"events": [], "next_before": None}
+
+    response = await client.get(
+        f"/api/boards/{board['id']}/activity", params={"before": "nope"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+async def test_full_buffer_flushes_without_waiting(client, auth_headers, monkeypatch):
+    await activity_log.flush()
+    monkeypatch.setattr(activity_log, "flush_size", 2)
+    board, _ = await create_board_with_list(client, auth_headers)
+
+    await asyncio.sleep(0)  # let the flush started by the second event run
+    await activity_log.flush()
+    assert await ActivityEvent.find(ActivityEvent.board_id == board["id"]).count() == 2
+
+
+async def test_board_delete_drops_its_activity(client, auth_headers):
+    board, _ = await create_board_with_list(client, auth_headers)
+    await activity_log.flush()
+    await client.put(
+        f"/api/boards/{board['id']}", json={"title": "Renamed"}, headers=auth_headers
+    )
+
+    response = await client.delete(f"/api/boards/{board['id']}", headers=auth_headers)
+    assert response.status_code == 204
+    assert activity_log.pending_for(board["id"]) == []
+    assert await ActivityEvent.find(ActivityEvent.board_id == board["id"]).count() == 0
+
+
+def test_buffer_drops_oldest_events_when_full():
+    buffer = ActivityBuffer(flush_size=100, flush_interval=1, max_pending=3)
+    for number in range(5):
+        buffer.record("board", "user", "card.created", str(number))
+
+    assert buffer.dropped == 2
+    assert [event["entity_id"] for event in buffer.pending_for("board")] == ["4", "3", "2"]
@@ -0,0 +1,112 @@
+"""Moving cards to and from the cards_archive collection."""
+from datetime import datetime, timedelta
+import pytest
+from app.core.config import settings
+from app.core.slow_queries import summarize_plan
+from app.models.archived_card import ArchivedCard
+from app.models.card import Card
+from app.services.archive import archive_cards, policy_queries, run_archive_policy
+
+
+@pytest.fixture
+async def board(client, auth_headers):
+    board = (
+        await client.post("/api/boards/", json={"title": "Archive board"}, headers=auth_headers)
+    ).json()
+    lst = (
+        await client.post(f"/api/lists/{board['id']}", json={"title": "Done"}, headers=auth_headers)
+    ).json()
+    cards = []
+    for done in (True, False, True):
+        response = await client.post(
+            f"/api/cards/{lst['id']}",
+            json={
+                "title": "Finished" if done else "Open",
+                "checklist": [{"id": "1", "text": "Step", "completed": done}],
+            },
+            headers=auth_headers,
+        )
+        cards.append(response.json())
+    return {"id": board["id"], "list_id": lst["id"], "cards": cards}
+
+
+async def board_card_ids(client, auth_headers, board_id):
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    return [card["id"] for lst in response.json() for card in lst["cards"]]
+
+
+async def test_archive_and_unarchive_card(client, auth_headers, board):
+    card_id = board["cards"][0]["id"]
+
+    response = await client.post(f"/api/cards/{card_id}/archive", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["board_id"] == board["id"]
+    assert card_id not in await board_card_ids(client, auth_headers, board["id"])
+
+    response = await client.get(f"/api/cards/archived/{board['id']}", headers=auth_headers)
+    assert [card["id"] for card in response.json()] == [card_id]
+
+    response = await client.post(f"/api/cards/{card_id}/unarchive", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["order"] == 3  # Restored at the end of the list
+    assert card_id in await board_card_ids(client, auth_headers, board["id"])
+    assert await ArchivedCard.count() == 0
+
+
+async def test_deleting_list_purges_its_archive(client, auth_headers, board):
+    card_id = board["cards"][0]["id"]
+    await client.post(f"/api/cards/{card_id}/archive", headers=auth_headers)
+
+    await client.delete(f"/api/lists/{board['list_id']}", headers=auth_headers)
+
+    response = await client.post(f"/api/cards/{card_id}/unarchive", headers=auth_headers)
+    assert response.status_code == 404
+    assert await ArchivedCard.count() == 0
+
+
+async def test_policy_archives_completed_cards(client, auth_headers, board):
+    old = datetime.utcnow() - timedelta(days=30)
+    await Card.get_motor_collection().update_many({}, {"$set": {"updated_at": old}})
+
+    assert await run_archive_policy() == 2
+
+    remaining = await board_card_ids(client, auth_headers, board["id"])
+    assert remaining == [board["cards"][1]["id"]]
+    reasons = {card.archive_reason for card in await ArchivedCard.find_all().to_list()}
+    assert reasons == {"completed"}
+
+
+async def test_stale_rule_is_opt_in(client, auth_headers, board, monkeypatch):
+    old = datetime.utcnow() - timedelta(days=400)
+    await Card.get_motor_collection().update_many({}, {"$set": {"updated_at": old}})
+
+    # By default open cards stay, however old
+    assert await run_archive_policy() == 2
+    assert await board_card_ids(client, auth_headers, board["id"]) == [board["cards"][1]["id"]]
+
+    monkeypatch.setattr(settings, "ARCHIVE_STALE_AFTER_DAYS", 180)
+    assert await run_archive_policy() == 1
+    archived = await ArchivedCard.get(board["cards"][1]["id"])
+    assert archived.archive_reason == "stale"
+
+
+async def test_policy_queries_use_an_index(client, board, monkeypatch):
+    monkeypatch.setattr(settings, "ARCHIVE_STALE_AFTER_DAYS", 180)
+    queries = policy_queries(datetime.utcnow())
+    assert set(queries) == {"completed", "stale"}
+
+    for query in queries.values():
+        explain = await Card.get_motor_collection().find(query).limit(
+            settings.ARCHIVE_BATCH_SIZE
+        ).explain()
+        plan = summarize_plan(explain)
+        assert "IXSCAN" in plan["stages"]
+        assert not plan["collection_scan"]
+
+
+async def test_archive_in_batches(client, auth_headers, board):
+    archived = await archive_cards({}, batch_size=2)
+
+    assert archived == {board["id"]: 3}
+    assert await Card.count() == 0
+    assert await ArchivedCard.count() == 3
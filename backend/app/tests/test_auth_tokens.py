@@ -0,0 +1,160 @@
+"""Refresh-token rotation, reuse detection and logout revocation."""
+import asyncio
+import time
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.core import token_store
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.core.token_store import REVOKED_KEY, RevocationFilter, is_session_revoked
+from app.utils.bloom import BloomFilter
+
+
+@pytest.fixture
+async def session(client, redis, auth_headers):
+    """Tokens of a fresh login for the registered user."""
+    response = await client.post(
+        "/api/auth/login",
+        json={"email": "budget@example.com", "password": "password123"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def bearer(tokens):
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+async def refresh(client, refresh_token):
+    return await client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+
+
+async def test_refresh_rotates_token(client, session):
+    response = await refresh(client, session["refresh_token"])
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != session["refresh_token"]
+
+    response = await refresh(client, rotated["refresh_token"])
+    assert response.status_code == 200
+
+
+async def test_retry_within_grace_gets_the_same_pair(client, session):
+    rotated = (await refresh(client, session["refresh_token"])).json()
+
+    # The response was lost and the client tries again
+    retried = await refresh(client, session["refresh_token"])
+    assert retried.status_code == 200
+    assert (retried.json()["access_token"], retried.json()["refresh_token"]) == (
+        rotated["access_token"], rotated["refresh_token"]
+    )
+    assert (await refresh(client, rotated["refresh_token"])).status_code == 200
+
+
+async def test_reused_refresh_token_revokes_session(client, session):
+    rotated = (await refresh(client, session["refresh_token"])).json()
+    rotated = (await refresh(client, rotated["refresh_token"])).json()
+
+    # Two rotations old: outside the grace window whatever its length
+    response = await refresh(client, session["refresh_token"])
+    assert response.status_code == 401
+
+    # The legitimate holder is logged out too, access tokens included
+    assert (await refresh(client, rotated["refresh_token"])).status_code == 401
+    response = await client.get("/api/auth/me", headers=bearer(rotated))
+    assert response.status_code == 401
+
+
+async def test_reuse_without_grace_revokes_session(client, session, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_REUSE_GRACE_SECONDS", 0)
+    rotated = (await refresh(client, session["refresh_token"])).json()
+
+    assert (await refresh(client, session["refresh_token"])).status_code == 401
+    assert (await refresh(client, rotated["refresh_token"])).status_code == 401
+
+
+async def test_logout_revokes_only_that_session(client, session, auth_headers):
+    response = await client.post("/api/auth/logout", headers=bearer(session))
+    assert response.status_code == 200
+
+    assert (await client.get("/api/auth/me", headers=bearer(session))).status_code == 401
+    assert (await refresh(client, session["refresh_token"])).status_code == 401
+    assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"session-{i}" for i in range(1000)]
+    for sid in added:
+        bloom.add(sid)
+
+    assert all(sid in bloom for sid in added)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.fixture
+def revocation_filter(monkeypatch):
+    """An empty, not yet loaded filter in place of the worker's."""
+    revocations = RevocationFilter(capacity=1000, error_rate=0.01)
+    monkeypatch.setattr(token_store, "revocations", revocations)
+    return revocations
+
+
+async def test_unloaded_filter_asks_redis(redis, revocation_filter):
+    # Revoked by another worker, the bus message never arrived
+    await redis.zadd(REVOKED_KEY, {"lost-session": time.time() + 60})
+    assert await is_session_revoked("lost-session")
+    assert not await is_session_revoked("live-session")
+
+    assert await revocation_filter.load()
+    assert revocation_filter.loaded
+    assert revocation_filter.might_be_revoked("lost-session")
+    await redis_client.connection_pool.disconnect()
+
+
+async def test_filter_fails_closed_until_loaded(revocation_filter, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(redis_client, "zrangebyscore", unavailable)
+    monkeypatch.setattr(redis_client, "zscore", unavailable)
+    assert not await revocation_filter.load()
+    assert await is_session_revoked("any-session")
+
+    monkeypatch.setattr(token_store, "LOAD_RETRY_SECONDS", 0)
+    attempts = []
+
+    async def recovers(*args, **kwargs):
+        attempts.append(args)
+        if len(attempts) < 3:
+            raise RedisConnectionError("Redis is down")
+        return []
+
+    monkeypatch.setattr(redis_client, "zrangebyscore", recovers)
+    await revocation_filter.load_until_loaded()
+    assert len(attempts) == 3
+    # Loaded: the filter answers without Redis again
+    assert not await is_session_revoked("any-session")
+
+
+async def test_startup_while_redis_is_down(redis, revocation_filter, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(redis_client, "zrangebyscore", unavailable)
+    monkeypatch.setattr(token_store, "LOAD_RETRY_SECONDS", 3600)
+    revocation_filter.start()
+    await asyncio.sleep(0)
+    assert not revocation_filter.loaded
+
+    # Redis answers again before the next load attempt: sessions are looked up directly
+    await redis.zadd(REVOKED_KEY, {"revoked-session": time.time() + 60})
+    assert not await is_session_revoked("live-session")
+    assert await is_session_revoked("revoked-session")
+
+    # Only a failed lookup fails closed
+    monkeypatch.setattr(redis_client, "zscore", unavailable)
+    assert await is_session_revoked("live-session")
+    await revocation_filter.stop()
+    await redis_client.connection_pool.disconnect()
@@ -0,0 +1,114 @@
+"""Server-side board duplication and templates."""
+from app.core.config import settings
+from app.models.board import Board
+from app.models.user import User
+from app.services import board_copy
+
+
+async def make_board(client, auth_headers, lists=2, cards_per_list=3):
+    board = (
+        await client.post(
+            "/api/boards/", json={"title": "Source board"}, headers=auth_headers
+        )
+    ).json()
+    for i in range(lists):
+        lst = (
+            await client.post(
+                f"/api/lists/{board['id']}",
+                json={"title": f"List {i}"},
+                headers=auth_headers,
+            )
+        ).json()
+        for j in range(cards_per_list):
+            await client.post(
+                f"/api/cards/{lst['id']}",
+                json={"title": f"Card {i}-{j}", "labels": ["red"]},
+                headers=auth_headers,
+            )
+    return board
+
+
+async def get_lists(client, auth_headers, board_id):
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    return response.json()
+
+
+async def test_duplicate_copies_lists_and_cards(client, auth_headers, query_budget):
+    board = await make_board(client, auth_headers)
+
+    # A fixed number of commands however many lists and cards are copied
+    with query_budget(11):
+        response = await client.post(
+            f"/api/boards/{board['id']}/duplicate", json={}, headers=auth_headers
+        )
+    assert response.status_code == 201, response.text
+    copy = response.json()
+    assert copy["title"] == "Copy of Source board"
+    assert copy["is_template"] is False
+
+    source_lists = await get_lists(client, auth_headers, board["id"])
+    copied_lists = await get_lists(client, auth_headers, copy["id"])
+    assert [lst["title"] for lst in copied_lists] == [
+        lst["title"] for lst in source_lists
+    ]
+    for source, copied in zip(source_lists, copied_lists):
+        assert copied["id"] != source["id"]
+        assert [c["title"] for c in copied["cards"]] == [
+            c["title"] for c in source["cards"]
+        ]
+        assert all(c["list_id"] == copied["id"] for c in copied["cards"])
+        assert not {c["id"] for c in copied["cards"]} & {
+            c["id"] for c in source["cards"]
+        }
+
+    assert (await Board.get(copy["id"])).card_count == 6
+    assert (await User.find_one()).board_count == 2
+
+
+async def test_duplicate_inserts_cards_in_chunks(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(board_copy, "COPY_CHUNK_SIZE", 4)
+    board = await make_board(client, auth_headers, lists=3, cards_per_list=3)
+
+    response = await client.post(
+        f"/api/boards/{board['id']}/duplicate", json={}, headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    lists = await get_lists(client, auth_headers, response.json()["id"])
+    assert sum(len(lst["cards"]) for lst in lists) == 9
+    assert (await Board.get(response.json()["id"])).card_count == 9
+
+
+async def test_board_from_template(client, auth_headers):
+    board = await make_board(client, auth_headers)
+    template = (
+        await client.post(
+            f"/api/boards/{board['id']}/duplicate",
+            json={"title": "Sprint template", "include_cards": False, "as_template": True},
+            headers=auth_headers,
+        )
+    ).json()
+    assert template["is_template"] is True
+
+    response = await client.post(
+        f"/api/boards/{template['id']}/duplicate", json={}, headers=auth_headers
+    )
+    assert response.status_code == 201
+    new_board = response.json()
+    assert new_board["title"] == "Sprint template"
+    assert new_board["is_template"] is False
+
+    lists = await get_lists(client, auth_headers, new_board["id"])
+    assert [lst["title"] for lst in lists] == ["List 0", "List 1"]
+    assert all(lst["cards"] == [] for lst in lists)
+
+
+async def test_duplicate_respects_board_quota(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_BOARDS_PER_USER", 1)
+    board = await make_board(client, auth_headers, lists=1, cards_per_list=1)
+
+    response = await client.post(
+        f"/api/boards/{board['id']}/duplicate", json={}, headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert await Board.count() == 1
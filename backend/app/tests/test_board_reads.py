@@ -0,0 +1,120 @@
+"""Single-flight board reads, board versions and the list reorders that bump them."""
+import asyncio
+import pytest
+from app.utils.board_versions import BoardVersions
+from app.utils.single_flight import SingleFlight
+
+
+async def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    readers = [asyncio.create_task(flights.do(("board", 0), fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert flights.in_flight == 1
+    release.set()
+    assert await asyncio.gather(*readers) == [1] * 5
+    assert flights.in_flight == 0
+
+    # Nothing is cached once the call is done
+    assert await flights.do(("board", 0), fetch) == 2
+
+
+async def test_failure_reaches_every_waiting_caller():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flights.in_flight == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "lists"
+
+    leaving = asyncio.create_task(flights.do("key", fetch))
+    staying = asyncio.create_task(flights.do("key", fetch))
+    await asyncio.sleep(0)
+    leaving.cancel()
+    release.set()
+    assert await staying == "lists"
+
+
+def test_bump_moves_only_that_board_forward():
+    versions = BoardVersions()
+    versions.bump("a")
+    versions.bump("a")
+    versions.bump("b")
+    assert (versions.get("a"), versions.get("b"), versions.get("c")) == (2, 1, 0)
+
+
+async def board_titles(client, auth_headers, board_id):
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    return [lst["title"] for lst in response.json()]
+
+
+@pytest.fixture
+async def two_lists(client, auth_headers, board_id):
+    lists = [
+        (await client.post(f"/api/lists/{board_id}", json={"title": title}, headers=auth_headers)).json()
+        for title in ("First", "Second")
+    ]
+    # Cache the board's view before the reorders below
+    assert await board_titles(client, auth_headers, board_id) == ["First", "Second"]
+    return [lst["id"] for lst in lists]
+
+
+async def test_reorder_invalidates_the_cached_view(client, auth_headers, board_id, two_lists):
+    first, second = two_lists
+    response = await client.post(
+        f"/api/lists/{board_id}/reorder",
+        json={"list_orders": {first: 1, second: 0}}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert await board_titles(client, auth_headers, board_id) == ["Second", "First"]
+
+
+async def test_empty_reorder_is_accepted(client, auth_headers, board_id, two_lists):
+    response = await client.post(
+        f"/api/lists/{board_id}/reorder", json={"list_orders": {}}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert await board_titles(client, auth_headers, board_id) == ["First", "Second"]
+
+
+async def test_reorder_ignores_unknown_and_foreign_lists(client, auth_headers, board_id, two_lists):
+    first, second = two_lists
+    other_board = (
+        await client.post("/api/boards/", json={"title": "Other board"}, headers=auth_headers)
+    ).json()["id"]
+    foreign = (
+        await client.post(f"/api/lists/{other_board}", json={"title": "Foreign"}, headers=auth_headers)
+    ).json()["id"]
+
+    # The unknown and foreign ids come last: the board bumped is still this one
+    response = await client.post(
+        f"/api/lists/{board_id}/reorder",
+        json={"list_orders": {first: 1, second: 0, "0" * 24: 5, foreign: 9}}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert await board_titles(client, auth_headers, board_id) == ["Second", "First"]
+
+    response = await client.get(f"/api/lists/{other_board}", headers=auth_headers)
+    assert response.json()[0]["order"] == 0
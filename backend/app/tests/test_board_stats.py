@@ -0,0 +1,121 @@
+"""Incrementally maintained board statistics."""
+from datetime import datetime, timedelta
+from app.models.board_stats import BoardStats
+from app.services.board_stats import rebuild_board_stats
+
+
+async def create_board_with_lists(client, auth_headers):
+    board = (
+        await client.post(
+            "/api/boards/", json={"title": "Stats board"}, headers=auth_headers
+        )
+    ).json()
+    lists = []
+    for title in ("To Do", "Done"):
+        response = await client.post(
+            f"/api/lists/{board['id']}", json={"title": title}, headers=auth_headers
+        )
+        lists.append(response.json())
+    return board, lists
+
+
+async def create_card(client, auth_headers, list_id, **fields):
+    response = await client.post(
+        f"/api/cards/{list_id}",
+        json={"title": "Stats card", **fields},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def get_stats(client, auth_headers, board_id):
+    response = await client.get(f"/api/boards/{board_id}/stats", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_stats_follow_card_changes(client, auth_headers):
+    board, (todo, done) = await create_board_with_lists(client, auth_headers)
+    yesterday = (datetime.utcnow() - timedelta(days=1)).isoformat()
+
+    # First read builds the stats document
+    stats = await get_stats(client, auth_headers, board["id"])
+    assert stats["card_count"] == 0
+
+    overdue = await create_card(client, auth_headers, todo["id"], due_date=yesterday)
+    card = await create_card(client, auth_headers, todo["id"])
+    await client.post(
+        f"/api/cards/{card['id']}/checklist", json={"text": "One"}, headers=auth_headers
+    )
+    item = (
+        await client.post(
+            f"/api/cards/{card['id']}/checklist", json={"text": "Two"}, headers=auth_headers
+        )
+    ).json()
+    await client.patch(
+        f"/api/cards/{card['id']}/checklist/{item['id']}",
+        json={"completed": True},
+        headers=auth_headers,
+    )
+    await client.post(
+        f"/api/cards/{card['id']}/move",
+        json={"target_list_id": done["id"], "new_order": 0},
+        headers=auth_headers,
+    )
+
+    stats = await get_stats(client, auth_headers, board["id"])
+    assert stats["card_count"] == 2
+    assert stats["list_counts"] == {todo["id"]: 1, done["id"]: 1}
+    assert stats["overdue_count"] == 1
+    assert stats["checklist_total"] == 2
+    assert stats["checklist_completed"] == 1
+    assert stats["checklist_completion"] == 0.5
+
+    await client.put(
+        f"/api/cards/{overdue['id']}", json={"due_date": None}, headers=auth_headers
+    )
+    await client.delete(f"/api/cards/{card['id']}", headers=auth_headers)
+
+    stats = await get_stats(client, auth_headers, board["id"])
+    assert stats["card_count"] == 1
+    assert stats["list_counts"] == {todo["id"]: 1, done["id"]: 0}
+    assert stats["overdue_count"] == 0
+    assert stats["checklist_total"] == 0
+
+
+async def test_rebuild_matches_incremental_stats(client, auth_headers):
+    board, (todo, done) = await create_board_with_lists(client, auth_headers)
+    await get_stats(client, auth_headers, board["id"])
+    await create_card(
+        client,
+        auth_headers,
+        todo["id"],
+        due_date=(datetime.utcnow() + timedelta(days=3)).isoformat(),
+        checklist=[{"id": "a", "text": "A", "completed": True}],
+    )
+    await create_card(client, auth_headers, done["id"])
+    incremental = await get_stats(client, auth_headers, board["id"])
+
+    # Drift introduced behind the routes' back is repaired by the rebuild
+    await BoardStats.get_motor_collection().update_one(
+        {"board_id": board["id"]}, {"$inc": {"card_count": 5}}
+    )
+    await rebuild_board_stats(board["id"])
+
+    rebuilt = await get_stats(client, auth_headers, board["id"])
+    for field in ("card_count", "list_counts", "overdue_count", "checklist_completed"):
+        assert rebuilt[field] == incremental[field]
+
+
+async def test_deleting_a_list_updates_stats(client, auth_headers):
+    board, (todo, done) = await create_board_with_lists(client, auth_headers)
+    await get_stats(client, auth_headers, board["id"])
+    await create_card(client, auth_headers, todo["id"])
+    await create_card(client, auth_headers, done["id"])
+
+    await client.delete(f"/api/lists/{todo['id']}", headers=auth_headers)
+
+    stats = await get_stats(client, auth_headers, board["id"])
+    assert stats["card_count"] == 1
+    assert stats["list_counts"] == {done["id"]: 1}
@@ -0,0 +1,134 @@
+"""Card summaries in the board view and the card detail endpoint."""
+from datetime import datetime
+from app.models.card import Card
+
+
+async def create_board_with_list(client, auth_headers):
+    board = (
+        await client.post(
+            "/api/boards/", json={"title": "Summary board"}, headers=auth_headers
+        )
+    ).json()
+    lst = (
+        await client.post(
+            f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+        )
+    ).json()
+    return board, lst
+
+
+async def get_summaries(client, auth_headers, board_id):
+    response = await client.get(
+        f"/api/lists/{board_id}", params={"view": "summary"}, headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    return {card["id"]: card for lst in response.json() for card in lst["cards"]}
+
+
+async def test_summary_leaves_out_details(client, auth_headers):
+    board, lst = await create_board_with_list(client, auth_headers)
+    card = (
+        await client.post(
+            f"/api/cards/{lst['id']}",
+            json={
+                "title": "Detailed card",
+                "description": "Long text " * 40,
+                "labels": ["red"],
+                "checklist": [
+                    {"id": "1", "text": "One", "completed": True},
+                    {"id": "2", "text": "Two", "completed": False},
+                ],
+            },
+            headers=auth_headers,
+        )
+    ).json()
+
+    summary = (await get_summaries(client, auth_headers, board["id"]))[card["id"]]
+    assert "description" not in summary
+    assert "checklist" not in summary
+    assert summary["labels"] == ["red"]
+    assert (summary["checklist_total"], summary["checklist_completed"]) == (2, 1)
+
+    # The full view is unchanged
+    full = (await client.get(f"/api/lists/{board['id']}", headers=auth_headers)).json()
+    assert full[0]["cards"][0]["description"] == card["description"]
+
+    response = await client.get(f"/api/cards/{card['id']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["checklist"] == card["checklist"]
+
+
+async def test_checklist_counts_follow_every_write(client, auth_headers):
+    board, lst = await create_board_with_list(client, auth_headers)
+    card = (
+        await client.post(
+            f"/api/cards/{lst['id']}", json={"title": "Counted card"}, headers=auth_headers
+        )
+    ).json()
+    base = f"/api/cards/{card['id']}/checklist"
+
+    async def counts():
+        summary = (await get_summaries(client, auth_headers, board["id"]))[card["id"]]
+        return summary["checklist_total"], summary["checklist_completed"]
+
+    first = (await client.post(base, json={"text": "$first"}, headers=auth_headers)).json()
+    await client.post(base, json={"text": "Second", "completed": True}, headers=auth_headers)
+    assert await counts() == (2, 1)
+
+    await client.patch(f"{base}/{first['id']}", json={"completed": True}, headers=auth_headers)
+    assert await counts() == (2, 2)
+
+    await client.delete(f"{base}/{first['id']}", headers=auth_headers)
+    assert await counts() == (1, 1)
+
+    await client.put(
+        f"/api/cards/{card['id']}",
+        json={"checklist": [
+            {"id": "a", "text": "A", "completed": False},
+            {"id": "b", "text": "B", "completed": False},
+            {"id": "c", "text": "C", "completed": True},
+        ]},
+        headers=auth_headers,
+    )
+    assert await counts() == (3, 1)
+
+    detail = (await client.get(f"/api/cards/{card['id']}", headers=auth_headers)).json()
+    assert [item["text"] for item in detail["checklist"]] == ["A", "B", "C"]
+
+
+async def test_summary_counts_cards_written_before_counters(client, auth_headers):
+    board, lst = await create_board_with_list(client, auth_headers)
+    now = datetime.utcnow()
+    result = await Card.get_motor_collection().insert_one({
+        "title": "Old card",
+        "labels": [],
+        "checklist": [{"id": "1", "text": "Done", "completed": True}],
+        "order": 0,
+        "list_id": lst["id"],
+        "revision": 0,
+        "created_at": now,
+        "updated_at": now,
+    })
+
+    summary = (await get_summaries(client, auth_headers, board["id"]))[str(result.inserted_id)]
+    assert (summary["checklist_total"], summary["checklist_completed"]) == (1, 1)
+
+
+async def test_get_card_checks_ownership(client, auth_headers):
+    _, lst = await create_board_with_list(client, auth_headers)
+    card = (
+        await client.post(
+            f"/api/cards/{lst['id']}", json={"title": "Private card"}, headers=auth_headers
+        )
+    ).json()
+
+    response = await client.post(
+        "/api/auth/register",
+        json={"email": "other@example.com", "username": "other", "password": "password123"},
+    )
+    other = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await client.get(f"/api/cards/{card['id']}", headers=other)
+    assert response.status_code == 403
+    response = await client.get("/api/cards/507f1f77bcf86cd799439011", headers=auth_headers)
+    assert response.status_code == 404
@@ -0,0 +1,143 @@
+"""Checklist item endpoints: add, edit, remove and reorder."""
+import pytest
+from app.api.routes import cards as card_routes
+from app.models.card import Card
+
+
+@pytest.fixture
+async def card_id(client, auth_headers, board_id):
+    lst = (await client.post(f"/api/lists/{board_id}", json={"title": "To Do"}, headers=auth_headers)).json()
+    card = (await client.post(f"/api/cards/{lst['id']}", json={"title": "Card one"}, headers=auth_headers)).json()
+    return card["id"]
+
+
+async def add_item(client, auth_headers, card_id, text, **fields):
+    return await client.post(
+        f"/api/cards/{card_id}/checklist", json={"text": text, **fields}, headers=auth_headers
+    )
+
+
+async def stored_checklist(card_id):
+    card = await Card.get(card_id)
+    return [(item.id, item.text, item.completed) for item in card.checklist], (
+        card.checklist_total, card.checklist_completed
+    )
+
+
+async def test_add_edit_and_remove_items(client, auth_headers, card_id):
+    first = await add_item(client, auth_headers, card_id, "Step one", id="one")
+    assert first.status_code == 201
+    assert first.json() == {"id": "one", "text": "Step one", "completed": False}
+    second = (await add_item(client, auth_headers, card_id, "Step two")).json()
+
+    response = await client.patch(
+        f"/api/cards/{card_id}/checklist/one", json={"completed": True}, headers=auth_headers
+    )
+    assert response.json() == {"id": "one", "text": "Step one", "completed": True}
+    assert await stored_checklist(card_id) == (
+        [("one", "Step one", True), (second["id"], "Step two", False)], (2, 1)
+    )
+
+    response = await client.delete(f"/api/cards/{card_id}/checklist/one", headers=auth_headers)
+    assert response.status_code == 204
+    assert await stored_checklist(card_id) == ([(second["id"], "Step two", False)], (1, 0))
+
+
+async def test_toggles_keep_the_counters_exact(client, auth_headers, card_id):
+    await add_item(client, auth_headers, card_id, "Step one", id="one")
+    await add_item(client, auth_headers, card_id, "Step two", id="two", completed=True)
+    assert (await stored_checklist(card_id))[1] == (2, 1)
+
+    url = f"/api/cards/{card_id}/checklist/one"
+    for completed, counts in ((True, (2, 2)), (True, (2, 2)), (False, (2, 1)), (False, (2, 1))):
+        response = await client.patch(url, json={"completed": completed}, headers=auth_headers)
+        assert response.json()["completed"] is completed
+        assert (await stored_checklist(card_id))[1] == counts
+
+    # Editing the text leaves the state and the counters alone
+    response = await client.patch(url, json={"text": "Step 1"}, headers=auth_headers)
+    assert response.json() == {"id": "one", "text": "Step 1", "completed": False}
+    await client.delete(f"/api/cards/{card_id}/checklist/two", headers=auth_headers)
+    assert await stored_checklist(card_id) == ([("one", "Step 1", False)], (1, 0))
+
+
+async def test_duplicate_and_unknown_items(client, auth_headers, card_id):
+    await add_item(client, auth_headers, card_id, "Step one", id="one")
+    response = await add_item(client, auth_headers, card_id, "Again", id="one")
+    assert response.status_code == 409
+
+    response = await client.patch(
+        f"/api/cards/{card_id}/checklist/missing", json={"completed": True}, headers=auth_headers
+    )
+    assert response.status_code == 404
+    response = await client.delete(f"/api/cards/{card_id}/checklist/missing", headers=auth_headers)
+    assert response.status_code == 404
+    response = await client.patch(f"/api/cards/{card_id}/checklist/one", json={}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+async def test_reorder(client, auth_headers, card_id):
+    for item_id in ("a", "b", "c"):
+        await add_item(client, auth_headers, card_id, f"Step {item_id}", id=item_id)
+
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": ["c", "a", "b"]}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ["c", "a", "b"]
+    assert [item_id for item_id, _, _ in (await stored_checklist(card_id))[0]] == ["c", "a", "b"]
+
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": ["a", "a", "b"]}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+async def test_reorder_conflicts_with_concurrent_adds_and_removals(client, auth_headers, card_id):
+    for item_id in ("a", "b"):
+        await add_item(client, auth_headers, card_id, f"Step {item_id}", id=item_id)
+    seen = ["b", "a"]
+
+    # Someone else adds an item after this client loaded the card
+    await add_item(client, auth_headers, card_id, "Step c", id="c")
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": seen}, headers=auth_headers
+    )
+    assert response.status_code == 409
+
+    # ... or removes one
+    await client.delete(f"/api/cards/{card_id}/checklist/c", headers=auth_headers)
+    await client.delete(f"/api/cards/{card_id}/checklist/a", headers=auth_headers)
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": seen}, headers=auth_headers
+    )
+    assert response.status_code == 409
+    assert [item_id for item_id, _, _ in (await stored_checklist(card_id))[0]] == ["b"]
+
+
+async def test_empty_reorder_of_an_empty_checklist(client, auth_headers, card_id):
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": []}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+
+    await add_item(client, auth_headers, card_id, "Step one")
+    response = await client.put(
+        f"/api/cards/{card_id}/checklist/order", json={"item_ids": []}, headers=auth_headers
+    )
+    assert response.status_code == 409
+
+
+async def test_card_deleted_mid_request_is_404(client, auth_headers, card_id, monkeypatch):
+    verify = card_routes.verify_card_ownership
+
+    async def verify_then_delete(*args):
+        card, lst = await verify(*args)
+        await Card.get_motor_collection().delete_one({"_id": card.id})
+        return card, lst
+
+    monkeypatch.setattr(card_routes, "verify_card_ownership", verify_then_delete)
+    response = await add_item(client, auth_headers, card_id, "Step one")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Card not found"
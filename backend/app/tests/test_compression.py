@@ -0,0 +1,177 @@
+"""Negotiated response compression and the board snapshot cache."""
+import gzip
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from app.core.config import settings
+from app.middleware.compression import CompressionMiddleware
+from app.utils import snapshots
+from app.utils.compression import ENCODERS, negotiate_encoding
+from app.utils.snapshots import Snapshot, SnapshotCache
+
+BODY = b'{"cards": "' + b"x" * 4096 + b'"}'
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_ENCODINGS", ["gzip"])
+
+
+def test_client_quality_wins_over_server_order():
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0.4, zstd;q=0.6") == ("zstd" if "zstd" in ENCODERS else "gzip")
+    assert negotiate_encoding("*") == next(
+        coding for coding in settings.COMPRESSION_ENCODINGS if coding in ENCODERS
+    )
+
+
+def test_zero_quality_refuses_a_coding():
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*;q=0") is None
+    assert negotiate_encoding("*;q=0, gzip") == "gzip"
+    assert negotiate_encoding("GZIP; q=0, *") != "gzip"
+    # identity is never offered by name; refusing it does not refuse gzip
+    assert negotiate_encoding("identity;q=0") is None
+    assert negotiate_encoding("gzip, identity;q=0") == "gzip"
+
+
+def test_nothing_to_negotiate(monkeypatch):
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("compress, deflate") is None
+    assert negotiate_encoding("gzip;q=bogus") is None
+    monkeypatch.setattr(settings, "COMPRESSION_ENABLED", False)
+    assert negotiate_encoding("gzip") is None
+
+
+@pytest.fixture
+async def http_client():
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return Response(BODY, media_type="application/json")
+
+    @app.get("/small")
+    async def small():
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(BODY), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/image")
+    async def image():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield BODY
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    app.add_middleware(CompressionMiddleware)
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+async def test_large_bodies_are_compressed(http_client, gzip_only):
+    response = await http_client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(BODY)
+    assert response.content == BODY
+
+    plain = await http_client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.content == BODY
+
+
+async def test_small_bodies_pass_through(http_client, gzip_only):
+    response = await http_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.content == b"{}"
+
+
+async def test_encoded_and_binary_bodies_pass_through(http_client, gzip_only):
+    response = await http_client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+    # Decoded once by httpx: compressed exactly once on the way out
+    assert response.content == BODY
+
+    image = await http_client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in image.headers
+    assert image.content == BODY
+
+
+async def test_streaming_bodies_are_compressed_chunk_by_chunk(http_client, gzip_only):
+    response = await http_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Length" not in response.headers
+    assert response.content == BODY * 3
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(snapshots.time, "monotonic", clock)
+    return clock
+
+
+def test_snapshot_cache_rejects_other_versions(clock):
+    cache = SnapshotCache(max_entries=4, ttl_seconds=60)
+    snapshot = Snapshot(BODY)
+    cache.set("board", 1, snapshot)
+    assert cache.get("board", 1) is snapshot
+    assert cache.get("board", 2) is None
+    # The stale entry is gone, even for its own version
+    assert cache.get("board", 1) is None
+
+
+def test_snapshot_cache_expires_entries(clock):
+    cache = SnapshotCache(max_entries=4, ttl_seconds=60)
+    cache.set("board", 1, Snapshot(BODY))
+    clock.now += 59
+    assert cache.get("board", 1) is not None
+    clock.now += 2
+    assert cache.get("board", 1) is None
+
+
+def test_snapshot_cache_evicts_least_recently_used(clock):
+    cache = SnapshotCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 0, Snapshot(b"a"))
+    cache.set("b", 0, Snapshot(b"b"))
+    cache.get("a", 0)
+    cache.set("c", 0, Snapshot(b"c"))
+    assert [cache.get(key, 0) is not None for key in ("a", "b", "c")] == [True, False, True]
+
+    disabled = SnapshotCache(max_entries=0, ttl_seconds=60)
+    disabled.set("a", 0, Snapshot(b"a"))
+    assert disabled.get("a", 0) is None
+
+
+def test_snapshot_compresses_each_coding_once():
+    snapshot = Snapshot(BODY)
+    compressed = snapshot.compressed("gzip")
+    assert gzip.decompress(compressed) == BODY
+    assert snapshot.compressed("gzip") is compressed
+
+
+def test_snapshot_cache_reports_dropped_keys(clock):
+    dropped = []
+    cache = SnapshotCache(max_entries=2, ttl_seconds=60, on_drop=dropped.append)
+    for key in ("a", "b", "c"):
+        cache.set(key, 0, Snapshot(b"x"))
+    cache.discard("b")
+    cache.discard("missing")
+    cache.get("c", 1)
+    assert dropped == ["a", "b", "c"]
@@ -0,0 +1,131 @@
+"""Dashboard aggregation and its per-user cache."""
+from datetime import datetime, timedelta
+from app.utils import snapshots
+from app.utils.dashboard_cache import DashboardCache
+from app.utils.snapshots import Snapshot
+
+
+async def create_board(client, auth_headers, title):
+    response = await client.post(
+        "/api/boards/", json={"title": title}, headers=auth_headers
+    )
+    return response.json()
+
+
+async def create_list(client, auth_headers, board_id, title="To Do"):
+    response = await client.post(
+        f"/api/lists/{board_id}", json={"title": title}, headers=auth_headers
+    )
+    return response.json()
+
+
+async def create_card(client, auth_headers, list_id, title, **fields):
+    response = await client.post(
+        f"/api/cards/{list_id}", json={"title": title, **fields}, headers=auth_headers
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_dashboard_in_one_request(client, auth_headers, query_budget):
+    now = datetime.utcnow()
+    first = await create_board(client, auth_headers, "First board")
+    second = await create_board(client, auth_headers, "Second board")
+    todo = await create_list(client, auth_headers, first["id"])
+    other = await create_list(client, auth_headers, second["id"])
+    await create_card(
+        client, auth_headers, todo["id"], "Due later",
+        due_date=(now + timedelta(days=3)).isoformat(),
+    )
+    await create_card(
+        client, auth_headers, other["id"], "Due soon",
+        due_date=(now + timedelta(days=1)).isoformat(),
+    )
+    await create_card(
+        client, auth_headers, todo["id"], "Overdue",
+        due_date=(now - timedelta(days=2)).isoformat(),
+    )
+    await create_card(client, auth_headers, other["id"], "No due date")
+    for board in (first, second):
+        await client.get(f"/api/boards/{board['id']}/stats", headers=auth_headers)
+
+    # User lookup, the aggregation and the activity events
+    with query_budget(3):
+        response = await client.get("/api/dashboard", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    dashboard = response.json()
+
+    boards = {board["title"]: board for board in dashboard["boards"]}
+    assert boards["First board"]["list_count"] == 1
+    assert boards["First board"]["card_count"] == 2
+    assert boards["First board"]["overdue_count"] == 1
+    assert boards["Second board"]["card_count"] == 2
+
+    assert [card["title"] for card in dashboard["upcoming"]] == ["Due soon", "Due later"]
+    assert dashboard["upcoming"][0]["board_title"] == "Second board"
+    assert dashboard["upcoming"][0]["list_title"] == "To Do"
+    assert dashboard["recently_updated"][0]["title"] == "No due date"
+    assert len(dashboard["recently_updated"]) == 4
+
+    # Still buffered: 2 boards, 2 lists, 4 cards
+    assert len(dashboard["recent_activity"]) == 8
+    latest = dashboard["recent_activity"][0]
+    assert (latest["action"], latest["board_id"]) == ("card.created", second["id"])
+
+
+async def test_dashboard_cache_follows_changes(client, auth_headers, query_budget):
+    board = await create_board(client, auth_headers, "Cached board")
+    todo = await create_list(client, auth_headers, board["id"])
+    await client.get("/api/dashboard", headers=auth_headers)
+
+    # Cached: only the user lookup
+    with query_budget(1):
+        await client.get("/api/dashboard", headers=auth_headers)
+
+    await create_card(client, auth_headers, todo["id"], "New card")
+    dashboard = (await client.get("/api/dashboard", headers=auth_headers)).json()
+    assert dashboard["boards"][0]["card_count"] == 1
+
+    await create_board(client, auth_headers, "Another board")
+    dashboard = (await client.get("/api/dashboard", headers=auth_headers)).json()
+    assert len(dashboard["boards"]) == 2
+
+
+def test_board_change_drops_owner_dashboard():
+    cache = DashboardCache(None, max_entries=8, ttl_seconds=60)
+    cache.set("alice", cache.version("alice"), ["board-a"], Snapshot(b"{}"))
+    cache.set("bob", cache.version("bob"), ["board-b"], Snapshot(b"{}"))
+
+    cache._board_changed("board-a")
+    assert cache.get("alice") is None
+    assert cache.get("bob") is not None
+
+    # A dashboard built before the change must not be stored as current
+    stale_version = cache.version("bob")
+    cache.invalidate("bob")
+    cache.set("bob", stale_version, ["board-b"], Snapshot(b"{}"))
+    assert cache.get("bob") is None
+
+
+def test_owner_map_follows_cached_dashboards(monkeypatch):
+    cache = DashboardCache(None, max_entries=2, ttl_seconds=60)
+    cache.set("alice", cache.version("alice"), ["board-a", "board-c"], Snapshot(b"{}"))
+    cache.set("bob", cache.version("bob"), ["board-b"], Snapshot(b"{}"))
+    assert cache._owners == {"board-a": "alice", "board-c": "alice", "board-b": "bob"}
+
+    # Rebuilt without board-c (deleted)
+    cache.set("alice", cache.version("alice"), ["board-a"], Snapshot(b"{}"))
+    assert cache._owners == {"board-a": "alice", "board-b": "bob"}
+
+    cache.invalidate("alice")
+    assert cache._owners == {"board-b": "bob"}
+
+    # Evicted by a newer dashboard
+    cache.set("carol", cache.version("carol"), ["board-x"], Snapshot(b"{}"))
+    cache.set("dave", cache.version("dave"), ["board-y"], Snapshot(b"{}"))
+    assert cache._owners == {"board-x": "carol", "board-y": "dave"}
+
+    # Expired
+    monkeypatch.setattr(snapshots.time, "monotonic", lambda: float("inf"))
+    assert cache.get("carol") is None
+    assert cache._owners == {"board-y": "dave"}
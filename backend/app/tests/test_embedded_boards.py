@@ -0,0 +1,138 @@
+"""Embedded board documents (BOARD_STORAGE_MODE=embedded) and the migration between modes."""
+import pytest
+from bson import ObjectId
+from app.core.config import settings
+from app.models.board_document import BoardDocument
+from app.models.card import Card
+from app.services import embedded_boards
+from app.services.embedded_boards import (
+    build_board_document, migrate_to_collections, migrate_to_embedded, unpack_board_document
+)
+
+
+@pytest.fixture
+def embedded(monkeypatch):
+    monkeypatch.setattr(settings, "BOARD_STORAGE_MODE", "embedded")
+
+
+@pytest.fixture
+async def board_id(embedded, board_id, client, auth_headers):
+    # The first read builds the board's document
+    await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    return board_id
+
+
+def board_contents(document):
+    lists, cards = unpack_board_document(document)
+    return [lst.model_dump() for lst in lists], cards
+
+
+async def assert_mirrored(board_id):
+    document = await BoardDocument.get_motor_collection().find_one({"_id": ObjectId(board_id)})
+    assert document is not None
+    assert board_contents(document) == board_contents(await build_board_document(board_id))
+
+
+async def test_writes_are_mirrored_into_the_board_document(client, auth_headers, board_id):
+    todo, done = [
+        (await client.post(f"/api/lists/{board_id}", json={"title": title}, headers=auth_headers)).json()
+        for title in ("To Do", "Done")
+    ]
+    cards = [
+        (await client.post(f"/api/cards/{todo['id']}", json={"title": title}, headers=auth_headers)).json()
+        for title in ("Card one", "Card two", "Card three")
+    ]
+    first = cards[0]["id"]
+
+    await client.put(f"/api/cards/{first}", json={"title": "Renamed"}, headers=auth_headers)
+    item = (
+        await client.post(f"/api/cards/{first}/checklist", json={"text": "Step"}, headers=auth_headers)
+    ).json()
+    other = (
+        await client.post(f"/api/cards/{first}/checklist", json={"text": "Other"}, headers=auth_headers)
+    ).json()
+    await client.patch(
+        f"/api/cards/{first}/checklist/{item['id']}", json={"completed": True}, headers=auth_headers
+    )
+    await client.put(
+        f"/api/cards/{first}/checklist/order",
+        json={"item_ids": [other["id"], item["id"]]}, headers=auth_headers
+    )
+    await client.delete(f"/api/cards/{first}/checklist/{other['id']}", headers=auth_headers)
+    await client.post(
+        f"/api/cards/{todo['id']}/reorder",
+        json={"card_orders": {first: 5, cards[2]["id"]: 0}}, headers=auth_headers
+    )
+    await client.post(
+        f"/api/cards/{cards[1]['id']}/move",
+        json={"target_list_id": done["id"], "new_order": 0}, headers=auth_headers
+    )
+    await client.post(
+        f"/api/lists/{board_id}/reorder",
+        json={"list_orders": {todo["id"]: 1, done["id"]: 0}}, headers=auth_headers
+    )
+    await client.put(f"/api/lists/{done['id']}", json={"title": "Finished"}, headers=auth_headers)
+    await client.delete(f"/api/cards/{cards[2]['id']}", headers=auth_headers)
+    await assert_mirrored(board_id)
+
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    assert [(lst["title"], [card["title"] for card in lst["cards"]]) for lst in response.json()] == [
+        ("Finished", ["Card two"]),
+        ("To Do", ["Renamed"]),
+    ]
+    renamed = response.json()[1]["cards"][0]
+    assert [(entry["text"], entry["completed"]) for entry in renamed["checklist"]] == [("Step", True)]
+
+    await client.delete(f"/api/lists/{done['id']}", headers=auth_headers)
+    await assert_mirrored(board_id)
+
+
+async def test_board_view_is_one_fetch(client, auth_headers, board_id, query_budget):
+    lst = (await client.post(f"/api/lists/{board_id}", json={"title": "To Do"}, headers=auth_headers)).json()
+    await client.post(f"/api/cards/{lst['id']}", json={"title": "Card one"}, headers=auth_headers)
+
+    # User, board ownership, board document
+    with query_budget(3):
+        response = await client.get(
+            f"/api/lists/{board_id}", params={"view": "summary"}, headers=auth_headers
+        )
+    assert response.json()[0]["cards"][0]["title"] == "Card one"
+
+
+async def test_migration_round_trip(client, auth_headers):
+    board = (await client.post("/api/boards/", json={"title": "Migrated"}, headers=auth_headers)).json()
+    lst = (await client.post(f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers)).json()
+    card = (await client.post(f"/api/cards/{lst['id']}", json={"title": "Card one"}, headers=auth_headers)).json()
+
+    assert await migrate_to_embedded([board["id"]]) == 1
+    document = await BoardDocument.get_motor_collection().find_one({"_id": ObjectId(board["id"])})
+    assert [entry["title"] for entry in document["lists"]] == ["To Do"]
+    assert [entry["title"] for entry in document["lists"][0]["cards"]] == ["Card one"]
+
+    # The document is only a mirror: leaving embedded mode never writes it back
+    await Card.get_motor_collection().delete_one({"_id": ObjectId(card["id"])})
+    assert await migrate_to_collections([board["id"]]) == 1
+    assert await Card.get(card["id"]) is None
+    assert await BoardDocument.get_motor_collection().count_documents({}) == 0
+
+
+async def test_write_during_a_build_is_not_lost(client, auth_headers, embedded, monkeypatch):
+    board = (await client.post("/api/boards/", json={"title": "Raced"}, headers=auth_headers)).json()
+    lst = (await client.post(f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers)).json()
+
+    # A card created while the first read is between its collection reads and its store
+    build = embedded_boards.build_board_document
+
+    async def overtaken_build(board_id):
+        document = await build(board_id)
+        response = await client.post(f"/api/cards/{lst['id']}", json={"title": "Late card"}, headers=auth_headers)
+        assert response.status_code == 201
+        return document
+
+    monkeypatch.setattr(embedded_boards, "build_board_document", overtaken_build)
+    await client.get(f"/api/lists/{board['id']}", headers=auth_headers)
+    monkeypatch.setattr(embedded_boards, "build_board_document", build)
+
+    response = await client.get(f"/api/lists/{board['id']}", headers=auth_headers)
+    assert [card["title"] for card in response.json()[0]["cards"]] == ["Late card"]
+    await assert_mirrored(board["id"])
@@ -0,0 +1,64 @@
+"""Idempotency-Key handling of the create and move routes."""
+import pytest
+from app.models.card import Card
+
+
+@pytest.fixture
+async def list_id(client, auth_headers, redis):
+    await redis.flushdb()
+    board = (
+        await client.post("/api/boards/", json={"title": "Retry board"}, headers=auth_headers)
+    ).json()
+    lst = (
+        await client.post(f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers)
+    ).json()
+    return lst["id"]
+
+
+async def test_retry_returns_the_original_response(client, auth_headers, list_id, query_budget):
+    headers = {**auth_headers, "Idempotency-Key": "create-1"}
+    first = await client.post(f"/api/cards/{list_id}", json={"title": "Only once"}, headers=headers)
+    assert first.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+
+    with query_budget(0):
+        retry = await client.post(f"/api/cards/{list_id}", json={"title": "Only once"}, headers=headers)
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert await Card.find(Card.list_id == list_id).count() == 1
+
+    # Without a key, or with a new one, the request runs again
+    await client.post(f"/api/cards/{list_id}", json={"title": "Only once"}, headers=auth_headers)
+    await client.post(
+        f"/api/cards/{list_id}", json={"title": "Only once"},
+        headers={**auth_headers, "Idempotency-Key": "create-2"},
+    )
+    assert await Card.find(Card.list_id == list_id).count() == 3
+
+
+async def test_key_reused_for_a_different_request(client, auth_headers, list_id):
+    headers = {**auth_headers, "Idempotency-Key": "create-1"}
+    await client.post(f"/api/cards/{list_id}", json={"title": "First"}, headers=headers)
+    response = await client.post(f"/api/cards/{list_id}", json={"title": "Second"}, headers=headers)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Idempotency-Key was already used for a different request"
+
+
+async def test_failed_requests_can_be_retried(client, auth_headers, list_id, redis):
+    headers = {**auth_headers, "Idempotency-Key": "move-1"}
+    missing = "507f1f77bcf86cd799439011"
+    response = await client.post(
+        f"/api/cards/{missing}/move", json={"target_list_id": list_id, "new_order": 0}, headers=headers
+    )
+    assert response.status_code == 404
+    assert await redis.keys("idempotency:*") == []
+
+    card = (await client.post(f"/api/cards/{list_id}", json={"title": "Mover"}, headers=auth_headers)).json()
+    body = {"target_list_id": list_id, "new_order": 3}
+    first = await client.post(f"/api/cards/{card['id']}/move", json=body, headers=headers)
+    retry = await client.post(f"/api/cards/{card['id']}/move", json=body, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
@@ -0,0 +1,64 @@
+"""Cache coherence between API processes through the invalidation bus."""
+import asyncio
+import uuid
+import pytest
+from app.core.invalidation import InvalidationBus
+from app.utils.board_versions import BoardVersions
+
+
+async def eventually(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            pytest.fail("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def workers(redis):
+    """Two buses on one private channel, standing in for two workers."""
+    channel = f"test:invalidate:{uuid.uuid4().hex}"
+    buses = [InvalidationBus(redis, channel), InvalidationBus(redis, channel)]
+    for bus in buses:
+        await bus.start()
+        await bus.wait_subscribed()
+    yield buses
+    for bus in buses:
+        await bus.stop()
+
+
+def test_bump_without_running_bus_is_local():
+    versions = BoardVersions(InvalidationBus(redis=None, channel="unused"))
+    versions.bump("board-1")
+    assert versions.get("board-1") == 1
+    assert versions.get("board-2") == 0
+
+
+async def test_bump_reaches_other_workers(workers):
+    first, second = (BoardVersions(bus) for bus in workers)
+
+    first.bump("board-1")
+
+    assert first.get("board-1") == 1
+    await eventually(lambda: second.get("board-1") == 1)
+    await asyncio.sleep(0.05)
+    assert first.get("board-1") == 1  # Own messages are not applied twice
+
+
+async def test_every_subscribed_cache_is_invalidated(workers):
+    dropped = []
+    workers[1].subscribe("board", dropped.append)
+
+    workers[0].publish("board", "board-1")
+
+    await eventually(lambda: dropped == ["board-1"])
+
+
+def test_reset_moves_every_known_board_forward():
+    versions = BoardVersions()
+    versions.bump("board-1")
+    versions.bump("board-2")
+
+    versions._invalidate(None)
+
+    assert (versions.get("board-1"), versions.get("board-2")) == (2, 2)
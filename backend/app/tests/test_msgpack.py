@@ -0,0 +1,97 @@
+"""MessagePack content negotiation."""
+from datetime import datetime, timezone
+import pytest
+from app.core.config import settings
+from app.middleware import content_negotiation
+from app.utils.media_types import JSON_TYPE, MSGPACK_TYPE, negotiate_media_type
+
+msgpack = pytest.importorskip("msgpack")
+
+MSGPACK_HEADERS = {"Accept": MSGPACK_TYPE, "Content-Type": MSGPACK_TYPE}
+
+
+def test_negotiate_media_type():
+    assert negotiate_media_type(None) == JSON_TYPE
+    assert negotiate_media_type("*/*") == JSON_TYPE
+    assert negotiate_media_type("application/msgpack") == MSGPACK_TYPE
+    assert negotiate_media_type("application/x-msgpack, */*;q=0.1") == MSGPACK_TYPE
+    # JSON wins ties
+    assert negotiate_media_type("application/json, application/msgpack") == JSON_TYPE
+    assert negotiate_media_type("application/json;q=0.5, application/msgpack") == MSGPACK_TYPE
+
+
+async def test_msgpack_requests_and_responses(client, auth_headers):
+    headers = {**auth_headers, **MSGPACK_HEADERS}
+    response = await client.post(
+        "/api/boards/", content=msgpack.packb({"title": "Packed"}), headers=headers
+    )
+    assert response.status_code == 201, response.content
+    assert response.headers["content-type"] == MSGPACK_TYPE
+    assert "Accept" in response.headers["vary"]
+    board = msgpack.unpackb(response.content)
+    assert board["title"] == "Packed"
+
+    lst = msgpack.unpackb((await client.post(
+        f"/api/lists/{board['id']}", content=msgpack.packb({"title": "To Do"}), headers=headers
+    )).content)
+    # Timestamps may be sent natively
+    due = datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    card = await client.post(
+        f"/api/cards/{lst['id']}",
+        content=msgpack.packb({"title": "Card", "due_date": due}, datetime=True),
+        headers=headers,
+    )
+    assert card.status_code == 201, card.content
+
+    # Same values, and the same datetime/ObjectId strings, as the JSON response
+    for path in (f"/api/lists/{board['id']}", f"/api/cards/{msgpack.unpackb(card.content)['id']}"):
+        as_json = await client.get(path, headers=auth_headers)
+        packed = await client.get(path, headers=headers)
+        assert as_json.headers["content-type"] == JSON_TYPE
+        assert packed.headers["content-type"] == MSGPACK_TYPE
+        assert msgpack.unpackb(packed.content) == as_json.json()
+
+
+async def test_errors_follow_the_negotiated_type(client, auth_headers):
+    headers = {**auth_headers, **MSGPACK_HEADERS}
+    response = await client.get("/api/cards/507f1f77bcf86cd799439011", headers=headers)
+    assert response.status_code == 404
+    assert msgpack.unpackb(response.content) == {"detail": "Card not found"}
+
+    origin = settings.CORS_ORIGINS[0]
+    response = await client.post("/api/boards/", content=b"\xc1", headers={**headers, "Origin": origin})
+    assert response.status_code == 400
+    assert msgpack.unpackb(response.content) == {"detail": "Invalid MessagePack body"}
+    assert response.headers["Access-Control-Allow-Origin"] == origin
+
+
+async def test_routes_pack_their_results_directly(client, auth_headers, monkeypatch):
+    def no_reencoding(body):
+        raise AssertionError("route result went through JSON first")
+
+    monkeypatch.setattr(content_negotiation, "json_to_msgpack", no_reencoding)
+    headers = {**auth_headers, **MSGPACK_HEADERS}
+    response = await client.post(
+        "/api/boards/", content=msgpack.packb({"title": "Packed"}), headers=headers
+    )
+    assert response.status_code == 201
+    assert response.headers["content-type"] == MSGPACK_TYPE
+    board = msgpack.unpackb(response.content)
+    response = await client.get(f"/api/boards/{board['id']}", headers=headers)
+    assert msgpack.unpackb(response.content)["title"] == "Packed"
+
+
+async def test_idempotent_replay_in_either_type(client, auth_headers, redis):
+    await redis.flushdb()
+    headers = {**auth_headers, **MSGPACK_HEADERS, "Idempotency-Key": "packed-1"}
+    body = msgpack.packb({"title": "Packed once"})
+    first = await client.post("/api/boards/", content=body, headers=headers)
+    assert first.status_code == 201
+
+    retry = await client.post("/api/boards/", content=body, headers=headers)
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert msgpack.unpackb(retry.content) == msgpack.unpackb(first.content)
+
+    as_json = await client.post("/api/boards/", content=body, headers={**headers, "Accept": JSON_TYPE})
+    assert as_json.headers["content-type"].startswith(JSON_TYPE)
+    assert as_json.json() == msgpack.unpackb(first.content)
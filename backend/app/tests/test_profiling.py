@@ -0,0 +1,52 @@
+"""On-demand request profiling."""
+import pytest
+from app.core.config import settings
+from app.models.user import User
+
+pytest.importorskip("pyinstrument")
+
+
+async def make_superuser():
+    await User.find_one(User.username == "budget").update({"$set": {"is_superuser": True}})
+
+
+async def test_superuser_gets_a_speedscope_profile(client, auth_headers, board_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    await make_superuser()
+
+    response = await client.get(
+        f"/api/lists/{board_id}", headers={**auth_headers, "X-Profile": "speedscope"}
+    )
+    assert response.status_code == 200
+    assert response.headers["X-Profiled-Status"] == "200"
+    profile = response.json()
+    assert profile["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert [path.name.endswith(".speedscope.json") for path in tmp_path.iterdir()] == [True]
+
+    response = await client.get(f"/api/lists/{board_id}?profile=html", headers=auth_headers)
+    assert response.headers["content-type"].startswith("text/html")
+
+
+async def test_profile_carries_cors_headers(client, auth_headers, board_id):
+    await make_superuser()
+    origin = settings.CORS_ORIGINS[0]
+    response = await client.get(
+        f"/api/lists/{board_id}", headers={**auth_headers, "X-Profile": "speedscope", "Origin": origin}
+    )
+    assert response.headers["X-Profiled-Status"] == "200"
+    assert response.headers["Access-Control-Allow-Origin"] == origin
+    assert "X-Profiled-Status" in response.headers["Access-Control-Expose-Headers"]
+
+
+async def test_flag_is_ignored_for_other_users(client, auth_headers, board_id):
+    response = await client.get(
+        f"/api/lists/{board_id}", headers={**auth_headers, "X-Profile": "speedscope"}
+    )
+    assert response.status_code == 200
+    assert "X-Profiled-Status" not in response.headers
+    assert response.json() == []
+
+    await make_superuser()
+    response = await client.get(f"/api/lists/{board_id}", headers={"X-Profile": "speedscope"})
+    assert response.status_code == 403
+    assert "X-Profiled-Status" not in response.headers
@@ -0,0 +1,140 @@
+"""Query budgets for the board, list and card endpoints."""
+import pytest
+
+
+@pytest.fixture
+async def list_ids(client, auth_headers, board_id):
+    ids = []
+    for title in ("To Do", "Done"):
+        response = await client.post(
+            f"/api/lists/{board_id}", json={"title": title}, headers=auth_headers
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.fixture
+async def card_ids(client, auth_headers, list_ids):
+    ids = []
+    for title in ("Card one", "Card two", "Card three"):
+        response = await client.post(
+            f"/api/cards/{list_ids[0]}", json={"title": title}, headers=auth_headers
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def test_get_board_lists_budget(
+    client, auth_headers, board_id, card_ids, query_budget
+):
+    with query_budget(4):
+        response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+
+async def test_get_board_summary_budget(
+    client, auth_headers, board_id, card_ids, query_budget
+):
+    with query_budget(4):
+        response = await client.get(
+            f"/api/lists/{board_id}", params={"view": "summary"}, headers=auth_headers
+        )
+    assert response.status_code == 200
+
+
+async def test_get_card_budget(client, auth_headers, card_ids, query_budget):
+    with query_budget(4):
+        response = await client.get(f"/api/cards/{card_ids[0]}", headers=auth_headers)
+    assert response.status_code == 200
+
+
+async def test_create_list_budget(client, auth_headers, board_id, query_budget):
+    with query_budget(4):
+        response = await client.post(
+            f"/api/lists/{board_id}", json={"title": "Backlog"}, headers=auth_headers
+        )
+    assert response.status_code == 201
+
+
+async def test_reorder_lists_budget(
+    client, auth_headers, board_id, list_ids, query_budget
+):
+    list_orders = {list_id: order for order, list_id in enumerate(reversed(list_ids))}
+    with query_budget(3):
+        response = await client.post(
+            f"/api/lists/{board_id}/reorder",
+            json={"list_orders": list_orders},
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+
+
+async def test_update_list_budget(client, auth_headers, list_ids, query_budget):
+    with query_budget(3):
+        response = await client.put(
+            f"/api/lists/{list_ids[0]}",
+            json={"title": "Doing", "revision": 0},
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+
+
+async def test_update_board_budget(client, auth_headers, board_id, query_budget):
+    with query_budget(2):
+        response = await client.put(
+            f"/api/boards/{board_id}", json={"title": "Renamed"}, headers=auth_headers
+        )
+    assert response.status_code == 200
+
+
+async def test_create_card_budget(client, auth_headers, list_ids, query_budget):
+    with query_budget(7):
+        response = await client.post(
+            f"/api/cards/{list_ids[0]}", json={"title": "New card"}, headers=auth_headers
+        )
+    assert response.status_code == 201
+
+
+async def test_update_card_budget(client, auth_headers, card_ids, query_budget):
+    with query_budget(4):
+        response = await client.put(
+            f"/api/cards/{card_ids[0]}", json={"title": "Renamed"}, headers=auth_headers
+        )
+    assert response.status_code == 200
+
+
+async def test_reorder_cards_budget(
+    client, auth_headers, list_ids, card_ids, query_budget
+):
+    card_orders = {card_id: order for order, card_id in enumerate(reversed(card_ids))}
+    with query_budget(4):
+        response = await client.post(
+            f"/api/cards/{list_ids[0]}/reorder",
+            json={"card_orders": card_orders},
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+
+
+async def test_move_card_budget(client, auth_headers, list_ids, card_ids, query_budget):
+    with query_budget(8):
+        response = await client.post(
+            f"/api/cards/{card_ids[0]}/move",
+            json={"target_list_id": list_ids[1], "new_order": 0},
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+
+
+async def test_board_stats_budget(client, auth_headers, board_id, card_ids, query_budget):
+    await client.get(f"/api/boards/{board_id}/stats", headers=auth_headers)
+    with query_budget(3):
+        response = await client.get(
+            f"/api/boards/{board_id}/stats", headers=auth_headers
+        )
+    assert response.status_code == 200
+
+
+async def test_query_count_header(client, auth_headers, board_id):
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    assert response.headers["X-Query-Count"] == "4"
@@ -0,0 +1,97 @@
+"""Board and card quotas enforced through the maintained counters."""
+import asyncio
+import pytest
+from pymongo.errors import PyMongoError
+from app.core.config import settings
+from app.models.board import Board
+from app.models.user import User
+from app.repositories.mongo import MongoCardRepository
+
+
+async def create_board(client, auth_headers):
+    return await client.post(
+        "/api/boards/", json={"title": "Quota board"}, headers=auth_headers
+    )
+
+
+async def create_card(client, auth_headers, list_id, title="Quota card"):
+    return await client.post(
+        f"/api/cards/{list_id}", json={"title": title}, headers=auth_headers
+    )
+
+
+async def test_board_quota(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_BOARDS_PER_USER", 2)
+    first = (await create_board(client, auth_headers)).json()
+    await create_board(client, auth_headers)
+
+    response = await create_board(client, auth_headers)
+    assert response.status_code == 400
+
+    await client.delete(f"/api/boards/{first['id']}", headers=auth_headers)
+    response = await create_board(client, auth_headers)
+    assert response.status_code == 201
+    assert (await User.find_one()).board_count == 2
+
+
+async def test_card_quota_under_concurrency(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_CARDS_PER_BOARD", 3)
+    board = (await create_board(client, auth_headers)).json()
+    lst = (
+        await client.post(
+            f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+        )
+    ).json()
+
+    responses = await asyncio.gather(
+        *(create_card(client, auth_headers, lst["id"], f"Card {i}") for i in range(6))
+    )
+
+    assert sorted(r.status_code for r in responses) == [201] * 3 + [400] * 3
+    assert (await Board.get(board["id"])).card_count == 3
+
+
+async def test_card_counter_backfilled_for_old_boards(
+    client, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(settings, "MAX_CARDS_PER_BOARD", 2)
+    board = (await create_board(client, auth_headers)).json()
+    lst = (
+        await client.post(
+            f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+        )
+    ).json()
+    await create_card(client, auth_headers, lst["id"])
+    await create_card(client, auth_headers, lst["id"])
+
+    # Boards written before the counter existed have no card_count field
+    await Board.get_motor_collection().update_many({}, {"$unset": {"card_count": ""}})
+
+    response = await create_card(client, auth_headers, lst["id"])
+    assert response.status_code == 400
+    assert (await Board.get(board["id"])).card_count == 2
+
+
+async def test_failed_move_releases_the_reserved_slot(client, auth_headers, monkeypatch):
+    boards = [(await create_board(client, auth_headers)).json() for _ in range(2)]
+    source, target = [
+        (
+            await client.post(
+                f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+            )
+        ).json()
+        for board in boards
+    ]
+    card = (await create_card(client, auth_headers, source["id"])).json()
+
+    async def failing_move(*args, **kwargs):
+        raise PyMongoError("Write failed")
+
+    monkeypatch.setattr(MongoCardRepository, "move", failing_move)
+    with pytest.raises(PyMongoError):
+        await client.post(
+            f"/api/cards/{card['id']}/move",
+            json={"target_list_id": target["id"], "new_order": 0},
+            headers=auth_headers,
+        )
+    assert [(await Board.get(board["id"])).card_count for board in boards] == [1, 0]
@@ -0,0 +1,145 @@
+"""Sliding-window rate limiting per user and per client IP."""
+import asyncio
+import uuid
+from types import SimpleNamespace
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Request
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.api.dependencies import rate_limit
+from app.api.dependencies.auth import get_current_active_user
+from app.api.dependencies.rate_limit import parse_rate, rate_limit_by_ip, rate_limit_by_user
+from app.core.config import settings
+from app.core.redis import redis_client
+
+
+@pytest.fixture
+def route(monkeypatch):
+    """Name of a limited route of the test app, fresh for each test."""
+    name = f"test_{uuid.uuid4().hex}"
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMITS", {**settings.RATE_LIMITS, name: "2/minute"})
+    return name
+
+
+@pytest.fixture
+def limited_app(route):
+    app = FastAPI()
+
+    @app.get("/anonymous", dependencies=[Depends(rate_limit_by_ip(route))])
+    async def anonymous():
+        return {}
+
+    @app.get("/personal", dependencies=[Depends(rate_limit_by_user(route))])
+    async def personal():
+        return {}
+
+    async def header_user(request: Request):
+        return SimpleNamespace(id=request.headers["X-User"])
+
+    app.dependency_overrides[get_current_active_user] = header_user
+    return app
+
+
+@pytest.fixture
+async def connect(limited_app):
+    """Open clients of the test app, each from its own IP."""
+    clients = []
+
+    def open_client(ip="10.0.0.1"):
+        transport = httpx.ASGITransport(app=limited_app, client=(ip, 12345))
+        clients.append(httpx.AsyncClient(transport=transport, base_url="http://test"))
+        return clients[-1]
+
+    yield open_client
+    for http_client in clients:
+        await http_client.aclose()
+    # The shared pool's connections belong to this test's event loop
+    await redis_client.connection_pool.disconnect()
+
+
+def test_parse_rate():
+    assert parse_rate("10/minute") == (10, 60)
+    assert parse_rate("5/seconds") == (5, 1)
+    with pytest.raises(ValueError):
+        parse_rate("10 per minute")
+
+
+async def test_over_the_limit_is_429_with_headers(redis, connect):
+    http_client = connect()
+    first = await http_client.get("/anonymous")
+    second = await http_client.get("/anonymous")
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert (first.headers["X-RateLimit-Remaining"], second.headers["X-RateLimit-Remaining"]) == ("1", "0")
+    assert 0 < int(first.headers["X-RateLimit-Reset"]) <= 60
+
+    blocked = await http_client.get("/anonymous")
+    assert blocked.status_code == 429
+    assert blocked.headers["X-RateLimit-Remaining"] == "0"
+    assert 0 < int(blocked.headers["Retry-After"]) <= 60
+    assert blocked.headers["Retry-After"] == blocked.headers["X-RateLimit-Reset"]
+
+
+async def test_window_slides(redis, connect, route, monkeypatch):
+    monkeypatch.setitem(settings.RATE_LIMITS, route, "1/second")
+    http_client = connect()
+    assert (await http_client.get("/anonymous")).status_code == 200
+    assert (await http_client.get("/anonymous")).status_code == 429
+
+    await asyncio.sleep(1.1)
+    assert (await http_client.get("/anonymous")).status_code == 200
+
+
+async def test_each_ip_has_its_own_window(redis, connect):
+    first, second = connect("10.0.0.1"), connect("10.0.0.2")
+    for _ in range(2):
+        await first.get("/anonymous")
+    assert (await first.get("/anonymous")).status_code == 429
+    assert (await second.get("/anonymous")).status_code == 200
+
+
+async def test_each_user_has_its_own_window(redis, connect):
+    # Same IP, different users
+    http_client = connect()
+    for _ in range(2):
+        await http_client.get("/personal", headers={"X-User": "alice"})
+    assert (await http_client.get("/personal", headers={"X-User": "alice"})).status_code == 429
+    assert (await http_client.get("/personal", headers={"X-User": "bob"})).status_code == 200
+    # Per-user and per-IP counts are kept apart
+    assert (await http_client.get("/anonymous")).status_code == 200
+
+
+async def test_fails_open_without_redis(connect, monkeypatch):
+    async def unavailable(**kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(rate_limit, "sliding_window", unavailable)
+    http_client = connect()
+    for _ in range(5):
+        response = await http_client.get("/anonymous")
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
+
+
+async def test_forwarded_clients_have_their_own_windows(redis, connect, monkeypatch):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["172.16.0.0/12"])
+    nginx = connect("172.18.0.5")
+    first = {"X-Forwarded-For": "203.0.113.1", "X-Real-IP": "203.0.113.1"}
+    second = {"X-Forwarded-For": "203.0.113.2", "X-Real-IP": "203.0.113.2"}
+    for _ in range(2):
+        await nginx.get("/anonymous", headers=first)
+    assert (await nginx.get("/anonymous", headers=first)).status_code == 429
+    assert (await nginx.get("/anonymous", headers=second)).status_code == 200
+
+    # A client-supplied hop before the one nginx appended changes nothing
+    spoofed = {"X-Forwarded-For": "198.51.100.7, 203.0.113.1"}
+    assert (await nginx.get("/anonymous", headers=spoofed)).status_code == 429
+
+
+async def test_forwarded_header_from_untrusted_peer_is_ignored(redis, connect, monkeypatch):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["172.16.0.0/12"])
+    direct = connect("10.0.0.9")
+    for ip in ("203.0.113.1", "203.0.113.2"):
+        await direct.get("/anonymous", headers={"X-Forwarded-For": ip})
+    assert (await direct.get("/anonymous", headers={"X-Forwarded-For": "203.0.113.3"})).status_code == 429
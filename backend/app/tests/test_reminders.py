@@ -0,0 +1,160 @@
+"""Due-date reminder scheduler."""
+import json
+from datetime import datetime, timedelta
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.core.redis import redis_client
+from app.services import reminders
+from app.services.reminders import (
+    LEASE_KEY, SENT_UNTIL_KEY, FileSink, LogSink, ReminderScheduler, reminder_scheduler
+)
+
+
+@pytest.fixture
+async def list_id(client, auth_headers):
+    board = (
+        await client.post(
+            "/api/boards/", json={"title": "Reminder board"}, headers=auth_headers
+        )
+    ).json()
+    lst = (
+        await client.post(
+            f"/api/lists/{board['id']}", json={"title": "To Do"}, headers=auth_headers
+        )
+    ).json()
+    return lst["id"]
+
+
+@pytest.fixture
+def now():
+    return datetime.utcnow().replace(microsecond=0)
+
+
+@pytest.fixture
+def sent(tmp_path):
+    """File sink, and a reader of the titles it received."""
+    path = tmp_path / "reminders.jsonl"
+
+    def titles():
+        if not path.exists():
+            return []
+        return [json.loads(line)["title"] for line in path.read_text().splitlines()]
+
+    return FileSink(str(path)), titles
+
+
+def make_scheduler(sink, max_scheduled=100):
+    return ReminderScheduler(
+        None, sink, lead_seconds=900, window_seconds=3600,
+        max_scheduled=max_scheduled, tick_seconds=1, lease_seconds=30
+    )
+
+
+async def create_card(client, auth_headers, list_id, title, due_date=None):
+    response = await client.post(
+        f"/api/cards/{list_id}",
+        json={"title": title, "due_date": due_date.isoformat() if due_date else None},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_sends_reminders_lead_seconds_before_due(client, auth_headers, list_id, now, sent):
+    sink, titles = sent
+    await create_card(client, auth_headers, list_id, "Soon", now + timedelta(minutes=10))
+    await create_card(client, auth_headers, list_id, "Later", now + timedelta(minutes=50))
+    await create_card(client, auth_headers, list_id, "Tomorrow", now + timedelta(days=1))
+    await create_card(client, auth_headers, list_id, "No due date")
+
+    scheduler = make_scheduler(sink)
+    scheduler.resume(now)
+    assert await scheduler.tick(now) == 1
+    assert titles() == ["Soon"]
+    # Only the window is held in memory
+    assert len(scheduler) == 1
+
+    assert await scheduler.tick(now + timedelta(minutes=30)) == 0
+    assert await scheduler.tick(now + timedelta(minutes=36)) == 1
+    assert await scheduler.tick(now + timedelta(minutes=40)) == 0
+    assert titles() == ["Soon", "Later"]
+
+
+async def test_follows_card_changes(client, auth_headers, list_id, now, sent, monkeypatch):
+    sink, titles = sent
+    monkeypatch.setattr(reminder_scheduler, "sink", sink)
+    reminder_scheduler.resume(now)
+    try:
+        assert await reminder_scheduler.tick(now) == 0
+
+        card = await create_card(client, auth_headers, list_id, "Created", now + timedelta(minutes=30))
+        await reminder_scheduler.tick(now)
+        assert len(reminder_scheduler) == 1
+
+        # Moved closer: sent right away
+        await client.put(
+            f"/api/cards/{card['id']}",
+            json={"due_date": (now + timedelta(minutes=5)).isoformat()},
+            headers=auth_headers,
+        )
+        assert await reminder_scheduler.tick(now) == 1
+        assert titles() == ["Created"]
+
+        cleared = await create_card(client, auth_headers, list_id, "Cleared", now + timedelta(minutes=30))
+        deleted = await create_card(client, auth_headers, list_id, "Deleted", now + timedelta(minutes=40))
+        await reminder_scheduler.tick(now)
+        assert len(reminder_scheduler) == 2
+
+        await client.put(
+            f"/api/cards/{cleared['id']}", json={"due_date": None}, headers=auth_headers
+        )
+        await client.delete(f"/api/cards/{deleted['id']}", headers=auth_headers)
+        await reminder_scheduler.tick(now)
+        assert len(reminder_scheduler) == 0
+
+        assert await reminder_scheduler.tick(now + timedelta(hours=1)) == 0
+        assert titles() == ["Created"]
+    finally:
+        reminder_scheduler.suspend()
+
+
+async def test_holds_at_most_max_scheduled(client, auth_headers, list_id, now, sent):
+    sink, titles = sent
+    for minutes in (20, 30, 40):
+        await create_card(client, auth_headers, list_id, f"Due in {minutes}", now + timedelta(minutes=minutes))
+
+    scheduler = make_scheduler(sink, max_scheduled=2)
+    scheduler.resume(now)
+    await scheduler.tick(now)
+    assert len(scheduler) == 2
+
+    later = now + timedelta(minutes=26)
+    assert await scheduler.tick(later) == 2
+    assert await scheduler.tick(later) == 1
+    assert await scheduler.tick(later) == 0
+    assert titles() == ["Due in 20", "Due in 30", "Due in 40"]
+
+
+async def test_one_process_holds_the_lease(redis, now):
+    await redis.delete(LEASE_KEY, SENT_UNTIL_KEY)
+    first, second = make_scheduler(LogSink()), make_scheduler(LogSink())
+    try:
+        assert await first._hold_lease() == (True, None)
+        assert (await second._hold_lease())[0] is False
+
+        first.resume(now)
+        assert await first._hold_lease() == (True, now)
+    finally:
+        await redis.delete(LEASE_KEY, SENT_UNTIL_KEY)
+        await redis_client.connection_pool.disconnect()
+
+
+async def test_no_lease_without_redis(monkeypatch, now):
+    async def unavailable(**kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(reminders, "renew_lease", unavailable)
+    scheduler = make_scheduler(LogSink())
+    scheduler.resume(now)
+    # The current holder, if any, cannot be seen: nobody sends
+    assert await scheduler._hold_lease() == (False, None)
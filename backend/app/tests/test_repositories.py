@@ -0,0 +1,195 @@
+"""Routes running on the in-memory repositories, without MongoDB, and what both backends share."""
+from datetime import datetime
+import pytest
+from httpx import AsyncClient
+from app.api.dependencies.repositories import get_repositories
+from app.core import token_store
+from app.core.config import settings
+from app.main import app
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.repositories.memory import memory_repositories
+from app.repositories.mongo import mongo_repositories
+
+
+@pytest.fixture
+def repositories():
+    return memory_repositories()
+
+
+@pytest.fixture
+async def memory_client(monkeypatch, repositories):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    # No Redis either: an empty revocation filter, trusted as if loaded from it
+    revocations = token_store.RevocationFilter(capacity=1000, error_rate=0.01)
+    revocations.loaded = True
+    monkeypatch.setattr(token_store, "revocations", revocations)
+    app.dependency_overrides[get_repositories] = lambda: repositories
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as http_client:
+            yield http_client
+    finally:
+        app.dependency_overrides.pop(get_repositories, None)
+
+
+@pytest.fixture
+async def owner(memory_client):
+    response = await memory_client.post(
+        "/api/auth/register",
+        json={"email": "memory@example.com", "username": "memory", "password": "password123"},
+    )
+    assert response.status_code == 201, response.text
+    body = response.json()
+    return body["user"]["id"], {"Authorization": f"Bearer {body['access_token']}"}
+
+
+@pytest.fixture(params=["memory", "mongo"])
+def backend(request):
+    """Either repository backend; `mongo` needs a reachable MongoDB."""
+    if request.param == "mongo":
+        request.getfixturevalue("client")
+        return mongo_repositories()
+    return memory_repositories()
+
+
+@pytest.fixture
+async def board(repositories, owner):
+    user_id, _ = owner
+    board = await repositories.boards.insert(Board(title="Memory board", owner_id=user_id))
+    todo = await repositories.lists.insert(List(title="To Do", order=1, board_id=str(board.id)))
+    done = await repositories.lists.insert(List(title="Done", order=0, board_id=str(board.id)))
+    for order, title in ((2, "Third"), (0, "First"), (1, "Second")):
+        await repositories.cards.insert(Card(
+            title=title, order=order, list_id=str(todo.id),
+            checklist=[{"id": "a", "text": "Step", "completed": order == 0}]
+        ))
+    return str(board.id), str(todo.id), str(done.id)
+
+
+def titles(response):
+    return [(lst["title"], [card["title"] for card in lst["cards"]]) for lst in response.json()]
+
+
+async def test_board_view_from_memory(memory_client, owner, board):
+    _, headers = owner
+    board_id, _, _ = board
+
+    response = await memory_client.get(f"/api/lists/{board_id}", headers=headers)
+    assert response.status_code == 200
+    assert titles(response) == [("Done", []), ("To Do", ["First", "Second", "Third"])]
+
+    summary = await memory_client.get(
+        f"/api/lists/{board_id}", params={"view": "summary"}, headers=headers
+    )
+    first = summary.json()[1]["cards"][0]
+    assert (first["checklist_completed"], first["checklist_total"]) == (1, 1)
+    assert "checklist" not in first
+
+    boards = await memory_client.get("/api/boards/", headers=headers)
+    assert [entry["title"] for entry in boards.json()["boards"]] == ["Memory board"]
+
+
+async def test_ordering_writes_in_memory(memory_client, owner, board):
+    _, headers = owner
+    board_id, todo_id, done_id = board
+    view = (await memory_client.get(f"/api/lists/{board_id}", headers=headers)).json()
+    first, second, third = [card["id"] for card in view[1]["cards"]]
+
+    response = await memory_client.post(
+        f"/api/cards/{todo_id}/reorder",
+        json={"card_orders": {first: 5, third: 0}}, headers=headers
+    )
+    assert response.status_code == 200
+    await memory_client.post(
+        f"/api/lists/{board_id}/reorder",
+        json={"list_orders": {todo_id: 0, done_id: 1}}, headers=headers
+    )
+    created = await memory_client.post(
+        f"/api/lists/{board_id}", json={"title": "Later"}, headers=headers
+    )
+    assert created.json()["order"] == 2
+
+    response = await memory_client.get(f"/api/lists/{board_id}", headers=headers)
+    assert titles(response) == [
+        ("To Do", ["Third", "Second", "First"]), ("Done", []), ("Later", []),
+    ]
+    card = await memory_client.get(f"/api/cards/{first}", headers=headers)
+    assert card.json()["order"] == 5
+
+
+async def test_conditional_edits_in_memory(memory_client, owner, board):
+    _, headers = owner
+    board_id, todo_id, _ = board
+
+    for url in (f"/api/boards/{board_id}", f"/api/lists/{todo_id}"):
+        response = await memory_client.put(url, json={"title": "Renamed", "revision": 0}, headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.json()["revision"] == 1
+        stale = await memory_client.put(url, json={"title": "Again", "revision": 0}, headers=headers)
+        assert stale.status_code == 409
+
+
+async def test_revision_checked_updates(backend):
+    now = datetime.utcnow()
+    board = await backend.boards.insert(Board(title="Board", owner_id="owner"))
+    board_id = str(board.id)
+    assert await backend.boards.ids_for_owner("owner") == [board_id]
+
+    assert await backend.boards.update(board_id, "someone else", {"title": "Mine"}) is None
+    updated = await backend.boards.update(board_id, "owner", {"title": "Renamed", "updated_at": now}, 0)
+    assert (updated.title, updated.revision) == ("Renamed", 1)
+    assert await backend.boards.update(board_id, "owner", {"title": "Stale"}, 0) is None
+    assert (await backend.boards.get(board_id)).title == "Renamed"
+
+    lst = await backend.lists.insert(List(title="To Do", order=0, board_id=board_id))
+    list_id = str(lst.id)
+    assert await backend.lists.update(list_id, ["other board"], {"title": "Mine"}) is None
+    updated = await backend.lists.update(list_id, [board_id], {"title": "Doing"}, 0)
+    assert (updated.title, updated.revision) == ("Doing", 1)
+
+    card = await backend.cards.insert(Card(title="Card", order=0, list_id=list_id))
+    card_id = str(card.id)
+    assert await backend.cards.update(card_id, ["other list"], {"title": "Mine"}) is None
+    previous = await backend.cards.update(card_id, [list_id], {"title": "Edited", "order": 4})
+    assert (previous.title, previous.revision) == ("Card", 0)
+    assert await backend.cards.update(card_id, [list_id], {"title": "Stale"}, 0) is None
+    stored = await backend.cards.get(card_id)
+    assert (stored.title, stored.order, stored.revision) == ("Edited", 4, 1)
+    assert [c.id for c in await backend.cards.for_lists([list_id])] == [card.id]
+    assert await backend.cards.positions_for_list(list_id) == [
+        {"_id": card.id, "order": 4, "list_id": list_id}
+    ]
+
+
+async def test_checklist_item_writes(backend):
+    now = datetime.utcnow()
+    card = await backend.cards.insert(Card(
+        title="Card", order=0, list_id="list",
+        checklist=[{"id": "a", "text": "Step a", "completed": False}]
+    ))
+    card_id = str(card.id)
+
+    async def stored():
+        card = await backend.cards.get(card_id)
+        return [item.id for item in card.checklist], (card.checklist_total, card.checklist_completed)
+
+    assert await backend.cards.add_checklist_item(card_id, {"id": "b", "text": "Step b", "completed": True}, now)
+    assert not await backend.cards.add_checklist_item(card_id, {"id": "b", "text": "Again", "completed": False}, now)
+    assert await stored() == (["a", "b"], (2, 1))
+
+    for _ in range(2):
+        previous = await backend.cards.update_checklist_item(card_id, "a", {"completed": True}, now)
+    assert previous == {"id": "a", "text": "Step a", "completed": True}
+    assert await stored() == (["a", "b"], (2, 2))
+    assert await backend.cards.update_checklist_item(card_id, "missing", {"text": "x"}, now) is None
+
+    assert await backend.cards.reorder_checklist(card_id, ["b"], now) is None
+    reordered = await backend.cards.reorder_checklist(card_id, ["b", "a"], now)
+    assert [item["id"] for item in reordered] == ["b", "a"]
+
+    removed = await backend.cards.delete_checklist_item(card_id, "b", now)
+    assert removed["id"] == "b"
+    assert await backend.cards.delete_checklist_item(card_id, "b", now) is None
+    assert await stored() == (["a"], (1, 1))
+    assert (await backend.cards.get(card_id)).revision == 5
@@ -0,0 +1,77 @@
+"""Conditional edits of boards, lists and cards: revisions and 409 conflicts."""
+import pytest
+from beanie import PydanticObjectId
+from app.models.card import Card
+
+
+@pytest.fixture
+async def resources(client, auth_headers, board_id):
+    """URLs of a board, a list and a card owned by the `auth_headers` user."""
+    lst = (await client.post(f"/api/lists/{board_id}", json={"title": "To Do"}, headers=auth_headers)).json()
+    card = (await client.post(f"/api/cards/{lst['id']}", json={"title": "Card one"}, headers=auth_headers)).json()
+    return {
+        "board": f"/api/boards/{board_id}",
+        "list": f"/api/lists/{lst['id']}",
+        "card": f"/api/cards/{card['id']}",
+    }
+
+
+@pytest.fixture
+async def other_headers(client):
+    response = await client.post(
+        "/api/auth/register",
+        json={"email": "other@example.com", "username": "other", "password": "password123"},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.parametrize("kind", ["board", "list", "card"])
+async def test_stale_revision_is_409(client, auth_headers, resources, kind):
+    url = resources[kind]
+    first = await client.put(url, json={"title": "First edit", "revision": 0}, headers=auth_headers)
+    assert first.status_code == 200
+    assert first.json()["revision"] == 1
+
+    # A second editor still holding revision 0
+    stale = await client.put(url, json={"title": "Second edit", "revision": 0}, headers=auth_headers)
+    assert stale.status_code == 409
+
+    current = await client.put(url, json={"title": "Second edit", "revision": 1}, headers=auth_headers)
+    assert current.status_code == 200
+    assert (current.json()["title"], current.json()["revision"]) == ("Second edit", 2)
+
+    # Without a revision the edit is unconditional
+    blind = await client.put(url, json={"title": "Third edit"}, headers=auth_headers)
+    assert blind.json()["revision"] == 3
+
+
+@pytest.mark.parametrize("kind", ["board", "list", "card"])
+async def test_other_users_resource_is_403(client, resources, other_headers, kind):
+    response = await client.put(resources[kind], json={"title": "Mine now"}, headers=other_headers)
+    assert response.status_code == 403
+    stale = await client.put(resources[kind], json={"title": "Mine now", "revision": 7}, headers=other_headers)
+    assert stale.status_code == 403
+
+
+@pytest.mark.parametrize("kind", ["boards", "lists", "cards"])
+async def test_missing_resource_is_404(client, auth_headers, kind):
+    response = await client.put(
+        f"/api/{kind}/{PydanticObjectId()}", json={"title": "Nothing", "revision": 0}, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+
+@pytest.mark.parametrize("kind", ["boards", "lists", "cards"])
+async def test_malformed_id_is_404(client, auth_headers, kind):
+    response = await client.put(f"/api/{kind}/not-an-id", json={"title": "Nothing"}, headers=auth_headers)
+    assert response.status_code == 404
+
+async def test_documents_without_revision_count_as_zero(client, auth_headers, resources):
+    card_id = resources["card"].rsplit("/", 1)[1]
+    await Card.get_motor_collection().update_one(
+        {"_id": PydanticObjectId(card_id)}, {"$unset": {"revision": ""}}
+    )
+    response = await client.put(resources["card"], json={"title": "Edited", "revision": 0}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["revision"] == 1
@@ -0,0 +1,52 @@
+"""Slow-query log and sampled explain plans."""
+import asyncio
+from app.core.config import settings
+from app.core.slow_queries import slow_query_log, summarize_plan
+
+
+def test_summarize_find_and_aggregate_plans():
+    find_explain = {
+        "queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}},
+        "executionStats": {
+            "nReturned": 5, "totalKeysExamined": 5, "totalDocsExamined": 5, "executionTimeMillis": 1,
+        },
+    }
+    assert summarize_plan(find_explain) == {
+        "stages": ["FETCH", "IXSCAN"], "collection_scan": False,
+        "returned": 5, "keys_examined": 5, "docs_examined": 5, "time_ms": 1,
+    }
+
+    aggregate_explain = {
+        "stages": [
+            {"$cursor": {
+                "queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}},
+                "executionStats": {"nReturned": 2, "totalKeysExamined": 0, "totalDocsExamined": 900},
+            }},
+            {"$sort": {"sortKey": {"order": 1}}},
+        ]
+    }
+    plan = summarize_plan(aggregate_explain)
+    assert plan["collection_scan"] is True
+    assert (plan["returned"], plan["docs_examined"]) == (2, 900)
+
+
+async def test_slow_commands_are_logged_and_explained(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.001)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 1.0)
+    slow_query_log.recent.clear()
+
+    board = (await client.post("/api/boards/", json={"title": "Slow board"}, headers=auth_headers)).json()
+    await client.get(f"/api/lists/{board['id']}", headers=auth_headers)
+
+    route = f"GET /api/lists/{board['id']}"
+    lists_find = next(
+        slow for slow in slow_query_log.recent
+        if slow.route == route and slow.command_name == "find" and slow.collection == "lists"
+    )
+    for _ in range(100):
+        if lists_find.plan is not None or not slow_query_log._explaining:
+            break
+        await asyncio.sleep(0.01)
+    explained = [slow for slow in slow_query_log.recent if slow.plan is not None]
+    assert explained
+    assert all(slow.plan["stages"] for slow in explained)
@@ -0,0 +1,122 @@
+"""Write-behind of card reorders and moves (WRITE_BEHIND_ENABLED)."""
+import pytest
+from beanie import PydanticObjectId
+from app.core.config import settings
+from app.models.board_stats import BoardStats
+from app.models.card import Card
+from app.services.write_behind import (
+    DUE_KEY, FLUSHING_KEY, LOCK_KEY, PENDING_KEY, SINCE_KEY, take_positions, write_behind
+)
+
+
+@pytest.fixture
+async def board(client, auth_headers, redis, monkeypatch):
+    monkeypatch.setattr(settings, "WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_MAX_PENDING", 100)
+    await redis.delete(DUE_KEY)
+    board = (
+        await client.post("/api/boards/", json={"title": "Drag board"}, headers=auth_headers)
+    ).json()
+    todo, done = [
+        (await client.post(f"/api/lists/{board['id']}", json={"title": title}, headers=auth_headers)).json()
+        for title in ("To Do", "Done")
+    ]
+    cards = [
+        (await client.post(f"/api/cards/{todo['id']}", json={"title": title}, headers=auth_headers)).json()
+        for title in ("Card one", "Card two", "Card three")
+    ]
+    # Build the stats document, so flushes have list counts to move
+    await client.get(f"/api/boards/{board['id']}/stats", headers=auth_headers)
+    return board["id"], todo["id"], done["id"], [card["id"] for card in cards]
+
+
+async def stored_positions(card_ids):
+    cards = await Card.find({"_id": {"$in": [PydanticObjectId(card_id) for card_id in card_ids]}}).to_list()
+    return {str(card.id): (card.list_id, card.order) for card in cards}
+
+
+async def board_view(client, auth_headers, board_id):
+    response = await client.get(f"/api/lists/{board_id}", headers=auth_headers)
+    return {lst["id"]: [card["id"] for card in lst["cards"]] for lst in response.json()}
+
+
+async def test_drag_is_held_then_written_in_one_flush(client, auth_headers, board):
+    board_id, todo, done, (one, two, three) = board
+    before = await stored_positions([one, two, three])
+
+    # A drag: the same card moved around several times
+    for order in (1, 2, 0):
+        response = await client.post(
+            f"/api/cards/{todo}/reorder",
+            json={"card_orders": {three: order, one: order + 1}}, headers=auth_headers
+        )
+        assert response.status_code == 200
+    moved = await client.post(
+        f"/api/cards/{two}/move", json={"target_list_id": done, "new_order": 0}, headers=auth_headers
+    )
+    assert moved.json()["list_id"] == done
+
+    # Nothing written yet, but every read sees the new positions
+    assert await stored_positions([one, two, three]) == before
+    assert await board_view(client, auth_headers, board_id) == {todo: [three, one], done: [two]}
+    card = (await client.get(f"/api/cards/{two}", headers=auth_headers)).json()
+    assert (card["list_id"], card["order"]) == (done, 0)
+
+    assert await write_behind.flush_due(everything=True) == 3
+    assert await stored_positions([one, two, three]) == {
+        three: (todo, 0), one: (todo, 1), two: (done, 0)
+    }
+    assert await board_view(client, auth_headers, board_id) == {todo: [three, one], done: [two]}
+    stats = await BoardStats.find_one(BoardStats.board_id == board_id)
+    assert (stats.list_counts.get(todo), stats.list_counts.get(done)) == (2, 1)
+
+
+async def test_reorders_ignore_cards_of_other_lists(client, auth_headers, board):
+    board_id, todo, done, (one, two, three) = board
+    await client.post(
+        f"/api/cards/{one}/move", json={"target_list_id": done, "new_order": 0}, headers=auth_headers
+    )
+    # `one` now sits in Done, if only in Redis
+    await client.post(
+        f"/api/cards/{todo}/reorder", json={"card_orders": {one: 9, three: 0}}, headers=auth_headers
+    )
+
+    assert await board_view(client, auth_headers, board_id) == {todo: [three, two], done: [one]}
+    await write_behind.flush_due(everything=True)
+    assert (await stored_positions([one]))[one] == (done, 0)
+
+
+async def test_other_writes_flush_the_board_first(client, auth_headers, board):
+    board_id, todo, done, (one, two, three) = board
+    await client.post(
+        f"/api/cards/{two}/move", json={"target_list_id": done, "new_order": 0}, headers=auth_headers
+    )
+
+    # Deleting the list must take the card moved into it along
+    await client.delete(f"/api/lists/{done}", headers=auth_headers)
+    assert await Card.get(two) is None
+    assert await write_behind.flush_due(everything=True) == 0
+
+
+async def test_flush_interrupted_after_take_is_retried(client, auth_headers, board, redis):
+    board_id, todo, done, (one, two, three) = board
+    await client.post(
+        f"/api/cards/{two}/move", json={"target_list_id": done, "new_order": 0}, headers=auth_headers
+    )
+
+    # A process takes the entries, then dies before writing them
+    taken = await take_positions(
+        keys=[
+            PENDING_KEY.format(board_id), FLUSHING_KEY.format(board_id),
+            SINCE_KEY.format(board_id), LOCK_KEY.format(board_id), DUE_KEY
+        ],
+        args=[board_id, settings.WRITE_BEHIND_LOCK_SECONDS, 0]
+    )
+    assert taken
+    assert await redis.zscore(DUE_KEY, board_id) is not None
+
+    # Once its lock expires, shutdown's flush writes them
+    await redis.delete(LOCK_KEY.format(board_id))
+    assert await write_behind.flush_due(everything=True) == 1
+    assert (await stored_positions([two]))[two] == (done, 0)
+    assert await redis.zscore(DUE_KEY, board_id) is None
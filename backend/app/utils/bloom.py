@@ -0,0 +1,41 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    `in` never returns False for an added item and returns True for an item
+    that was not added with probability about `error_rate` while fewer than
+    `capacity` items are stored. Items cannot be removed; rebuild instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, items: Iterable[str] = ()):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        for item in items:
+            self.add(item)
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,41 @@
+from typing import Dict, Optional
+from app.core.invalidation import InvalidationBus, invalidation_bus
+
+
+class BoardVersions:
+    """
+    Per-process generation number of each board's lists and cards.
+
+    Routes bump a board after writing to its lists or cards, so reads keyed
+    on (board_id, version) never join work that started before the write.
+    Bumps go through the invalidation bus, so a write handled by one worker
+    also bumps the board in every other worker.
+    """
+
+    topic = "board"
+
+    def __init__(self, bus: Optional[InvalidationBus] = None):
+        self._versions: Dict[str, int] = {}
+        self._bus = bus
+        if bus is not None:
+            bus.subscribe(self.topic, self._invalidate)
+
+    def get(self, board_id: str) -> int:
+        return self._versions.get(board_id, 0)
+
+    def bump(self, board_id: str) -> None:
+        if self._bus is not None:
+            self._bus.publish(self.topic, board_id)
+        else:
+            self._invalidate(board_id)
+
+    def _invalidate(self, board_id: Optional[str]) -> None:
+        if board_id is None:
+            # Missed invalidations: move every known board forward
+            for known in self._versions:
+                self._versions[known] += 1
+            return
+        self._versions[board_id] = self._versions.get(board_id, 0) + 1
+
+
+board_versions = BoardVersions(invalidation_bus)
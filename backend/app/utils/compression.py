@@ -0,0 +1,100 @@
+import zlib
+from typing import Callable, Dict, Optional
+from app.core.config import settings
+
+# brotli and zstandard are optional: without them only gzip is offered.
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(
+            level=settings.COMPRESSION_ZSTD_LEVEL
+        ).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS: Dict[str, Callable] = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content coding from an Accept-Encoding header.
+
+    The client's q-values win; ties go to the order of
+    `settings.COMPRESSION_ENCODINGS`.
+
+    Returns:
+        "zstd", "br", "gzip" or None when nothing acceptable is available
+    """
+    if not accept_encoding or not settings.COMPRESSION_ENABLED:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in settings.COMPRESSION_ENCODINGS:
+        if coding not in ENCODERS:
+            continue
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a complete body with the given content coding."""
+    if encoding == "zstd":
+        # One-shot frames record the content size, which helps decoders
+        return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(data)
+    encoder = ENCODERS[encoding]()
+    return encoder.compress(data) + encoder.flush()
@@ -0,0 +1,86 @@
+from typing import Dict, Iterable, Optional, Set
+from app.core.config import settings
+from app.core.invalidation import InvalidationBus, invalidation_bus
+from app.utils.board_versions import BoardVersions
+from app.utils.snapshots import Snapshot, SnapshotCache
+
+
+class DashboardCache:
+    """
+    Per-process cache of encoded dashboards, one per user.
+
+    An entry is dropped when any board it covers changes (the "board" topic
+    that card and list writes already publish) or when the user's set of
+    boards changes (`invalidate`, published on the "dashboard" topic).
+    Upcoming cards depend on the clock, so entries also expire after
+    DASHBOARD_CACHE_TTL_SECONDS.
+
+    Boards are mapped to their owner only while the owner's dashboard is
+    cached, so the map stays as small as the cache. A change to a board
+    while its owner's dashboard is being rebuilt may then go unnoticed, as
+    on a first build; the TTL bounds how long that dashboard is served.
+    """
+
+    topic = "dashboard"
+
+    def __init__(self, bus: Optional[InvalidationBus], max_entries: int, ttl_seconds: float):
+        self._snapshots = SnapshotCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds, on_drop=self._forget_boards
+        )
+        self._generations: Dict[str, int] = {}
+        self._owners: Dict[str, str] = {}  # board_id -> user_id of cached dashboards
+        self._boards: Dict[str, Set[str]] = {}  # user_id -> board_ids in _owners
+        self._bus = bus
+        if bus is not None:
+            bus.subscribe(self.topic, self._user_changed)
+            bus.subscribe(BoardVersions.topic, self._board_changed)
+
+    def version(self, user_id: str) -> int:
+        return self._generations.get(user_id, 0)
+
+    def get(self, user_id: str) -> Optional[Snapshot]:
+        return self._snapshots.get(user_id, self.version(user_id))
+
+    def set(self, user_id: str, version: int, board_ids: Iterable[str], snapshot: Snapshot) -> None:
+        """Store a dashboard built while the user was at `version`."""
+        self._forget_boards(user_id)
+        boards = self._boards[user_id] = set(board_ids)
+        for board_id in boards:
+            self._owners[board_id] = user_id
+        self._snapshots.set(user_id, version, snapshot)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's dashboard here and in every other process."""
+        if self._bus is not None:
+            self._bus.publish(self.topic, user_id)
+        else:
+            self._user_changed(user_id)
+
+    def _forget_boards(self, user_id: str) -> None:
+        for board_id in self._boards.pop(user_id, ()):
+            if self._owners.get(board_id) == user_id:
+                del self._owners[board_id]
+
+    def _user_changed(self, user_id: Optional[str]) -> None:
+        if user_id is None:
+            for known in self._generations:
+                self._generations[known] += 1
+            self._snapshots.clear()
+            return
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        self._snapshots.discard(user_id)
+
+    def _board_changed(self, board_id: Optional[str]) -> None:
+        if board_id is None:
+            self._user_changed(None)
+            return
+        user_id = self._owners.get(board_id)
+        if user_id is not None:
+            self._user_changed(user_id)
+
+
+dashboard_cache = DashboardCache(
+    invalidation_bus,
+    max_entries=settings.DASHBOARD_CACHE_SIZE,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS
+)
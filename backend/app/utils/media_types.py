@@ -0,0 +1,192 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Coroutine, Dict, Iterator, Optional
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from app.core.config import settings
+
+# msgpack is optional: without it every response is JSON.
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+JSON_TYPE = "application/json"
+MSGPACK_TYPE = "application/msgpack"
+MSGPACK_TYPES = (MSGPACK_TYPE, "application/x-msgpack")
+
+# Media type negotiated for the response of the request being handled
+_response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_TYPE)
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None and settings.MSGPACK_ENABLED
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header names MessagePack."""
+    if not content_type:
+        return False
+    return content_type.partition(";")[0].strip().lower() in MSGPACK_TYPES
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Pick the response media type from an Accept header.
+
+    MessagePack is only chosen when the client prefers it over JSON;
+    JSON wins ties, wildcards and missing headers.
+
+    Returns:
+        `JSON_TYPE` or `MSGPACK_TYPE`
+    """
+    if not accept or not msgpack_available():
+        return JSON_TYPE
+
+    weights: Dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_type = media_type.strip().lower()
+        weights[media_type] = max(quality, weights.get(media_type, 0.0))
+
+    msgpack_quality = max(weights.get(media_type, 0.0) for media_type in MSGPACK_TYPES)
+    json_quality = weights.get(
+        JSON_TYPE, weights.get("application/*", weights.get("*/*", 0.0))
+    )
+    return MSGPACK_TYPE if msgpack_quality > json_quality else JSON_TYPE
+
+
+@contextmanager
+def responding_as(media_type: str) -> Iterator[None]:
+    """Have `NegotiatedResponse` encode responses built inside the block as `media_type`."""
+    token = _response_media_type.set(media_type)
+    try:
+        yield
+    finally:
+        _response_media_type.reset(token)
+
+
+def unpack_body(body: bytes) -> Any:
+    """
+    Decode a MessagePack request body.
+
+    Timestamps sent as the MessagePack extension type come back as aware
+    datetimes, which the request schemas accept like ISO strings.
+
+    Raises:
+        ValueError: The body is not valid MessagePack
+    """
+    return msgpack.unpackb(body, raw=False, timestamp=3)
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    """
+    Re-encode a JSON body as MessagePack.
+
+    The body was produced by the JSON encoders, so datetimes and ObjectIds
+    are already the strings a JSON client sees.
+    """
+    return msgpack.packb(json.loads(body), use_bin_type=True)
+
+
+def _encode_unpacked(value: Any) -> Any:
+    # Timestamps sent as the MessagePack extension type read like ISO strings
+    if isinstance(value, datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    raise TypeError(f"{type(value).__name__} has no JSON representation")
+
+
+def msgpack_to_json(body: bytes) -> bytes:
+    """
+    Re-encode a MessagePack body as JSON.
+
+    Raises:
+        ValueError: The body is not valid MessagePack, or holds values
+            (e.g. binary) that JSON cannot express
+    """
+    try:
+        data = unpack_body(body)
+        return json.dumps(data, default=_encode_unpacked, separators=(",", ":")).encode()
+    except (ValueError, TypeError) as e:
+        raise ValueError(str(e)) from e
+
+
+class NegotiatedResponse(JSONResponse):
+    """
+    Default response class of the routes: JSON, or MessagePack when the
+    request negotiated it.
+
+    Routes hand it content FastAPI already reduced to JSON-compatible
+    values, so MessagePack is packed straight from them: datetimes and
+    ObjectIds are the same strings a JSON client sees, and nothing is
+    encoded twice.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if _response_media_type.get() == MSGPACK_TYPE:
+            self.media_type = MSGPACK_TYPE
+            return msgpack.packb(content, use_bin_type=True)
+        return super().render(content)
+
+
+class MessagePackRequest(Request):
+    """
+    A request with a MessagePack body, decoded once.
+
+    FastAPI only reads bodies it takes for JSON through `json()`, so the
+    request reports a JSON content type and `json()` unpacks the body.
+    """
+
+    @property
+    def headers(self) -> Headers:
+        if not hasattr(self, "_headers"):
+            headers = MutableHeaders(raw=list(self.scope["headers"]))
+            headers["content-type"] = JSON_TYPE
+            self._headers = headers
+        return self._headers
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = unpack_body(await self.body())
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid MessagePack body"
+                ) from e
+        return self._json
+
+
+class MessagePackRoute(APIRoute):
+    """
+    Route class speaking MessagePack to the clients that ask for it.
+
+    Request bodies sent as `application/msgpack` are unpacked directly into
+    the route's parameters, and `NegotiatedResponse` packs the result in the
+    media type the Accept header prefers.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            if not msgpack_available():
+                return await handler(request)
+            if is_msgpack(request.headers.get("content-type")):
+                request = MessagePackRequest(request.scope, request.receive)
+            with responding_as(negotiate_media_type(request.headers.get("accept"))):
+                return await handler(request)
+
+        return negotiated_handler
@@ -0,0 +1,165 @@
+from datetime import date, datetime
+from typing import Any, Dict, List as ListType, Optional, Union
+from app.models.archived_card import ArchivedCard
+from app.models.board import Board
+from app.models.board_stats import BoardStats
+from app.models.card import Card
+from app.models.list import List
+from app.schemas.activity import ActivityEventResponse
+from app.schemas.board import BoardResponse, BoardStatsResponse
+from app.schemas.card import ArchivedCardResponse, CardResponse, CardSummaryResponse
+from app.schemas.list import ListWithCardsResponse
+
+
+def board_to_response(board: Board) -> BoardResponse:
+    """Build the API representation of a board document."""
+    return BoardResponse(
+        id=str(board.id),
+        title=board.title,
+        description=board.description,
+        background_color=board.background_color,
+        owner_id=board.owner_id,
+        is_template=board.is_template,
+        revision=board.revision,
+        created_at=board.created_at.isoformat(),
+        updated_at=board.updated_at.isoformat()
+    )
+
+
+def activity_to_response(event: dict) -> ActivityEventResponse:
+    """Build the API representation of a raw activity event."""
+    return ActivityEventResponse(
+        id=str(event["_id"]),
+        board_id=event["board_id"],
+        actor_id=event["actor_id"],
+        action=event["action"],
+        entity_id=event["entity_id"],
+        details=event.get("details") or {},
+        created_at=event["created_at"].isoformat()
+    )
+
+
+def board_stats_to_response(
+    stats: BoardStats, today: Optional[date] = None
+) -> BoardStatsResponse:
+    """
+    Build the API representation of a board's stats.
+
+    Overdue and due-today counts are read from the per-day due buckets, so
+    they are correct for `today` (default: the current UTC day).
+    """
+    today_key = (today or datetime.utcnow().date()).isoformat()
+    due = [(day, count) for day, count in stats.due_counts.items() if count > 0]
+    return BoardStatsResponse(
+        board_id=stats.board_id,
+        card_count=stats.card_count,
+        list_counts={list_id: count for list_id, count in stats.list_counts.items() if count >= 0},
+        overdue_count=sum(count for day, count in due if day < today_key),
+        due_today_count=sum(count for day, count in due if day == today_key),
+        checklist_total=stats.checklist_total,
+        checklist_completed=stats.checklist_completed,
+        checklist_completion=(
+            stats.checklist_completed / stats.checklist_total if stats.checklist_total else 0.0
+        ),
+        updated_at=stats.updated_at.isoformat()
+    )
+
+
+def card_to_response(card: Card) -> CardResponse:
+    """Build the API representation of a card document."""
+    return CardResponse(
+        id=str(card.id),
+        title=card.title,
+        description=card.description,
+        labels=card.labels,
+        due_date=card.due_date.isoformat().replace('+00:00', 'Z') if card.due_date else None,
+        checklist=[item.dict() if hasattr(item, 'dict') else item for item in card.checklist],
+        order=card.order,
+        list_id=card.list_id,
+        revision=card.revision,
+        created_at=card.created_at.isoformat(),
+        updated_at=card.updated_at.isoformat()
+    )
+
+
+def card_summary_to_response(doc: Dict[str, Any]) -> CardSummaryResponse:
+    """Build the board-view representation of a raw, projected card document."""
+    due_date = doc.get("due_date")
+    return CardSummaryResponse(
+        id=str(doc["_id"]),
+        title=doc["title"],
+        labels=doc.get("labels") or [],
+        due_date=due_date.isoformat().replace('+00:00', 'Z') if due_date else None,
+        checklist_total=doc["checklist_total"],
+        checklist_completed=doc["checklist_completed"],
+        order=doc.get("order", 0),
+        list_id=doc["list_id"],
+        revision=doc.get("revision", 0)
+    )
+
+
+def archived_card_to_response(card: ArchivedCard) -> ArchivedCardResponse:
+    """Build the API representation of an archived card."""
+    return ArchivedCardResponse(
+        **card_to_response(card).model_dump(),
+        board_id=card.board_id,
+        archived_at=card.archived_at.isoformat(),
+        archive_reason=card.archive_reason
+    )
+
+
+def lists_with_cards_response(
+    lists: ListType[List], cards: ListType[Card]
+) -> ListType[ListWithCardsResponse]:
+    """
+    Group cards under their lists.
+
+    Args:
+        lists: Lists of one board, already sorted by order
+        cards: Cards of those lists, already sorted by order
+
+    Returns:
+        List of ListWithCardsResponse in the order of `lists`
+    """
+    cards_by_list: Dict[str, ListType[CardResponse]] = {}
+    for card in cards:
+        cards_by_list.setdefault(card.list_id, []).append(card_to_response(card))
+    return _group_under_lists(lists, cards_by_list)
+
+
+def lists_with_card_summaries(
+    lists: ListType[List], cards: ListType[Dict[str, Any]]
+) -> ListType[ListWithCardsResponse]:
+    """
+    Group card summaries under their lists.
+
+    Args:
+        lists: Lists of one board, already sorted by order
+        cards: Raw, projected card documents of those lists, already sorted by order
+
+    Returns:
+        List of ListWithCardsResponse holding CardSummaryResponse cards
+    """
+    cards_by_list: Dict[str, ListType[CardSummaryResponse]] = {}
+    for card in cards:
+        cards_by_list.setdefault(card["list_id"], []).append(card_summary_to_response(card))
+    return _group_under_lists(lists, cards_by_list)
+
+
+def _group_under_lists(
+    lists: ListType[List],
+    cards_by_list: Dict[str, ListType[Union[CardResponse, CardSummaryResponse]]]
+) -> ListType[ListWithCardsResponse]:
+    return [
+        ListWithCardsResponse(
+            id=str(lst.id),
+            title=lst.title,
+            order=lst.order,
+            board_id=lst.board_id,
+            revision=lst.revision,
+            created_at=lst.created_at.isoformat(),
+            updated_at=lst.updated_at.isoformat(),
+            cards=cards_by_list.get(str(lst.id), [])
+        )
+        for lst in lists
+    ]
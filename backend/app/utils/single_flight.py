@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result instead of repeating it. Nothing is
+    cached once the call finishes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shield the shared task: one caller disconnecting must not cancel
+        # the work the other callers are waiting for.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            task.exception()
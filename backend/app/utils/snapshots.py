@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from starlette.requests import Request
+from starlette.responses import Response
+from app.core.config import settings
+from app.utils.compression import compress, negotiate_encoding
+from app.utils.media_types import JSON_TYPE, MSGPACK_TYPE, json_to_msgpack, negotiate_media_type
+
+
+class Snapshot:
+    """
+    An encoded JSON response body plus its MessagePack and compressed
+    variants, built on demand.
+    """
+
+    def __init__(self, body: bytes, media_type: str = JSON_TYPE):
+        self.body = body
+        self.media_type = media_type
+        self._compressed: Dict[str, bytes] = {}
+        self._msgpack: Optional["Snapshot"] = None
+
+    def compressed(self, encoding: str) -> bytes:
+        if encoding not in self._compressed:
+            self._compressed[encoding] = compress(self.body, encoding)
+        return self._compressed[encoding]
+
+    def encoded_as(self, media_type: str) -> "Snapshot":
+        if media_type != MSGPACK_TYPE or self.media_type == MSGPACK_TYPE:
+            return self
+        if self._msgpack is None:
+            self._msgpack = Snapshot(json_to_msgpack(self.body), MSGPACK_TYPE)
+        return self._msgpack
+
+
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    """
+    Serve a snapshot in the negotiated media type and content coding.
+
+    Both variants are kept on the snapshot, so repeat hits skip encoding
+    and compression entirely.
+    """
+    snapshot = snapshot.encoded_as(negotiate_media_type(request.headers.get("accept")))
+    encoding = None
+    if len(snapshot.body) >= settings.COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return Response(content=snapshot.body, media_type=snapshot.media_type)
+    return Response(
+        content=snapshot.compressed(encoding),
+        media_type=snapshot.media_type,
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+    )
+
+
+class SnapshotCache:
+    """
+    Bounded LRU of snapshots, one version per key, with a TTL.
+
+    A lookup only hits when the stored version matches, so bumping a
+    version is enough to invalidate the entry. `on_drop`, if given, is
+    called with the key of every entry that leaves the cache (stale,
+    expired, evicted or discarded), and of every entry refused by a cache
+    of size 0.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        on_drop: Optional[Callable[[Hashable], None]] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.on_drop = on_drop
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Snapshot]]" = OrderedDict()
+
+    def get(self, key: Hashable, version: int) -> Optional[Snapshot]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_version, expires_at, snapshot = entry
+        if stored_version != version or expires_at < time.monotonic():
+            del self._entries[key]
+            self._dropped(key)
+            return None
+        self._entries.move_to_end(key)
+        return snapshot
+
+    def set(self, key: Hashable, version: int, snapshot: Snapshot) -> None:
+        if self.max_entries <= 0:
+            self._dropped(key)
+            return
+        self._entries[key] = (version, time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._dropped(evicted)
+
+    def discard(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dropped(key)
+
+    def clear(self) -> None:
+        keys = list(self._entries)
+        self._entries.clear()
+        for key in keys:
+            self._dropped(key)
+
+    def _dropped(self, key: Hashable) -> None:
+        if self.on_drop is not None:
+            self.on_drop(key)
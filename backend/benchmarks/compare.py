@@ -0,0 +1,55 @@
+"""
+Compare two load-test result files.
+
+Usage:
+    python -m benchmarks.compare results/baseline.json results/current.json \\
+        --max-regression 10
+
+Exits with status 1 when the p95 latency of any scenario regressed by more
+than `--max-regression` percent.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ["throughput_rps", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def percent_change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def compare(baseline: dict, current: dict, max_regression: float) -> bool:
+    ok = True
+    print(f"{'scenario':<18}" + "".join(f"{m:>24}" for m in METRICS))
+    for scenario, before in baseline["results"].items():
+        after = current["results"].get(scenario)
+        if after is None:
+            continue
+        cells = []
+        for metric in METRICS:
+            change = percent_change(before[metric], after[metric])
+            cells.append(f"{before[metric]:>9.1f} → {after[metric]:>7.1f} ({change:+.0f}%)")
+        print(f"{scenario:<18}" + "".join(f"{c:>24}" for c in cells))
+        if percent_change(before["p95_ms"], after["p95_ms"]) > max_regression:
+            print(f"  ❌ {scenario}: p95 regressed more than {max_regression}%")
+            ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare load-test results")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="allowed p95 regression in percent")
+    args = parser.parse_args()
+    passed = compare(
+        json.loads(args.baseline.read_text()),
+        json.loads(args.current.read_text()),
+        args.max_regression,
+    )
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,219 @@
+"""
+Deterministic synthetic dataset generator for benchmarks.
+
+Seeds users, boards, lists and cards through the Beanie models in
+`app/models/`. The same spec and seed always produce the same documents
+(including ObjectIds), so results from different runs and commits are
+comparable.
+
+Usage:
+    MONGODB_DB_NAME=todolist_bench python -m benchmarks.dataset --drop
+    python -m benchmarks.dataset --users 50 --cards-per-board 100 --drop
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List as ListType
+from beanie import PydanticObjectId
+from app.core.config import settings
+from app.core.database import init_db
+from app.core.security import get_password_hash
+from app.models.board import Board
+from app.models.archived_card import ArchivedCard
+from app.models.activity import ActivityEvent
+from app.models.board_stats import BoardStats
+from app.models.card import Card, ChecklistItem
+from app.models.list import List
+from app.models.user import User
+
+BENCH_PASSWORD = "benchmark-password"
+LABELS = ["red", "orange", "yellow", "green", "blue", "purple"]
+EPOCH = datetime(2024, 1, 1)
+INSERT_BATCH_SIZE = 5000
+
+
+@dataclass
+class DatasetSpec:
+    """Shape of the generated dataset."""
+    users: int = 1000
+    boards_per_user: int = 7
+    lists_per_board: int = 20
+    cards_per_board: int = 500
+    seed: int = 42
+
+
+def bench_email(user_index: int) -> str:
+    return f"bench-user-{user_index}@example.com"
+
+
+class DatasetGenerator:
+    """Produces the documents for a DatasetSpec, in a reproducible order."""
+
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        # One bcrypt hash for everyone: hashing 1k passwords would dominate
+        # the seeding time without making the data more realistic.
+        self.password_hash = get_password_hash(BENCH_PASSWORD)
+
+    def _object_id(self) -> PydanticObjectId:
+        return PydanticObjectId(self.rng.randbytes(12))
+
+    def _timestamp(self) -> datetime:
+        return EPOCH + timedelta(seconds=self.rng.randrange(365 * 24 * 3600))
+
+    def users(self) -> Iterator[User]:
+        for i in range(self.spec.users):
+            created = self._timestamp()
+            yield User(
+                id=self._object_id(),
+                email=bench_email(i),
+                username=f"bench_user_{i}",
+                hashed_password=self.password_hash,
+                full_name=f"Bench User {i}",
+                board_count=self.spec.boards_per_user,
+                created_at=created,
+                updated_at=created,
+            )
+
+    def board(self, owner: User, index: int) -> Board:
+        created = self._timestamp()
+        return Board(
+            id=self._object_id(),
+            title=f"Board {index:02d}",
+            description=f"Benchmark board {index} of {owner.username}",
+            owner_id=str(owner.id),
+            card_count=self.spec.cards_per_board,
+            created_at=created,
+            updated_at=created,
+        )
+
+    def lists(self, board: Board) -> ListType[List]:
+        return [
+            List(
+                id=self._object_id(),
+                title=f"List {order:02d}",
+                order=order,
+                board_id=str(board.id),
+                created_at=board.created_at,
+                updated_at=board.created_at,
+            )
+            for order in range(self.spec.lists_per_board)
+        ]
+
+    def cards(self, lists: ListType[List]) -> ListType[Card]:
+        cards = []
+        for i in range(self.spec.cards_per_board):
+            lst = lists[i % len(lists)]
+            created = self._timestamp()
+            checklist = [
+                ChecklistItem(
+                    id=str(self._object_id()),
+                    text=f"Step {step}",
+                    completed=self.rng.random() < 0.5,
+                )
+                for step in range(self.rng.randrange(0, 6))
+            ]
+            cards.append(
+                Card(
+                    id=self._object_id(),
+                    title=f"Card {i:04d}",
+                    description="x" * self.rng.randrange(0, 500),
+                    labels=self.rng.sample(LABELS, self.rng.randrange(0, 3)),
+                    due_date=(
+                        created + timedelta(days=self.rng.randrange(1, 60))
+                        if self.rng.random() < 0.4
+                        else None
+                    ),
+                    checklist=checklist,
+                    order=i // len(lists),
+                    list_id=str(lst.id),
+                    created_at=created,
+                    updated_at=created,
+                )
+            )
+        return cards
+
+
+async def _flush(model, pending: list) -> None:
+    if pending:
+        await model.insert_many(pending)
+        pending.clear()
+
+
+async def seed(spec: DatasetSpec, drop: bool = False) -> dict:
+    """Insert the dataset described by `spec` and return summary counts."""
+    await init_db()
+
+    existing = await User.find_all().count()
+    if existing and not drop:
+        raise SystemExit(
+            f"Database {settings.MONGODB_DB_NAME} already has {existing} users; "
+            "pass --drop to replace its contents"
+        )
+    for model in (User, Board, List, Card, ArchivedCard, BoardStats, ActivityEvent):
+        await model.get_motor_collection().delete_many({})
+
+    generator = DatasetGenerator(spec)
+    started = time.perf_counter()
+    pending = {Board: [], List: [], Card: []}
+    totals = {"users": 0, "boards": 0, "lists": 0, "cards": 0}
+
+    users = list(generator.users())
+    await User.insert_many(users)
+    totals["users"] = len(users)
+
+    for user in users:
+        for index in range(spec.boards_per_user):
+            board = generator.board(user, index)
+            lists = generator.lists(board)
+            cards = generator.cards(lists)
+            pending[Board].append(board)
+            pending[List].extend(lists)
+            pending[Card].extend(cards)
+            totals["boards"] += 1
+            totals["lists"] += len(lists)
+            totals["cards"] += len(cards)
+            if len(pending[Card]) >= INSERT_BATCH_SIZE:
+                for model, docs in pending.items():
+                    await _flush(model, docs)
+
+    for model, docs in pending.items():
+        await _flush(model, docs)
+
+    return {
+        **totals,
+        "spec": asdict(spec),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def parse_spec(argv=None) -> tuple:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    defaults = DatasetSpec()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--boards-per-user", type=int, default=defaults.boards_per_user)
+    parser.add_argument("--lists-per-board", type=int, default=defaults.lists_per_board)
+    parser.add_argument("--cards-per-board", type=int, default=defaults.cards_per_board)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--drop", action="store_true", help="replace any existing data in the database"
+    )
+    args = parser.parse_args(argv)
+    spec = DatasetSpec(
+        users=args.users,
+        boards_per_user=args.boards_per_user,
+        lists_per_board=args.lists_per_board,
+        cards_per_board=args.cards_per_board,
+        seed=args.seed,
+    )
+    return spec, args.drop
+
+
+if __name__ == "__main__":
+    spec, drop = parse_spec()
+    summary = asyncio.run(seed(spec, drop=drop))
+    print(f"✅ Seeded {settings.MONGODB_DB_NAME}: {summary}")
@@ -0,0 +1,237 @@
+"""
+HTTP load test against a running API server.
+
+Drives the real endpoints with concurrent async clients, one scenario at a
+time, and writes throughput and latency percentiles as JSON. Seed the
+database with `benchmarks.dataset` first so users and boards exist.
+
+Start the server with RATE_LIMIT_ENABLED=false: the limits would otherwise
+answer most requests with 429, and the run stops at the first one.
+
+Usage:
+    RATE_LIMIT_ENABLED=false uvicorn app.main:app --port 8000 --workers 1
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8000 \\
+        --concurrency 32 --duration 20 --output results/current.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List as ListType, Optional
+import httpx
+from benchmarks.dataset import BENCH_PASSWORD, DatasetSpec, bench_email
+
+SCENARIOS = ["login", "get_board_lists", "create_card", "reorder_cards", "move_card"]
+
+
+class RateLimited(Exception):
+    """The server answered 429: the run would measure the rate limiter."""
+
+    def __init__(self, path: str):
+        super().__init__(
+            f"429 Too Many Requests on {path}: restart the API with "
+            "RATE_LIMIT_ENABLED=false before load testing"
+        )
+
+
+def check_not_limited(response: httpx.Response) -> httpx.Response:
+    if response.status_code == 429:
+        raise RateLimited(response.request.url.path)
+    return response
+
+
+@dataclass
+class Session:
+    """A logged-in benchmark user and the board it works on."""
+    headers: Dict[str, str]
+    email: str
+    board_id: str
+    list_ids: ListType[str]
+    card_ids: Dict[str, ListType[str]]
+
+
+@dataclass
+class ScenarioResult:
+    latencies: ListType[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        ok = sorted(self.latencies)
+        total = len(ok) + self.errors
+        if len(ok) >= 2:
+            cuts = statistics.quantiles(ok, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = ok[0] if ok else 0.0
+        return {
+            "requests": total,
+            "errors": self.errors,
+            "throughput_rps": round(len(ok) / self.elapsed, 2) if self.elapsed else 0.0,
+            "mean_ms": round(statistics.fmean(ok) * 1000, 3) if ok else 0.0,
+            "p50_ms": round(p50 * 1000, 3),
+            "p95_ms": round(p95 * 1000, 3),
+            "p99_ms": round(p99 * 1000, 3),
+            "max_ms": round(ok[-1] * 1000, 3) if ok else 0.0,
+        }
+
+
+async def open_session(client: httpx.AsyncClient, email: str, rng: random.Random) -> Session:
+    response = await client.post(
+        "/api/auth/login", json={"email": email, "password": BENCH_PASSWORD}
+    )
+    check_not_limited(response).raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    boards = (await client.get("/api/boards/", headers=headers)).json()["boards"]
+    board_id = rng.choice(boards)["id"]
+    lists = (await client.get(f"/api/lists/{board_id}", headers=headers)).json()
+    return Session(
+        headers=headers,
+        email=email,
+        board_id=board_id,
+        list_ids=[lst["id"] for lst in lists],
+        card_ids={lst["id"]: [card["id"] for card in lst["cards"]] for lst in lists},
+    )
+
+
+async def run_request(
+    client: httpx.AsyncClient, scenario: str, session: Session, rng: random.Random
+) -> httpx.Response:
+    if scenario == "login":
+        return await client.post(
+            "/api/auth/login", json={"email": session.email, "password": BENCH_PASSWORD}
+        )
+    if scenario == "get_board_lists":
+        return await client.get(f"/api/lists/{session.board_id}", headers=session.headers)
+    if scenario == "create_card":
+        list_id = rng.choice(session.list_ids)
+        response = await client.post(
+            f"/api/cards/{list_id}",
+            json={"title": f"Load test card {rng.randrange(10**6)}"},
+            headers=session.headers,
+        )
+        if response.status_code == 201:
+            session.card_ids[list_id].append(response.json()["id"])
+        return response
+    if scenario == "reorder_cards":
+        list_id = max(session.list_ids, key=lambda lid: len(session.card_ids[lid]))
+        card_ids = session.card_ids[list_id][:]
+        rng.shuffle(card_ids)
+        return await client.post(
+            f"/api/cards/{list_id}/reorder",
+            json={"card_orders": {cid: order for order, cid in enumerate(card_ids)}},
+            headers=session.headers,
+        )
+    if scenario == "move_card":
+        source = rng.choice([lid for lid in session.list_ids if session.card_ids[lid]])
+        target = rng.choice(session.list_ids)
+        card_id = session.card_ids[source].pop()
+        session.card_ids[target].append(card_id)
+        return await client.post(
+            f"/api/cards/{card_id}/move",
+            json={"target_list_id": target, "new_order": len(session.card_ids[target]) - 1},
+            headers=session.headers,
+        )
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: str,
+    sessions: ListType[Session],
+    duration: float,
+    seed: int,
+) -> ScenarioResult:
+    result = ScenarioResult()
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int, session: Session):
+        rng = random.Random(f"{seed}-{scenario}-{index}")
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = check_not_limited(await run_request(client, scenario, session, rng))
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                result.latencies.append(time.perf_counter() - started)
+            else:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i, s) for i, s in enumerate(sessions)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    emails = [bench_email(i) for i in rng.sample(range(args.users), args.concurrency)]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        sessions = await asyncio.gather(*(open_session(client, e, rng) for e in emails))
+        results = {}
+        for scenario in args.scenarios:
+            print(f"▶ {scenario} ({args.concurrency} clients, {args.duration}s)")
+            outcome = await run_scenario(client, scenario, sessions, args.duration, args.seed)
+            results[scenario] = outcome.summary()
+            print(f"  {results[scenario]}")
+
+    return {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HTTP load test for the Todo-List API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per scenario")
+    parser.add_argument("--users", type=int, default=DatasetSpec().users,
+                        help="number of seeded users to pick clients from")
+    parser.add_argument("--seed", type=int, default=DatasetSpec().seed)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--output", type=Path, help="write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        report = asyncio.run(main(args))
+    except RateLimited as exc:
+        raise SystemExit(f"❌ {exc}")
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"✅ Results written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
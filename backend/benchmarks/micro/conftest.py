@@ -0,0 +1,43 @@
+import asyncio
+import pytest
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+from app.core.config import settings
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+from benchmarks.dataset import DatasetGenerator, DatasetSpec
+
+
+async def _init_models() -> bool:
+    client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=2000)
+    try:
+        await client.admin.command("ping")
+    except PyMongoError:
+        return False
+    # Beanie needs initialised collections to build documents; nothing is
+    # read or written by the micro-benchmarks themselves.
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[User, Board, List, Card],
+    )
+    return True
+
+
+@pytest.fixture(scope="session")
+def beanie_models():
+    if not asyncio.run(_init_models()):
+        pytest.skip(f"MongoDB is not reachable at {settings.MONGODB_URL}")
+
+
+@pytest.fixture(scope="session")
+def large_board(beanie_models):
+    """Lists and cards of one board: 20 lists, 2,000 cards, sorted like the API."""
+    generator = DatasetGenerator(DatasetSpec(users=1, lists_per_board=20, cards_per_board=2000))
+    owner = next(generator.users())
+    board = generator.board(owner, 0)
+    lists = generator.lists(board)
+    cards = sorted(generator.cards(lists), key=lambda card: card.order)
+    return lists, cards
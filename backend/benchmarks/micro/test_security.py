@@ -0,0 +1,19 @@
+"""JWT creation and decoding on the auth hot path."""
+from app.core.security import create_access_token, decode_token
+
+USER_ID = "507f1f77bcf86cd799439011"
+
+
+def test_create_access_token(benchmark):
+    benchmark(create_access_token, {"sub": USER_ID})
+
+
+def test_decode_token(benchmark):
+    token = create_access_token({"sub": USER_ID})
+    payload = benchmark(decode_token, token)
+    assert payload["sub"] == USER_ID
+
+
+def test_decode_invalid_token(benchmark):
+    token = create_access_token({"sub": USER_ID})[:-4] + "AAAA"
+    assert benchmark(decode_token, token) is None
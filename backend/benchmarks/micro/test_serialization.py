@@ -0,0 +1,77 @@
+"""Response building and Beanie hydration for large boards."""
+import json
+from typing import List as ListType
+import pytest
+from beanie.odm.utils.parsing import parse_obj
+from pydantic import TypeAdapter
+from app.models.card import Card
+from app.schemas.list import ListWithCardsResponse
+from app.utils.media_types import (
+    JSON_TYPE, MSGPACK_TYPE, NegotiatedResponse, responding_as, unpack_body
+)
+from app.utils.serializers import (
+    card_to_response, lists_with_card_summaries, lists_with_cards_response
+)
+
+
+def test_card_response(benchmark, large_board):
+    _, cards = large_board
+    benchmark(card_to_response, cards[0])
+
+
+def test_lists_with_cards_response(benchmark, large_board):
+    lists, cards = large_board
+    result = benchmark(lists_with_cards_response, lists, cards)
+    assert sum(len(lst.cards) for lst in result) == len(cards)
+
+
+def test_board_response_json(benchmark, large_board):
+    lists, cards = large_board
+    responses = lists_with_cards_response(lists, cards)
+    benchmark(lambda: [response.model_dump_json() for response in responses])
+
+
+def test_board_summary_response_json(benchmark, large_board):
+    lists, cards = large_board
+    summaries = [
+        card.model_dump(by_alias=True, exclude={"description", "checklist", "created_at", "updated_at"})
+        for card in cards
+    ]
+    responses = lists_with_card_summaries(lists, summaries)
+    benchmark(lambda: [response.model_dump_json() for response in responses])
+
+
+@pytest.fixture
+def board_content(large_board):
+    """The board view as FastAPI hands it to the response class."""
+    lists, cards = large_board
+    return TypeAdapter(ListType[ListWithCardsResponse]).dump_python(
+        lists_with_cards_response(lists, cards), mode="json"
+    )
+
+
+@pytest.mark.benchmark(group="board response encoding")
+@pytest.mark.parametrize("media_type", [JSON_TYPE, MSGPACK_TYPE])
+def test_board_response_encoding(benchmark, board_content, media_type):
+    if media_type == MSGPACK_TYPE:
+        pytest.importorskip("msgpack")
+    with responding_as(media_type):
+        response = benchmark(NegotiatedResponse, board_content)
+    assert response.media_type == media_type
+
+
+@pytest.mark.benchmark(group="request body decoding")
+@pytest.mark.parametrize("media_type", [JSON_TYPE, MSGPACK_TYPE])
+def test_request_body_decoding(benchmark, board_content, media_type):
+    if media_type == MSGPACK_TYPE:
+        msgpack = pytest.importorskip("msgpack")
+        benchmark(unpack_body, msgpack.packb(board_content))
+    else:
+        benchmark(json.loads, json.dumps(board_content))
+
+
+def test_card_hydration(benchmark, large_board):
+    _, cards = large_board
+    raw_cards = [card.model_dump(by_alias=True) for card in cards]
+    result = benchmark(lambda: [parse_obj(Card, raw) for raw in raw_cards])
+    assert len(result) == len(cards)
@@ -0,0 +1,23 @@
+"""Pydantic validation of card request payloads."""
+from app.schemas.card import CardCreate, CardReorder
+
+CARD_PAYLOAD = {
+    "title": "Write documentation",
+    "description": "x" * 400,
+    "labels": ["red", "blue"],
+    "due_date": "2024-12-31T23:59:59Z",
+    "checklist": [
+        {"id": str(i), "text": f"Step {i}", "completed": i % 2 == 0} for i in range(10)
+    ],
+    "order": 3,
+}
+REORDER_PAYLOAD = {"card_orders": {f"{i:024x}": i for i in range(500)}}
+
+
+def test_card_create_validation(benchmark):
+    benchmark(CardCreate.model_validate, CARD_PAYLOAD)
+
+
+def test_card_reorder_validation(benchmark):
+    result = benchmark(CardReorder.model_validate, REORDER_PAYLOAD)
+    assert len(result.card_orders) == 500
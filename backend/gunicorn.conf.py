@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for the multi-worker runtime.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Each worker is a separate uvicorn event loop with its own in-process caches;
+they stay coherent through the Redis invalidation bus (app/core/invalidation.py).
+Worker count comes from WORKERS in the environment / .env.
+"""
+from app.core.config import settings
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.WORKERS
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Do not import the app in the master: every worker must open its own
+# MongoDB and Redis connections after the fork
+preload_app = False
+
+# Keep-alive slightly above typical load balancer idle timeouts
+keepalive = 75
+graceful_timeout = 30
+timeout = 60
+
+accesslog = "-"
+errorlog = "-"
@@ -154,18 +154,36 @@ const formatDueDate = (dueDate: string | undefined) => {
   return formattedDate; // Full date for far future
 };
 
+const toFormData = (card: Card) => ({
+  title: card.title,
+  description: card.description || "",
+  labels: card.labels || [],
+  due_date: card.due_date ? formatDateForInput(card.due_date) : "",
+  checklist: card.checklist || [],
+});
+
 export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
-  const { updateCard, deleteCard } = useCardStore();
+  const { updateCard, deleteCard, fetchCard } = useCardStore();
   const [isEditing, setIsEditing] = useState(false);
   const [showMenu, setShowMenu] = useState(false);
   const [showViewModal, setShowViewModal] = useState(false);
-  const [formData, setFormData] = useState({
-    title: card.title,
-    description: card.description || "",
-    labels: card.labels || [],
-    due_date: card.due_date ? formatDateForInput(card.due_date) : "",
-    checklist: card.checklist || [],
-  });
+  const [formData, setFormData] = useState(() => toFormData(card));
+
+  // Board cards are summaries; the form needs the description and checklist
+  const startEditing = async () => {
+    try {
+      const fullCard = card.checklist ? card : await fetchCard(card.id);
+      setFormData(toFormData(fullCard));
+      setIsEditing(true);
+    } catch (error) {
+      toast.error("Failed to load card");
+    }
+  };
+
+  const checklistTotal = card.checklist?.length ?? card.checklist_total ?? 0;
+  const checklistCompleted = card.checklist
+    ? card.checklist.filter((item) => item.completed).length
+    : card.checklist_completed ?? 0;
 
   const {
     attributes,
@@ -224,6 +242,7 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
           labels: formData.labels,
           due_date: parsedDueDate,
           checklist: formData.checklist,
+          revision: card.revision,
         });
         toast.success("Card updated");
       } catch (error) {
@@ -391,15 +410,7 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
           </button>
           <button
             onClick={() => {
-              setFormData({
-                title: card.title,
-                description: card.description || "",
-                labels: card.labels || [],
-                due_date: card.due_date
-                  ? formatDateForInput(card.due_date)
-                  : "",
-                checklist: card.checklist || [],
-              });
+              setFormData(toFormData(card));
               setIsEditing(false);
             }}
             className="flex-1 bg-gray-300 hover:bg-gray-400 text-gray-800 py-1 rounded text-sm"
@@ -444,11 +455,6 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
       <div className="flex items-start justify-between">
         <div className="flex-1">
           <p className="text-sm font-medium text-gray-800">{card.title}</p>
-          {card.description && (
-            <p className="text-xs text-gray-600 mt-1 line-clamp-2">
-              {card.description}
-            </p>
-          )}
 
           {/* Due Date Display */}
           {card.due_date && (
@@ -465,7 +471,7 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
           )}
 
           {/* Checklist Progress */}
-          {card.checklist && card.checklist.length > 0 && (
+          {checklistTotal > 0 && (
             <div className="flex items-center space-x-2 mt-2">
               <span className="text-xs">✅</span>
               <div className="flex-1">
@@ -474,18 +480,12 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
                     <div
                       className="bg-green-500 h-1.5 rounded-full transition-all"
                       style={{
-                        width: `${
-                          (card.checklist.filter((item) => item.completed)
-                            .length /
-                            card.checklist.length) *
-                          100
-                        }%`,
+                        width: `${(checklistCompleted / checklistTotal) * 100}%`,
                       }}
                     />
                   </div>
                   <span className="text-xs text-gray-600 font-medium">
-                    {card.checklist.filter((item) => item.completed).length}/
-                    {card.checklist.length}
+                    {checklistCompleted}/{checklistTotal}
                   </span>
                 </div>
               </div>
@@ -509,8 +509,8 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
               <button
                 onClick={(e) => {
                   e.stopPropagation();
-                  setIsEditing(true);
                   setShowMenu(false);
+                  startEditing();
                 }}
                 className="w-full text-left px-3 py-1 hover:bg-gray-100 text-xs"
               >
@@ -537,7 +537,7 @@ export const CardItem = memo(({ card, isFocused = false }: CardItemProps) => {
         card={card}
         onEdit={() => {
           setShowViewModal(false);
-          setIsEditing(true);
+          startEditing();
         }}
       />
     </div>
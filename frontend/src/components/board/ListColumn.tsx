@@ -46,7 +46,10 @@ export const ListColumn = ({
   const handleUpdateTitle = async () => {
     if (title.trim() && title !== list.title) {
       try {
-        await updateList(list.id, { title: title.trim() });
+        await updateList(list.id, {
+          title: title.trim(),
+          revision: list.revision,
+        });
         toast.success("List updated");
       } catch (error) {
         toast.error("Failed to update list");
@@ -59,6 +59,7 @@ export const UpdateBoardModal = ({
         title: formData.title,
         description: formData.description || undefined,
         background_color: formData.background_color,
+        revision: board.revision,
       });
 
       toast.success("Board updated successfully!");
@@ -96,10 +96,20 @@ export const ViewCardModal = ({
   card,
   onEdit,
 }: ViewCardModalProps) => {
-  const { updateCard } = useCardStore();
+  const { updateChecklistItem, fetchCard } = useCardStore();
   const [focusedChecklistIndex, setFocusedChecklistIndex] =
     useState<number>(-1);
 
+  // The board only holds a summary; load the description and checklist
+  const isLoaded = !card || card.checklist !== undefined;
+  const checklist = card?.checklist ?? [];
+
+  useEffect(() => {
+    if (isOpen && card && !isLoaded) {
+      fetchCard(card.id).catch(() => toast.error("Failed to load card"));
+    }
+  }, [isOpen, card, isLoaded, fetchCard]);
+
   // Reset focused index when modal opens
   useEffect(() => {
     if (isOpen) {
@@ -112,20 +122,19 @@ export const ViewCardModal = ({
     async (itemId: string) => {
       if (!card) return;
 
-      const updatedChecklist = card.checklist.map((item) =>
-        item.id === itemId ? { ...item, completed: !item.completed } : item
-      );
+      const item = checklist.find((item) => item.id === itemId);
+      if (!item) return;
 
       try {
-        await updateCard(card.id, {
-          checklist: updatedChecklist,
+        await updateChecklistItem(card.id, itemId, {
+          completed: !item.completed,
         });
         // Toast success is optional since it's a quick action
       } catch (error) {
         toast.error("Failed to update checklist");
       }
     },
-    [card, updateCard]
+    [card, checklist, updateChecklistItem]
   );
 
   // Keyboard navigation
@@ -141,13 +150,13 @@ export const ViewCardModal = ({
       }
 
       // Only handle arrow keys and space if there are checklist items
-      if (!card.checklist || card.checklist.length === 0) return;
+      if (checklist.length === 0) return;
 
       // Arrow Down: Navigate to next checklist item
       if (e.key === "ArrowDown") {
         e.preventDefault();
         setFocusedChecklistIndex((prev) => {
-          if (prev < card.checklist.length - 1) {
+          if (prev < checklist.length - 1) {
             return prev + 1;
           }
           return prev;
@@ -168,7 +177,7 @@ export const ViewCardModal = ({
       // Space: Toggle focused checklist item
       if (e.key === " " && focusedChecklistIndex >= 0) {
         e.preventDefault();
-        const item = card.checklist[focusedChecklistIndex];
+        const item = checklist[focusedChecklistIndex];
         if (item) {
           handleChecklistToggle(item.id);
         }
@@ -177,12 +186,19 @@ export const ViewCardModal = ({
 
     window.addEventListener("keydown", handleKeyDown);
     return () => window.removeEventListener("keydown", handleKeyDown);
-  }, [isOpen, card, focusedChecklistIndex, onClose, handleChecklistToggle]);
+  }, [
+    isOpen,
+    card,
+    checklist,
+    focusedChecklistIndex,
+    onClose,
+    handleChecklistToggle,
+  ]);
 
   if (!isOpen || !card) return null;
 
-  const completedCount = card.checklist.filter((item) => item.completed).length;
-  const totalCount = card.checklist.length;
+  const completedCount = checklist.filter((item) => item.completed).length;
+  const totalCount = checklist.length;
   const progress = totalCount > 0 ? (completedCount / totalCount) * 100 : 0;
 
   return (
@@ -257,8 +273,15 @@ export const ViewCardModal = ({
             </div>
           )}
 
+          {/* Details still loading */}
+          {!isLoaded && (
+            <div className="text-center py-8 text-gray-400">
+              <p className="text-sm">Loading...</p>
+            </div>
+          )}
+
           {/* Checklist */}
-          {card.checklist && card.checklist.length > 0 && (
+          {checklist.length > 0 && (
             <div className="mb-6">
               <div className="flex items-center justify-between mb-3">
                 <h3 className="text-sm font-semibold text-gray-700">
@@ -281,7 +304,7 @@ export const ViewCardModal = ({
 
               {/* Checklist Items */}
               <div className="space-y-2">
-                {card.checklist.map((item, index) => (
+                {checklist.map((item, index) => (
                   <label
                     key={item.id}
                     className={`flex items-center space-x-3 p-3 rounded-lg cursor-pointer transition ${
@@ -312,12 +335,11 @@ export const ViewCardModal = ({
           )}
 
           {/* Empty state when no checklist */}
-          {(!card.checklist || card.checklist.length === 0) &&
-            !card.description && (
-              <div className="text-center py-8 text-gray-400">
-                <p className="text-sm">No additional details</p>
-              </div>
-            )}
+          {isLoaded && checklist.length === 0 && !card.description && (
+            <div className="text-center py-8 text-gray-400">
+              <p className="text-sm">No additional details</p>
+            </div>
+          )}
         </div>
 
         {/* Footer */}
@@ -8,6 +8,7 @@ vi.mock("@/store/cardStore", () => ({
   useCardStore: () => ({
     updateCard: vi.fn(),
     deleteCard: vi.fn(),
+    fetchCard: vi.fn(),
   }),
 }));
 
@@ -34,6 +35,7 @@ const mockCard: Card = {
     { id: "1", text: "Task 1", completed: false },
     { id: "2", text: "Task 2", completed: true },
   ],
+  revision: 0,
   created_at: new Date().toISOString(),
   updated_at: new Date().toISOString(),
 };
@@ -72,4 +74,20 @@ describe("CardItem", () => {
     const progressBar = container.querySelector('[style*="width: 50%"]');
     expect(progressBar).toBeInTheDocument(); // 1/2 = 50%
   });
+
+  it("should show checklist progress from a board-view summary", () => {
+    const summary: Card = {
+      id: "2",
+      title: "Summary Card",
+      order: 1,
+      list_id: "list1",
+      labels: [],
+      checklist_total: 4,
+      checklist_completed: 3,
+      revision: 0,
+    };
+    const { container } = render(<CardItem card={summary} />);
+    expect(screen.getByText("3/4")).toBeInTheDocument();
+    expect(container.querySelector('[style*="width: 75%"]')).toBeInTheDocument();
+  });
 });
@@ -3,10 +3,15 @@ import { render, screen, fireEvent } from "@testing-library/react";
 import { ViewCardModal } from "../ViewCardModal";
 import { Card } from "@/types";
 
+const { mockFetchCard } = vi.hoisted(() => ({
+  mockFetchCard: vi.fn(() => Promise.resolve()),
+}));
+
 // Mock stores
 vi.mock("@/store/cardStore", () => ({
   useCardStore: () => ({
-    updateCard: vi.fn(),
+    updateChecklistItem: vi.fn(),
+    fetchCard: mockFetchCard,
   }),
 }));
 
@@ -23,6 +28,7 @@ const mockCard: Card = {
     { id: "2", text: "Task 2", completed: false },
     { id: "3", text: "Task 3", completed: true },
   ],
+  revision: 0,
   created_at: new Date().toISOString(),
   updated_at: new Date().toISOString(),
 };
@@ -122,4 +128,41 @@ describe("ViewCardModal", () => {
     expect(screen.getByText("Complete")).toBeInTheDocument(); // green label
     expect(screen.getByText("Warning")).toBeInTheDocument(); // yellow label
   });
+
+  it("should fetch details when opened with a board-view summary", () => {
+    const summary: Card = {
+      id: "1",
+      title: "Test Card",
+      order: 0,
+      list_id: "list1",
+      labels: ["green", "yellow"],
+      checklist_total: 3,
+      checklist_completed: 2,
+      revision: 0,
+    };
+    render(
+      <ViewCardModal
+        isOpen={true}
+        onClose={mockOnClose}
+        card={summary}
+        onEdit={mockOnEdit}
+      />
+    );
+    expect(mockFetchCard).toHaveBeenCalledWith("1");
+    expect(screen.getByText("Loading...")).toBeInTheDocument();
+    expect(screen.queryByText("No additional details")).not.toBeInTheDocument();
+  });
+
+  it("should not fetch details the card already has", () => {
+    mockFetchCard.mockClear();
+    render(
+      <ViewCardModal
+        isOpen={true}
+        onClose={mockOnClose}
+        card={mockCard}
+        onEdit={mockOnEdit}
+      />
+    );
+    expect(mockFetchCard).not.toHaveBeenCalled();
+  });
 });
@@ -10,6 +10,7 @@ export const API_ENDPOINTS = {
   BOARDS: "/api/boards",
   LISTS: "/api/lists",
   CARDS: "/api/cards",
+  DASHBOARD: "/api/dashboard",
 };
 
 export const LIMITS = {
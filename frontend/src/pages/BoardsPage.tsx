@@ -10,7 +10,8 @@ import { UpdateBoardModal } from "@/components/board/UpdateBoardModal";
 export const BoardsPage = () => {
   const navigate = useNavigate();
   const { user, logout } = useAuthStore();
-  const { boards, isLoading, fetchBoards, deleteBoard } = useBoardStore();
+  const { boards, isLoading, fetchBoards, deleteBoard, duplicateBoard } =
+    useBoardStore();
 
   const [showCreateModal, setShowCreateModal] = useState(false);
   const [showUpdateModal, setShowUpdateModal] = useState(false);
@@ -53,6 +54,22 @@ export const BoardsPage = () => {
     }
   };
 
+  const handleDuplicateClick = async (board: Board) => {
+    try {
+      const newBoard = await duplicateBoard(board.id);
+      if (board.is_template) {
+        toast.success("Board created from template");
+        navigate(`/boards/${newBoard.id}`);
+      } else {
+        toast.success("Board duplicated successfully");
+      }
+    } catch (error: any) {
+      toast.error(
+        error.response?.data?.detail || "Failed to duplicate board"
+      );
+    }
+  };
+
   const handleUpdateClick = (board: Board) => {
     setSelectedBoard(board);
     setShowUpdateModal(true);
@@ -147,6 +164,11 @@ export const BoardsPage = () => {
                   <h3 className="text-white text-xl font-bold drop-shadow-lg">
                     {board.title}
                   </h3>
+                  {board.is_template && (
+                    <span className="ml-auto bg-white bg-opacity-80 text-gray-800 text-xs font-semibold px-2 py-1 rounded">
+                      Template
+                    </span>
+                  )}
                 </div>
 
                 {/* Board Content */}
@@ -174,6 +196,16 @@ export const BoardsPage = () => {
                     >
                       ✏️ Edit
                     </button>
+                    <button
+                      onClick={(e) => {
+                        e.stopPropagation();
+                        handleDuplicateClick(board);
+                      }}
+                      disabled={boards.length >= 7}
+                      className="flex-1 bg-gray-500 hover:bg-gray-600 text-white py-2 rounded-lg transition text-sm font-semibold disabled:opacity-50 disabled:cursor-not-allowed"
+                    >
+                      {board.is_template ? "📋 Use" : "📄 Copy"}
+                    </button>
                     <button
                       onClick={(e) => {
                         e.stopPropagation();
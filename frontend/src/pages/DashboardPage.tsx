@@ -1,10 +1,24 @@
+import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { useAuthStore } from "@/store/authStore";
+import { api } from "@/services/api";
+import { API_ENDPOINTS } from "@/config/constants";
+import { DashboardResponse } from "@/types";
 import toast from "react-hot-toast";
 
 export const DashboardPage = () => {
   const navigate = useNavigate();
   const { user, logout } = useAuthStore();
+  const [dashboard, setDashboard] = useState<DashboardResponse | null>(null);
+  const [isLoading, setIsLoading] = useState(true);
+
+  useEffect(() => {
+    api
+      .get<DashboardResponse>(API_ENDPOINTS.DASHBOARD)
+      .then((response) => setDashboard(response.data))
+      .catch(() => toast.error("Failed to load dashboard"))
+      .finally(() => setIsLoading(false));
+  }, []);
 
   const handleLogout = () => {
     logout();
@@ -70,23 +84,137 @@ export const DashboardPage = () => {
             </div>
           </div>
 
-          <div className="bg-green-50 border border-green-200 rounded-lg p-6">
-            <h2 className="text-xl font-semibold text-green-800 mb-3">
-              ✅ Authentication Working!
-            </h2>
-            <p className="text-gray-700 mb-4">
-              Congratulations! Sprint 1 is complete. Your authentication system
-              is working perfectly.
-            </p>
-            <div className="space-y-2 text-sm text-gray-600">
-              <p>✅ User registration</p>
-              <p>✅ Login with JWT</p>
-              <p>✅ Password hashing</p>
-              <p>✅ Protected routes</p>
-              <p>✅ Token refresh</p>
-              <p>✅ Logout functionality</p>
+          {/* Boards, upcoming and recent cards: one request */}
+          {isLoading ? (
+            <div className="bg-gray-50 rounded-lg p-6 animate-pulse">
+              <div className="h-6 bg-gray-200 rounded w-1/3 mb-4"></div>
+              <div className="h-4 bg-gray-200 rounded w-1/2"></div>
             </div>
-          </div>
+          ) : (
+            dashboard && (
+              <div className="space-y-6">
+                <div>
+                  <h2 className="text-xl font-semibold text-gray-800 mb-3">
+                    Your Boards
+                  </h2>
+                  <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
+                    {dashboard.boards.map((board) => (
+                      <div
+                        key={board.id}
+                        onClick={() => navigate(`/boards/${board.id}`)}
+                        className="rounded-lg border border-gray-200 overflow-hidden cursor-pointer hover:shadow-lg transition"
+                      >
+                        <div
+                          className="h-3"
+                          style={{ backgroundColor: board.background_color }}
+                        />
+                        <div className="p-4">
+                          <h3 className="font-semibold text-gray-800">
+                            {board.title}
+                          </h3>
+                          <p className="text-sm text-gray-600 mt-1">
+                            {board.list_count} lists · {board.card_count} cards
+                          </p>
+                          {board.overdue_count > 0 && (
+                            <p className="text-sm text-red-600 font-semibold mt-1">
+                              {board.overdue_count} overdue
+                            </p>
+                          )}
+                          {board.checklist_total > 0 && (
+                            <p className="text-sm text-gray-500 mt-1">
+                              ✅ {board.checklist_completed}/
+                              {board.checklist_total} checklist items done
+                            </p>
+                          )}
+                        </div>
+                      </div>
+                    ))}
+                  </div>
+                </div>
+
+                <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+                  <div className="bg-yellow-50 border border-yellow-200 rounded-lg p-6">
+                    <h2 className="text-xl font-semibold text-yellow-800 mb-3">
+                      📅 Upcoming
+                    </h2>
+                    {dashboard.upcoming.length === 0 ? (
+                      <p className="text-gray-600 text-sm">
+                        Nothing due in the next days.
+                      </p>
+                    ) : (
+                      <ul className="space-y-2 text-sm">
+                        {dashboard.upcoming.map((card) => (
+                          <li
+                            key={card.id}
+                            onClick={() => navigate(`/boards/${card.board_id}`)}
+                            className="cursor-pointer hover:underline"
+                          >
+                            <span className="font-semibold">{card.title}</span>{" "}
+                            <span className="text-gray-500">
+                              · {card.board_title} / {card.list_title} ·{" "}
+                              {card.due_date &&
+                                new Date(card.due_date).toLocaleDateString()}
+                            </span>
+                          </li>
+                        ))}
+                      </ul>
+                    )}
+                  </div>
+
+                  <div className="bg-green-50 border border-green-200 rounded-lg p-6">
+                    <h2 className="text-xl font-semibold text-green-800 mb-3">
+                      🕒 Recently Updated
+                    </h2>
+                    {dashboard.recently_updated.length === 0 ? (
+                      <p className="text-gray-600 text-sm">No cards yet.</p>
+                    ) : (
+                      <ul className="space-y-2 text-sm">
+                        {dashboard.recently_updated.map((card) => (
+                          <li
+                            key={card.id}
+                            onClick={() => navigate(`/boards/${card.board_id}`)}
+                            className="cursor-pointer hover:underline"
+                          >
+                            <span className="font-semibold">{card.title}</span>{" "}
+                            <span className="text-gray-500">
+                              · {card.board_title} / {card.list_title}
+                            </span>
+                          </li>
+                        ))}
+                      </ul>
+                    )}
+                  </div>
+
+                  <div className="bg-purple-50 border border-purple-200 rounded-lg p-6">
+                    <h2 className="text-xl font-semibold text-purple-800 mb-3">
+                      📝 Recent Activity
+                    </h2>
+                    {dashboard.recent_activity.length === 0 ? (
+                      <p className="text-gray-600 text-sm">No activity yet.</p>
+                    ) : (
+                      <ul className="space-y-2 text-sm">
+                        {dashboard.recent_activity.map((event) => (
+                          <li
+                            key={event.id}
+                            onClick={() => navigate(`/boards/${event.board_id}`)}
+                            className="cursor-pointer hover:underline"
+                          >
+                            <span className="font-semibold">{event.action}</span>{" "}
+                            <span className="text-gray-500">
+                              ·{" "}
+                              {dashboard.boards.find((board) => board.id === event.board_id)
+                                ?.title}{" "}
+                              · {new Date(event.created_at).toLocaleString()}
+                            </span>
+                          </li>
+                        ))}
+                      </ul>
+                    )}
+                  </div>
+                </div>
+              </div>
+            )
+          )}
 
           <div className="mt-6 text-center space-y-4">
             <p className="text-gray-600">
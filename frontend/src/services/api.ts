@@ -19,6 +19,30 @@ api.interceptors.request.use(
   (error) => Promise.reject(error)
 );
 
+// Refresh tokens are single-use: concurrent 401s must share one refresh,
+// otherwise the second request replays a rotated token and ends the session
+let refreshPromise: Promise<string> | null = null;
+
+const refreshAccessToken = (refreshToken: string): Promise<string> => {
+  if (!refreshPromise) {
+    refreshPromise = axios
+      .post(`${API_BASE_URL}/api/auth/refresh`, {
+        refresh_token: refreshToken,
+      })
+      .then((response) => {
+        const { access_token, refresh_token: new_refresh_token } =
+          response.data;
+        localStorage.setItem(STORAGE_KEYS.ACCESS_TOKEN, access_token);
+        localStorage.setItem(STORAGE_KEYS.REFRESH_TOKEN, new_refresh_token);
+        return access_token as string;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
 api.interceptors.response.use(
   (response) => response,
   async (error) => {
@@ -32,13 +56,7 @@ api.interceptors.response.use(
           window.location.href = "/login";
           return Promise.reject(error);
         }
-        const response = await axios.post(`${API_BASE_URL}/api/auth/refresh`, {
-          refresh_token: refreshToken,
-        });
-        const { access_token, refresh_token: new_refresh_token } =
-          response.data;
-        localStorage.setItem(STORAGE_KEYS.ACCESS_TOKEN, access_token);
-        localStorage.setItem(STORAGE_KEYS.REFRESH_TOKEN, new_refresh_token);
+        const access_token = await refreshAccessToken(refreshToken);
         originalRequest.headers.Authorization = `Bearer ${access_token}`;
         return api(originalRequest);
       } catch (refreshError) {
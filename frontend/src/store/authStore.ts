@@ -1,7 +1,8 @@
+import axios from "axios";
 import { create } from "zustand";
 import { persist } from "zustand/middleware";
 import { api } from "@/services/api";
-import { API_ENDPOINTS, STORAGE_KEYS } from "@/config/constants";
+import { API_BASE_URL, API_ENDPOINTS, STORAGE_KEYS } from "@/config/constants";
 import { AuthState, LoginCredentials, RegisterData } from "@/types";
 
 export const useAuthStore = create<AuthState>()(
@@ -58,6 +59,15 @@ export const useAuthStore = create<AuthState>()(
       },
 
       logout: () => {
+        const { accessToken } = get();
+        if (accessToken) {
+          // Revoke the session server-side without waiting for it
+          axios
+            .post(`${API_BASE_URL}${API_ENDPOINTS.LOGOUT}`, null, {
+              headers: { Authorization: `Bearer ${accessToken}` },
+            })
+            .catch(() => undefined);
+        }
         localStorage.removeItem(STORAGE_KEYS.ACCESS_TOKEN);
         localStorage.removeItem(STORAGE_KEYS.REFRESH_TOKEN);
         set({
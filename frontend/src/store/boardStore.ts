@@ -6,6 +6,7 @@ import {
   Board,
   BoardCreate,
   BoardUpdate,
+  BoardDuplicate,
   BoardListResponse,
 } from "@/types";
 
@@ -77,6 +78,30 @@ export const useBoardStore = create<BoardState>((set, get) => ({
     }
   },
 
+  duplicateBoard: async (id: string, data: BoardDuplicate = {}) => {
+    set({ isLoading: true, error: null });
+    try {
+      const response = await api.post<Board>(
+        `${API_ENDPOINTS.BOARDS}/${id}/duplicate`,
+        data
+      );
+      const newBoard = response.data;
+
+      // Add the copy to state
+      set((state) => ({
+        boards: [...state.boards, newBoard],
+        isLoading: false,
+      }));
+
+      return newBoard;
+    } catch (error: any) {
+      const errorMessage =
+        error.response?.data?.detail || "Failed to duplicate board";
+      set({ error: errorMessage, isLoading: false });
+      throw error;
+    }
+  },
+
   deleteBoard: async (id: string) => {
     set({ isLoading: true, error: null });
     try {
@@ -1,9 +1,34 @@
 import { create } from "zustand";
 import { api } from "@/services/api";
 import { API_ENDPOINTS } from "@/config/constants";
-import { CardState, Card, CardCreate, CardUpdate, CardMove } from "@/types";
+import {
+  CardState,
+  Card,
+  CardCreate,
+  CardUpdate,
+  CardMove,
+  ChecklistItem,
+  ChecklistItemUpdate,
+} from "@/types";
 import { useListStore } from "./listStore";
 
+// Apply an updated checklist item to a full card or a board-view summary
+const withChecklistItem = (card: Card, updatedItem: ChecklistItem): Card => {
+  if (!card.checklist) {
+    return { ...card, revision: card.revision + 1 };
+  }
+  const checklist = card.checklist.map((item) =>
+    item.id === updatedItem.id ? updatedItem : item
+  );
+  return {
+    ...card,
+    revision: card.revision + 1,
+    checklist,
+    checklist_total: checklist.length,
+    checklist_completed: checklist.filter((item) => item.completed).length,
+  };
+};
+
 export const useCardStore = create<CardState>((set) => ({
   isLoading: false,
   error: null,
@@ -87,6 +112,30 @@ export const useCardStore = create<CardState>((set) => ({
     }
   },
 
+  fetchCard: async (cardId: string) => {
+    try {
+      const response = await api.get<Card>(`${API_ENDPOINTS.CARDS}/${cardId}`);
+      const fullCard = response.data;
+
+      // Replace the board-view summary with the full card
+      useListStore.setState((state) => ({
+        lists: state.lists.map((list) => ({
+          ...list,
+          cards: list.cards.map((card) =>
+            card.id === cardId ? fullCard : card
+          ),
+        })),
+      }));
+
+      return fullCard;
+    } catch (error: any) {
+      const errorMessage =
+        error.response?.data?.detail || "Failed to fetch card";
+      set({ error: errorMessage });
+      throw error;
+    }
+  },
+
   moveCard: async (cardId: string, data: CardMove) => {
     try {
       const response = await api.post<Card>(
@@ -124,6 +173,38 @@ export const useCardStore = create<CardState>((set) => ({
     }
   },
 
+  updateChecklistItem: async (
+    cardId: string,
+    itemId: string,
+    data: ChecklistItemUpdate
+  ) => {
+    try {
+      // Only the changed item is sent; the server updates it in place
+      const response = await api.patch<ChecklistItem>(
+        `${API_ENDPOINTS.CARDS}/${cardId}/checklist/${itemId}`,
+        data
+      );
+      const updatedItem = response.data;
+
+      // Update list store
+      useListStore.setState((state) => ({
+        lists: state.lists.map((list) => ({
+          ...list,
+          cards: list.cards.map((card) =>
+            card.id === cardId ? withChecklistItem(card, updatedItem) : card
+          ),
+        })),
+      }));
+
+      return updatedItem;
+    } catch (error: any) {
+      const errorMessage =
+        error.response?.data?.detail || "Failed to update checklist";
+      set({ error: errorMessage });
+      throw error;
+    }
+  },
+
   reorderCards: async (listId: string, cardOrders: Record<string, number>) => {
     try {
       await api.post(`${API_ENDPOINTS.CARDS}/${listId}/reorder`, {
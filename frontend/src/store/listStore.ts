@@ -11,8 +11,10 @@ export const useListStore = create<ListState>((set, get) => ({
   fetchLists: async (boardId: string) => {
     set({ isLoading: true, error: null });
     try {
+      // Card summaries only; details are fetched when a card is opened
       const response = await api.get<List[]>(
-        `${API_ENDPOINTS.LISTS}/${boardId}`
+        `${API_ENDPOINTS.LISTS}/${boardId}`,
+        { params: { view: "summary" } }
       );
       set({ lists: response.data, isLoading: false });
     } catch (error: any) {
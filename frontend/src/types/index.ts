@@ -49,6 +49,8 @@ export interface Board {
   description?: string;
   background_color: string;
   owner_id: string;
+  is_template: boolean;
+  revision: number;
   created_at: string;
   updated_at: string;
 }
@@ -63,6 +65,14 @@ export interface BoardUpdate {
   title?: string;
   description?: string;
   background_color?: string;
+  is_template?: boolean;
+  revision?: number;
+}
+
+export interface BoardDuplicate {
+  title?: string;
+  include_cards?: boolean;
+  as_template?: boolean;
 }
 
 export interface BoardListResponse {
@@ -70,6 +80,46 @@ export interface BoardListResponse {
   total: number;
 }
 
+// Dashboard types
+export interface DashboardBoard extends Board {
+  list_count: number;
+  card_count: number;
+  overdue_count: number;
+  due_today_count: number;
+  checklist_total: number;
+  checklist_completed: number;
+}
+
+export interface DashboardCard {
+  id: string;
+  title: string;
+  labels: string[];
+  due_date?: string;
+  updated_at: string;
+  list_id: string;
+  list_title: string;
+  board_id: string;
+  board_title: string;
+}
+
+export interface ActivityEvent {
+  id: string;
+  board_id: string;
+  actor_id: string;
+  action: string;
+  entity_id: string;
+  details: Record<string, unknown>;
+  created_at: string;
+}
+
+export interface DashboardResponse {
+  boards: DashboardBoard[];
+  upcoming: DashboardCard[];
+  recently_updated: DashboardCard[];
+  recent_activity: ActivityEvent[];
+  generated_at: string;
+}
+
 export interface BoardState {
   boards: Board[];
   currentBoard: Board | null;
@@ -78,6 +128,7 @@ export interface BoardState {
   fetchBoards: () => Promise<void>;
   createBoard: (data: BoardCreate) => Promise<Board>;
   updateBoard: (id: string, data: BoardUpdate) => Promise<Board>;
+  duplicateBoard: (id: string, data?: BoardDuplicate) => Promise<Board>;
   deleteBoard: (id: string) => Promise<void>;
   setCurrentBoard: (board: Board | null) => void;
   clearError: () => void;
@@ -90,17 +141,22 @@ export interface ChecklistItem {
   completed: boolean;
 }
 
+// The board view only carries a summary of each card (no description or
+// checklist items, just the checklist counts); fetchCard loads the rest
 export interface Card {
   id: string;
   title: string;
   description?: string;
   labels: string[];
   due_date?: string;
-  checklist: ChecklistItem[];
+  checklist?: ChecklistItem[];
+  checklist_total?: number;
+  checklist_completed?: number;
   order: number;
   list_id: string;
-  created_at: string;
-  updated_at: string;
+  revision: number;
+  created_at?: string;
+  updated_at?: string;
 }
 
 export interface List {
@@ -108,6 +164,7 @@ export interface List {
   title: string;
   order: number;
   board_id: string;
+  revision: number;
   created_at: string;
   updated_at: string;
   cards: Card[];
@@ -121,6 +178,7 @@ export interface ListCreate {
 export interface ListUpdate {
   title?: string;
   order?: number;
+  revision?: number;
 }
 
 export interface ListState {
@@ -155,6 +213,12 @@ export interface CardUpdate {
   due_date?: string;
   checklist?: ChecklistItem[];
   order?: number;
+  revision?: number;
+}
+
+export interface ChecklistItemUpdate {
+  text?: string;
+  completed?: boolean;
 }
 
 export interface CardMove {
@@ -168,7 +232,13 @@ export interface CardState {
   createCard: (listId: string, data: CardCreate) => Promise<Card>;
   updateCard: (cardId: string, data: CardUpdate) => Promise<Card>;
   deleteCard: (cardId: string) => Promise<void>;
+  fetchCard: (cardId: string) => Promise<Card>;
   moveCard: (cardId: string, data: CardMove) => Promise<Card>;
+  updateChecklistItem: (
+    cardId: string,
+    itemId: string,
+    data: ChecklistItemUpdate
+  ) => Promise<ChecklistItem>;
   reorderCards: (
     listId: string,
     cardOrders: Record<string, number>